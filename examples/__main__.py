@@ -2,36 +2,65 @@
 """
 Entry point for running physics engine examples.
 This script allows you to run examples by specifying their names.
+Pass --headless N to step an example N times without rendering and print
+its step timings instead. A few untimed warm-up steps run first.
 """
 
+import argparse
 import importlib
 import sys
 
+from examples.benchmark import print_step_stats, run_headless
+
+EXAMPLES = [
+    "bullet",
+    "car",
+    "friction_test",
+    "joints_demo",
+    "ragdoll",
+    "simple_falling",
+    "stacking",
+    "stress_test",
+]
+
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python -m examples <example_name>")
+        print("Usage: python -m examples <example_name> [--headless N]")
         print("Available examples:")
-        print("  - bullet")
-        print("  - car")
-        print("  - friction_test")
-        print("  - joints_demo")
-        print("  - ragdoll")
-        print("  - simple_falling")
-        print("  - stacking")
-        print("  - stress_test")
+        for name in EXAMPLES:
+            print(f"  - {name}")
         sys.exit(1)
 
-    example_name = sys.argv[1]
+    parser = argparse.ArgumentParser(prog="python -m examples")
+    parser.add_argument("example_name")
+    parser.add_argument(
+        "--headless",
+        type=int,
+        metavar="N",
+        help="step the world N times without rendering and print step timings",
+    )
+    args = parser.parse_args()
+
+    example_name = args.example_name
     try:
         module = importlib.import_module(f"examples.{example_name}")
-        module.main()
     except ModuleNotFoundError:
         print(f"Example '{example_name}' not found.")
         sys.exit(1)
-    except AttributeError:
+
+    if args.headless is not None:
+        if not hasattr(module, "build_scene"):
+            print(f"Example '{example_name}' does not have a 'build_scene' function.")
+            sys.exit(1)
+        timings = run_headless(module.build_scene(), args.headless)
+        print_step_stats(example_name, timings)
+        return
+
+    if not hasattr(module, "main"):
         print(f"Example '{example_name}' does not have a 'main' function.")
         sys.exit(1)
+    module.main()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,14 @@
+"""
+Make the project root importable when an example is run as a script.
+
+Every example imports this module first. Python caches it in sys.modules, so
+the project root is added to the path once per process.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
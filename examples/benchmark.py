@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark driver for the physics engine examples.
+
+Steps an example's world with a fixed time step and no rendering, so that
+World.step dominates the run time in profiles. A few warm-up steps run first
+and are not timed, since they include Numba compilation and cache loading.
+"""
+
+import statistics
+import time
+
+TIME_STEP = 1.0 / 60.0
+WARMUP_STEPS = 3
+
+
+def run_headless(world, steps, time_step=TIME_STEP, warmup=WARMUP_STEPS):
+    """
+    Step a world a fixed number of times without rendering.
+
+    Args:
+        world (World): The world to step.
+        steps (int): The number of timed steps to take.
+        time_step (float): The time step for each step.
+        warmup (int): The number of untimed steps to take first.
+
+    Returns:
+        list: The wall-clock duration of each timed step, in seconds.
+    """
+    for _ in range(warmup):
+        world.step(time_step)
+
+    timings = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        world.step(time_step)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def print_step_stats(name, timings):
+    """
+    Print the minimum, median and maximum step time in microseconds.
+
+    Args:
+        name (str): The name of the example.
+        timings (list): The step durations, in seconds.
+    """
+    if not timings:
+        print(f"{name}: no steps taken")
+        return
+    print(
+        f"{name}: {len(timings)} steps, "
+        f"min {min(timings) * 1e6:.1f} us, "
+        f"median {statistics.median(timings) * 1e6:.1f} us, "
+        f"max {max(timings) * 1e6:.1f} us"
+    )
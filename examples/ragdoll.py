@@ -4,28 +4,27 @@ Example demonstrating a ragdoll-like structure using joints.
 """
 
 import sys
-from pathlib import Path
 
-# Add the project root to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
+try:
+    from . import _bootstrap  # noqa: F401
+except ImportError:
+    import _bootstrap  # noqa: F401  # Run as a script
 
-import pygame
 from src.core.body import Body
 from src.core.circle import Circle
 from src.core.polygon import Polygon
 from src.constraints.revolute import RevoluteJoint
-from src.debug.pygame_draw import PygameDraw
 from src.dynamics.world import World
 from src.math.vec2 import Vec2
 
-def main():
-    # Initialize Pygame
-    pygame.init()
-    screen_width, screen_height = 800, 600
-    screen = pygame.display.set_mode((screen_width, screen_height))
-    pygame.display.set_caption("Ragdoll Demo")
-    clock = pygame.time.Clock()
 
+def build_scene():
+    """
+    Build the example scene.
+
+    Returns:
+        World: The world containing the scene.
+    """
     # Create a world
     world = World(Vec2(0.0, 10.0))  # Gravity: (0, 10)
 
@@ -117,6 +116,25 @@ def main():
     right_leg_joint = RevoluteJoint(torso, right_leg, Vec2(2, 15))
     world.add_joint(right_leg_joint)
 
+    return world
+
+
+def main():
+    # Pygame is only needed for the interactive demo, not for headless runs
+    import pygame
+
+    from src.debug.pygame_draw import PygameDraw
+
+    # Initialize Pygame
+    pygame.init()
+    screen_width, screen_height = 800, 600
+    screen = pygame.display.set_mode((screen_width, screen_height))
+    pygame.display.set_caption("Ragdoll Demo")
+    clock = pygame.time.Clock()
+
+    # Create the scene
+    world = build_scene()
+
     # Create a debugger to draw the simulation
     debugger = PygameDraw(screen_width, screen_height)
 
@@ -130,19 +148,19 @@ def main():
         # Clear the screen
         screen.fill((0, 0, 0))
 
-        # Step the simulation
-        world.step(1.0 / 60.0)
+        # Step the simulation in fixed steps for the real time that passed
+        world.advance(clock.tick(60) / 1000.0)
 
         # Draw the simulation
         debugger.draw_world(world)
 
         # Update the display
         pygame.display.flip()
-        clock.tick(60)
 
     # Quit Pygame
     pygame.quit()
     sys.exit()
 
+
 if __name__ == "__main__":
     main()
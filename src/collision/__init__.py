@@ -5,14 +5,19 @@ This module provides functionality for detecting and resolving collisions
 between physical bodies in the simulation.
 """
 
-from .broadphase import Broadphase
+from .broadphase import Broadphase, SweepAndPrune
 from .contact import Contact
+from .dynamic_tree import DynamicTree
 from .manifold import Manifold
 from .narrowphase import Narrowphase
 from .sat import SAT
+from .spatial_hash import SpatialHashBroadphase
 
 __all__ = [
     "Broadphase",
+    "DynamicTree",
+    "SweepAndPrune",
+    "SpatialHashBroadphase",
     "Narrowphase",
     "Manifold",
     "SAT",
@@ -1,23 +1,68 @@
-import sys
-
-sys.path.append("/media/cipherjon/HDD/Repo/physics-engine/src")
+import numpy as np
 
+from src.collision.dynamic_tree import DynamicTree
+from src.common.jit import HAS_NUMBA, njit
 from src.core.aabb import AABB
 from src.math.vec2 import Vec2
 
 
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _sweep_and_prune(lo_x, lo_y, hi_x, hi_y, pair_a, pair_b):
+    """
+    Sort AABBs by their left edge and sweep for overlapping pairs.
+
+    Compiled with Numba when it is available.
+
+    Args:
+        lo_x (np.ndarray): The lower x-bounds of the AABBs.
+        lo_y (np.ndarray): The lower y-bounds of the AABBs.
+        hi_x (np.ndarray): The upper x-bounds of the AABBs.
+        hi_y (np.ndarray): The upper y-bounds of the AABBs.
+        pair_a (np.ndarray): Receives the lower row of each overlapping pair.
+        pair_b (np.ndarray): Receives the higher row of each overlapping pair.
+
+    Returns:
+        int: The number of overlapping pairs. Only as many as fit are written,
+            so a count above the capacity means the sweep must be rerun with
+            larger arrays.
+    """
+    n = len(lo_x)
+    capacity = len(pair_a)
+    order = np.argsort(lo_x)
+    count = 0
+
+    for ii in range(n):
+        i = order[ii]
+        for jj in range(ii + 1, n):
+            j = order[jj]
+            if hi_x[i] < lo_x[j]:
+                break  # No more overlaps for AABB i
+            if hi_x[j] >= lo_x[i] and lo_y[j] <= hi_y[i] and hi_y[j] >= lo_y[i]:
+                if count < capacity:
+                    pair_a[count] = min(i, j)
+                    pair_b[count] = max(i, j)
+                count += 1
+    return count
+
+
 class Broadphase:
     """
     A broad-phase collision detection system to efficiently narrow down potential colliding pairs.
-    This implementation uses a simple sweep and prune algorithm.
+    This implementation uses a dynamic AABB tree with fat AABBs, so only proxies
+    that leave their fat AABB are reinserted and re-queried each update.
     """
 
     def __init__(self):
         """
         Initialize the broad-phase collision detector.
         """
-        self.aabbs = []  # List of AABBs for all bodies
+        self.tree = DynamicTree()
+        self.proxies = {}  # Map of body id to proxy id in the tree
+        self._keys = {}  # Map of proxy id back to body id
         self.pairs = set()  # Set of potential colliding pairs
+        self._neighbours = {}  # Map of body id to the ids it is paired with
+        self._moved = set()  # Body ids whose proxies need to be re-queried
+        self._dynamic = {}  # Map of body id to proxy id for non-static bodies
 
     def add_aabb(self, aabb):
         """
@@ -26,7 +71,16 @@ class Broadphase:
         Args:
             aabb (AABB): The AABB to add.
         """
-        self.aabbs.append(aabb)
+        key = self._get_key(aabb)
+        if key in self.proxies:
+            return
+        proxy_id = self.tree.create_proxy(aabb, aabb.body)
+        self.proxies[key] = proxy_id
+        self._keys[proxy_id] = key
+        self._neighbours[key] = set()
+        self._moved.add(key)
+        if aabb.body is not None and not aabb.body.is_static:
+            self._dynamic[key] = proxy_id
 
     def remove_aabb(self, aabb):
         """
@@ -35,61 +89,345 @@ class Broadphase:
         Args:
             aabb (AABB): The AABB to remove.
         """
-        if aabb in self.aabbs:
-            self.aabbs.remove(aabb)
+        key = self._get_key(aabb)
+        proxy_id = self.proxies.pop(key, None)
+        if proxy_id is None:
+            return
+        self.tree.destroy_proxy(proxy_id)
+        del self._keys[proxy_id]
+        self._remove_pairs(key)
+        del self._neighbours[key]
+        self._moved.discard(key)
+        self._dynamic.pop(key, None)
 
     def update(self):
         """
         Update the broad-phase detector to find potential colliding pairs.
         """
+        moved = self._moved
+        tree = self.tree
+
+        # Refit proxies whose bodies left their fat AABB; static proxies never move
+        for key, proxy_id in self._dynamic.items():
+            body = tree.get_user_data(proxy_id)
+            if tree.move_proxy(proxy_id, body.get_aabb()):
+                moved.add(key)
+
+        # Pairs between two proxies that did not move are still valid
+        for key in moved:
+            self._remove_pairs(key)
+
+        for key in moved:
+            fat_aabb = tree.get_fat_aabb(self.proxies[key])
+            tree.query(fat_aabb, lambda proxy_id: self._add_pair(key, proxy_id))
+
+        moved.clear()
+
+    def _add_pair(self, key, proxy_id):
+        """
+        Record a potential colliding pair found by a tree query.
+
+        Args:
+            key (int): The id of the body that issued the query.
+            proxy_id (int): The proxy id found by the query.
+
+        Returns:
+            bool: True to continue the query.
+        """
+        other = self._keys[proxy_id]
+        if other == key:
+            return True
+        # Add the pair in a sorted order to avoid duplicates
+        pair = (key, other) if key < other else (other, key)
+        self.pairs.add(pair)
+        self._neighbours[key].add(other)
+        self._neighbours[other].add(key)
+        return True
+
+    def _remove_pairs(self, key):
+        """
+        Remove every pair that involves the given body id.
+
+        Args:
+            key (int): The id of the body.
+        """
+        neighbours = self._neighbours[key]
+        for other in neighbours:
+            self._neighbours[other].discard(key)
+            self.pairs.discard((key, other) if key < other else (other, key))
+        neighbours.clear()
+
+    @staticmethod
+    def _get_key(aabb):
+        """
+        Get the key used to identify an AABB's proxy.
+
+        Uses the id of the Body object instead of the AABB object, since the
+        world passes a freshly computed AABB when removing a body.
+
+        Args:
+            aabb (AABB): The AABB.
+
+        Returns:
+            int: The key for the AABB's proxy.
+        """
+        return id(aabb.body) if aabb.body is not None else id(aabb)
+
+    def get_potential_pairs(self):
+        """
+        Get the potential colliding pairs.
+
+        Pairs of two static bodies may be included; the narrow phase skips
+        them.
+
+        Returns:
+            set: A set of tuples representing potential colliding pairs.
+        """
+        return self.pairs
+
+    def clear(self):
+        """
+        Clear all AABBs and pairs from the broad-phase detector.
+        """
+        self.tree.clear()
+        self.proxies.clear()
+        self._keys.clear()
         self.pairs.clear()
-        n = len(self.aabbs)
+        self._neighbours.clear()
+        self._moved.clear()
+        self._dynamic.clear()
+
+
+class SweepAndPrune:
+    """
+    A sweep and prune broad-phase that stores AABBs as NumPy structure-of-arrays.
+
+    Bounds live in contiguous ``(capacity, 2)`` float64 arrays, so the overlap
+    tests against every candidate in the sorted sweep window run as a handful
+    of vectorized comparisons instead of a Python loop over pairs. When Numba
+    is installed the whole sort and sweep runs as a compiled kernel instead.
+    Overlaps are written to a compact list of key pairs, kept in arrays that
+    only grow, so memory and work scale with the number of pairs rather than
+    the square of the number of bodies; the set of key pairs is only built
+    when it is asked for. It exposes the same interface as Broadphase and
+    suits dense scenes where most bodies move every frame.
+    """
+
+    def __init__(self, capacity=64):
+        """
+        Initialize the sweep and prune broad-phase detector.
+
+        Args:
+            capacity (int): The initial number of AABBs that can be stored.
+        """
+        self.lower = np.empty((capacity, 2), dtype=np.float64)
+        self.upper = np.empty((capacity, 2), dtype=np.float64)
+        self.keys = np.empty(capacity, dtype=np.int64)
+        self.pair_a = np.empty(capacity, dtype=np.int64)  # Rows, then keys
+        self.pair_b = np.empty(capacity, dtype=np.int64)
+        self.pair_count = 0
+        self.size = 0
+        self.bodies = []  # Body associated with each row, used to refresh bounds
+        self._index = {}  # Map of body id to its row
+        self.pairs = set()  # Set of potential colliding pairs, built on demand
+        self._pairs_stale = False  # Whether pairs lags behind the pair arrays
+
+    def add_aabb(self, aabb):
+        """
+        Add an AABB to the broad-phase detector.
+
+        Args:
+            aabb (AABB): The AABB to add.
+        """
+        key = Broadphase._get_key(aabb)
+        if key in self._index:
+            return
+        if self.size == len(self.keys):
+            self._grow()
+
+        i = self.size
+        self._write_bounds(i, aabb)
+        self.keys[i] = key
+        self.bodies.append(aabb.body)
+        self._index[key] = i
+        self.size += 1
+
+    def remove_aabb(self, aabb):
+        """
+        Remove an AABB from the broad-phase detector.
+
+        Args:
+            aabb (AABB): The AABB to remove.
+        """
+        key = Broadphase._get_key(aabb)
+        i = self._index.pop(key, None)
+        if i is None:
+            return
+
+        # Move the last row into the freed one to keep the arrays dense
+        last = self.size - 1
+        if i != last:
+            self.lower[i] = self.lower[last]
+            self.upper[i] = self.upper[last]
+            self.keys[i] = self.keys[last]
+            self.bodies[i] = self.bodies[last]
+            self._index[int(self.keys[i])] = i
+        self.bodies.pop()
+
+        # Pairs are stored by key, so only the removed body's pairs go
+        count = self.pair_count
+        pair_a = self.pair_a[:count]
+        pair_b = self.pair_b[:count]
+        keep = (pair_a != key) & (pair_b != key)
+        self.pair_count = int(keep.sum())
+        self.pair_a[: self.pair_count] = pair_a[keep]
+        self.pair_b[: self.pair_count] = pair_b[keep]
+        self.size = last
+        self._pairs_stale = True
+
+    def update(self):
+        """
+        Update the broad-phase detector to find potential colliding pairs.
+        """
+        n = self.size
+        self.pair_count = 0
+        self._pairs_stale = True
+        if n < 2:
+            return
+
+        # Static bounds were written on insertion and never change
+        for i, body in enumerate(self.bodies):
+            if body is not None and not body.is_static:
+                self._write_bounds(i, body.get_aabb())
+
+        if HAS_NUMBA:
+            bounds = (
+                self.lower[:n, 0],
+                self.lower[:n, 1],
+                self.upper[:n, 0],
+                self.upper[:n, 1],
+            )
+            count = _sweep_and_prune(*bounds, self.pair_a, self.pair_b)
+            if count > len(self.pair_a):
+                self._grow_pairs(count)
+                _sweep_and_prune(*bounds, self.pair_a, self.pair_b)
+            self._store_pairs(count)
+            return
 
         # Sort AABBs by their left edge
-        sorted_aabbs = sorted(self.aabbs, key=lambda aabb: aabb.lower_bound.x)
+        order = np.argsort(self.lower[:n, 0], kind="stable")
+        lo_x = self.lower[order, 0]
+        lo_y = self.lower[order, 1]
+        hi_x = self.upper[order, 0]
+        hi_y = self.upper[order, 1]
+
+        # The sweep window of each AABB ends at the first AABB starting past it
+        ends = np.searchsorted(lo_x, hi_x, side="right")
 
-        for i in range(n):
-            aabb_i = sorted_aabbs[i]
-            for j in range(i + 1, n):
-                aabb_j = sorted_aabbs[j]
-                if aabb_i.upper_bound.x < aabb_j.lower_bound.x:
-                    break  # No more overlaps for aabb_i
-                if self._aabb_overlap(aabb_i, aabb_j):
-                    # Add the pair in a sorted order to avoid duplicates
-                    # Use the id of the Body objects instead of the AABB objects
-                    pair = tuple(sorted((id(aabb_i.body), id(aabb_j.body))))
-                    self.pairs.add(pair)
+        rows_a = []
+        rows_b = []
+        for i in range(n - 1):
+            end = ends[i]
+            if end <= i + 1:
+                continue  # No more overlaps for AABB i
+            mask = (
+                (hi_x[i + 1 : end] >= lo_x[i])
+                & (lo_y[i + 1 : end] <= hi_y[i])
+                & (hi_y[i + 1 : end] >= lo_y[i])
+            )
+            others = order[i + 1 : end][mask]
+            rows_a.append(np.minimum(order[i], others))
+            rows_b.append(np.maximum(order[i], others))
+        if not rows_a:
+            return
+        rows_a = np.concatenate(rows_a)
+        count = len(rows_a)
+        if count > len(self.pair_a):
+            self._grow_pairs(count)
+        self.pair_a[:count] = rows_a
+        self.pair_b[:count] = np.concatenate(rows_b)
+        self._store_pairs(count)
 
-    def _aabb_overlap(self, aabb1, aabb2):
+    def _store_pairs(self, count):
         """
-        Check if two AABBs overlap.
+        Turn the first count row pairs into key pairs.
+
+        Keys do not change when rows are moved by remove_aabb, so the pairs
+        stay valid until the next update.
 
         Args:
-            aabb1 (AABB): The first AABB.
-            aabb2 (AABB): The second AABB.
+            count (int): The number of row pairs written by the sweep.
+        """
+        self.pair_a[:count] = self.keys[self.pair_a[:count]]
+        self.pair_b[:count] = self.keys[self.pair_b[:count]]
+        self.pair_count = count
 
-        Returns:
-            bool: True if the AABBs overlap, False otherwise.
+    def _grow_pairs(self, count):
         """
-        return (
-            aabb1.lower_bound.x <= aabb2.upper_bound.x
-            and aabb1.upper_bound.x >= aabb2.lower_bound.x
-            and aabb1.lower_bound.y <= aabb2.upper_bound.y
-            and aabb1.upper_bound.y >= aabb2.lower_bound.y
-        )
+        Grow the pair arrays to hold at least count pairs.
+
+        Args:
+            count (int): The number of pairs to hold.
+        """
+        capacity = max(count, 2 * len(self.pair_a))
+        self.pair_a = np.empty(capacity, dtype=np.int64)
+        self.pair_b = np.empty(capacity, dtype=np.int64)
 
     def get_potential_pairs(self):
         """
         Get the potential colliding pairs.
 
+        Pairs of two static bodies may be included; the narrow phase skips
+        them.
+
         Returns:
             set: A set of tuples representing potential colliding pairs.
         """
+        if self._pairs_stale:
+            key_a = self.pair_a[: self.pair_count]
+            key_b = self.pair_b[: self.pair_count]
+            self.pairs = set(
+                zip(
+                    np.minimum(key_a, key_b).tolist(),
+                    np.maximum(key_a, key_b).tolist(),
+                )
+            )
+            self._pairs_stale = False
         return self.pairs
 
     def clear(self):
         """
         Clear all AABBs and pairs from the broad-phase detector.
         """
-        self.aabbs.clear()
+        self.pair_count = 0
+        self.size = 0
+        self.bodies.clear()
+        self._index.clear()
         self.pairs.clear()
+        self._pairs_stale = False
+
+    def _write_bounds(self, i, aabb):
+        """
+        Write an AABB's bounds into the given row of the bound arrays.
+
+        Args:
+            i (int): The row to write.
+            aabb (AABB): The AABB to store.
+        """
+        self.lower[i, 0] = aabb.lower_bound.x
+        self.lower[i, 1] = aabb.lower_bound.y
+        self.upper[i, 0] = aabb.upper_bound.x
+        self.upper[i, 1] = aabb.upper_bound.y
+
+    def _grow(self):
+        """
+        Double the capacity of the bound arrays.
+        """
+        capacity = 2 * len(self.keys)
+        for name in ("lower", "upper"):
+            grown = np.empty((capacity, 2), dtype=np.float64)
+            grown[: self.size] = getattr(self, name)[: self.size]
+            setattr(self, name, grown)
+        keys = np.empty(capacity, dtype=np.int64)
+        keys[: self.size] = self.keys[: self.size]
+        self.keys = keys
@@ -6,14 +6,24 @@ It stores information about the collision such as the normal vector,
 penetration depth, and the bodies involved.
 """
 
+import logging
+
+import numpy as np
+
 from src.common.constants import (
     BAUMGARTE,
     DYNAMIC_FRICTION,
     POSITION_SLOP,
     STATIC_FRICTION,
 )
+from src.common.jit import HAS_NUMBA, njit
 from src.math.vec2 import Vec2
 
+logger = logging.getLogger(__name__)
+
+# Friction coefficient used when resolving contacts
+FRICTION_COEFFICIENT = min(STATIC_FRICTION, DYNAMIC_FRICTION)
+
 
 class Contact:
     """
@@ -33,6 +43,20 @@ class Contact:
         last_separation: The separation from the previous frame.
     """
 
+    __slots__ = (
+        "body_a",
+        "body_b",
+        "normal",
+        "penetration",
+        "contact_point",
+        "restitution",
+        "friction",
+        "persistent",
+        "normal_impulse",
+        "tangent_impulse",
+        "last_separation",
+    )
+
     def __init__(
         self,
         body_a,
@@ -73,135 +97,478 @@ class Contact:
         Returns:
             float: The magnitude of the impulse applied
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
+        body_a = self.body_a
+        body_b = self.body_b
+        if body_a.is_static and body_b.is_static:
+            return 0.0
 
-        logger.info("=== CONTACT RESOLUTION ===")
-        logger.info(
-            f"Body A (static={self.body_a.is_static}) at {self.body_a.position} vs Body B (static={self.body_b.is_static}) at {self.body_b.position}"
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=== CONTACT RESOLUTION ===")
+            logger.info(
+                "Body A (static=%s) at %s vs Body B (static=%s) at %s",
+                body_a.is_static,
+                body_a.position,
+                body_b.is_static,
+                body_b.position,
+            )
+            logger.info("Contact normal: %s", self.normal)
+            logger.info("Penetration depth: %.4f", self.penetration)
+
+        normal = self.normal
+        nx, ny = normal.x, normal.y
+        position_a, position_b = body_a.position, body_b.position
+        velocity_a, velocity_b = body_a.velocity, body_b.velocity
+        (
+            status,
+            new_nx,
+            new_ny,
+            avx,
+            avy,
+            bvx,
+            bvy,
+            normal_impulse,
+            tangent_impulse,
+        ) = _resolve_contact(
+            nx,
+            ny,
+            position_b.x - position_a.x,
+            position_b.y - position_a.y,
+            self.get_bias(dt),
+            self.restitution,
+            body_a.inverse_mass,
+            body_b.inverse_mass,
+            velocity_a.x,
+            velocity_a.y,
+            velocity_b.x,
+            velocity_b.y,
+            self.normal_impulse,
+            self.tangent_impulse,
+            FRICTION_COEFFICIENT,
         )
-        logger.info(f"Contact normal: {self.normal}")
-        logger.info(f"Penetration depth: {self.penetration:.4f}")
-
-        # Debug: Check if this is a resting contact
-        # Calculate relative velocity
-        relative_velocity = self.body_b.velocity - self.body_a.velocity
-        logger.info(f"Relative velocity: {relative_velocity}")
-
-        # Calculate relative velocity along the normal
-        velocity_along_normal = relative_velocity.dot(self.normal)
-        logger.info(f"Velocity along normal: {velocity_along_normal:.4f}")
-
-        # Calculate restitution with fallback to contact's default value
-        e_a = getattr(self.body_a, "restitution", self.restitution)
-        e_b = getattr(self.body_b, "restitution", self.restitution)
-        e = min(e_a, e_b)
-        logger.info(f"Restitution: {e}")
-
-        # Calculate inverse mass sum
-        inv_mass_sum = self.body_a.inverse_mass + self.body_b.inverse_mass
-        if abs(inv_mass_sum) < 1e-6:
-            logger.warning(f"WARNING: Very small inverse mass sum: {inv_mass_sum}")
+
+        if status == _SKIPPED_MASSLESS:
+            logger.warning(
+                "WARNING: Very small inverse mass sum: %s",
+                body_a.inverse_mass + body_b.inverse_mass,
+            )
             return 0.0
 
-        # Calculate Baumgarte bias for positional correction as velocity bias
-        bias = -BAUMGARTE / dt * max(0.0, self.penetration + POSITION_SLOP)
-        logger.info(f"Baumgarte bias: {bias:.4f}")
+        # Ensure normal direction is consistent (points from body_b to body_a)
+        if new_nx != nx or new_ny != ny:
+            self.normal = Vec2(new_nx, new_ny)
 
-        # Calculate normal impulse scalar with warm starting
-        j = -(1 + e) * velocity_along_normal  # direct impulse
-        j += bias  # Add bias directly to impulse
-        j += self.normal_impulse  # Warm starting
+        # Early-out if velocity is already separating
+        if status == _SKIPPED_SEPARATING:
+            return
 
-        # Resting minimum — smaller value
-        if abs(velocity_along_normal) < 0.05 and self.penetration > 0.005:
-            j = max(j, 0.2)  # safe gravity counter
+        # A static body has no inverse mass, so its velocity never changes
+        if not body_a.is_static:
+            body_a.velocity = Vec2(avx, avy)
+        if not body_b.is_static:
+            body_b.velocity = Vec2(bvx, bvy)
+
+        # Store the impulses for warm starting in the next frame
+        self.normal_impulse = normal_impulse
+        self.tangent_impulse = tangent_impulse
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Normal impulse: %.4f, friction impulse: %.4f",
+                normal_impulse,
+                tangent_impulse,
+            )
+            logger.info(
+                "Updated velocities - body_a at %s: %s, body_b at %s: %s",
+                body_a.position,
+                body_a.velocity,
+                body_b.position,
+                body_b.velocity,
+            )
+            logger.info("=== END CONTACT RESOLUTION ===")
+
+        return abs(normal_impulse)
+
+    def get_bias(self, dt):
+        """
+        Get the velocity bias that pushes the bodies apart to correct penetration.
 
-        # Ensure normal direction is consistent (points from body_b to body_a)
-        if self.normal.dot(self.body_b.position - self.body_a.position) < 0:
-            self.normal = -self.normal
+        Args:
+            dt (float): The time step.
+
+        Returns:
+            float: The Baumgarte velocity bias.
+        """
+        return BAUMGARTE / dt * max(0.0, self.penetration - POSITION_SLOP)
 
-        # Stronger bias to correct penetration
-        bias = -BAUMGARTE / dt * max(0.0, self.penetration + 0.01) * 2.0
+    def apply_positional_correction(self, dt):
+        """
+        Apply positional correction using Baumgarte stabilization to prevent bodies from overlapping.
+        """
+        correction = max(self.penetration + POSITION_SLOP, 0.0)
+        position_impulse = (BAUMGARTE / dt) * correction * self.normal
 
-        # Calculate impulse with bias and warm-start
-        j = (
-            -(1.0 + self.restitution) * velocity_along_normal
-            + bias
-            + self.normal_impulse
+        # Apply to both bodies (proportional to inverse mass)
+        self.body_a.position += position_impulse * self.body_a.inverse_mass
+        self.body_b.position -= position_impulse * self.body_b.inverse_mass
+
+
+# Outcomes of _resolve_contact
+_SKIPPED_MASSLESS = 0
+_SKIPPED_SEPARATING = 1
+_RESOLVED = 2
+
+
+@njit(cache=True)
+def _resolve_contact(
+    nx,
+    ny,
+    dx,
+    dy,
+    bias,
+    restitution,
+    inv_mass_a,
+    inv_mass_b,
+    vax,
+    vay,
+    vbx,
+    vby,
+    normal_impulse,
+    tangent_impulse,
+    friction_coefficient,
+):
+    """
+    Compute the impulses that resolve one contact.
+
+    This is the numeric core of Contact.resolve, shared with the batch
+    kernel. Compiled with Numba when it is available.
+
+    Args:
+        nx, ny: The contact normal.
+        dx, dy: The position of body B relative to body A.
+        bias (float): The velocity bias from Contact.get_bias.
+        restitution (float): The coefficient of restitution.
+        inv_mass_a, inv_mass_b: The inverse masses of the bodies.
+        vax, vay, vbx, vby: The velocities of the bodies.
+        normal_impulse (float): The accumulated normal impulse.
+        tangent_impulse (float): The accumulated tangent impulse.
+        friction_coefficient (float): The friction coefficient.
+
+    Returns:
+        tuple: The outcome (one of _SKIPPED_MASSLESS, _SKIPPED_SEPARATING or
+            _RESOLVED), followed by the possibly flipped normal, the new
+            velocities and the new normal and tangent impulses.
+    """
+    # Calculate relative velocity along the normal
+    rvx = vbx - vax
+    rvy = vby - vay
+    velocity_along_normal = rvx * nx + rvy * ny
+
+    inv_mass_sum = inv_mass_a + inv_mass_b
+    if abs(inv_mass_sum) < 1e-6:
+        return (
+            _SKIPPED_MASSLESS,
+            nx,
+            ny,
+            vax,
+            vay,
+            vbx,
+            vby,
+            normal_impulse,
+            tangent_impulse,
         )
 
-        # Clamp j to prevent explosion
-        j = max(j, 0.0)
-        j = min(j, 100.0)
+    # Ensure normal direction is consistent (points from body_b to body_a)
+    if nx * dx + ny * dy < 0:
+        nx = -nx
+        ny = -ny
+
+    # Impulse with a Baumgarte bias to correct penetration, warm-started
+    j = -(1.0 + restitution) * velocity_along_normal + bias + normal_impulse
+
+    # Clamp j to prevent explosion
+    j = max(j, 0.0)
+    j = min(j, 100.0)
+
+    # Skip contacts that are already separating
+    if velocity_along_normal > 0.01:
+        return (
+            _SKIPPED_SEPARATING,
+            nx,
+            ny,
+            vax,
+            vay,
+            vbx,
+            vby,
+            normal_impulse,
+            tangent_impulse,
+        )
 
-        # Early-out if velocity is already separating
-        if velocity_along_normal > 0.01:
-            return
+    jx = j * nx
+    jy = j * ny
+    vax -= jx * inv_mass_a
+    vay -= jy * inv_mass_a
+    vbx += jx * inv_mass_b
+    vby += jy * inv_mass_b
+
+    # Friction along the tangent, using the pre-impulse relative velocity.
+    # Always applied: a negligible tangential velocity just gives a
+    # negligible impulse, which is cheaper than branching on it
+    tx = -ny
+    ty = nx
+    velocity_along_tangent = rvx * tx + rvy * ty
+    max_friction = j * friction_coefficient
+    tangent_impulse = -velocity_along_tangent / inv_mass_sum
+    tangent_impulse = max(-max_friction, min(max_friction, tangent_impulse))
+    fx = tangent_impulse * tx
+    fy = tangent_impulse * ty
+    vax -= fx * inv_mass_a
+    vay -= fy * inv_mass_a
+    vbx += fx * inv_mass_b
+    vby += fy * inv_mass_b
+
+    return _RESOLVED, nx, ny, vax, vay, vbx, vby, j, tangent_impulse
+
+
+@njit(cache=True)
+def _resolve_contacts(
+    index_a,
+    index_b,
+    nx,
+    ny,
+    bias,
+    restitution,
+    normal_impulse,
+    tangent_impulse,
+    inv_mass,
+    px,
+    py,
+    vx,
+    vy,
+    iterations,
+    tolerance,
+    friction_coefficient,
+):
+    """
+    Resolve packed contacts one after another, as Contact.resolve does.
+
+    Contacts are solved in order within each iteration (Gauss-Seidel), so the
+    result matches calling Contact.resolve on each contact in turn. Compiled
+    with Numba when it is available.
+
+    Args:
+        index_a, index_b: The body index of each contact's two bodies.
+        nx, ny: The contact normals, updated if a normal is flipped.
+        bias: The velocity bias of each contact.
+        restitution: The restitution of each contact.
+        normal_impulse: The accumulated normal impulses, updated in place.
+        tangent_impulse: The accumulated tangent impulses, updated in place.
+        inv_mass: The inverse mass of each body.
+        px, py: The body positions.
+        vx, vy: The body velocities, updated in place.
+        iterations (int): The number of iterations to run.
+        tolerance (float): Stop early once no normal impulse changes by more.
+        friction_coefficient (float): The friction coefficient.
+    """
+    for _ in range(iterations):
+        max_impulse_change = 0.0
+        for c in range(len(index_a)):
+            a = index_a[c]
+            b = index_b[c]
+            old_impulse = normal_impulse[c]
+            status, cnx, cny, vax, vay, vbx, vby, j, t = _resolve_contact(
+                nx[c],
+                ny[c],
+                px[b] - px[a],
+                py[b] - py[a],
+                bias[c],
+                restitution[c],
+                inv_mass[a],
+                inv_mass[b],
+                vx[a],
+                vy[a],
+                vx[b],
+                vy[b],
+                old_impulse,
+                tangent_impulse[c],
+                friction_coefficient,
+            )
+            if status == _SKIPPED_MASSLESS:
+                continue
+            nx[c] = cnx
+            ny[c] = cny
+            if status == _SKIPPED_SEPARATING:
+                continue
+
+            vx[a] = vax
+            vy[a] = vay
+            vx[b] = vbx
+            vy[b] = vby
+            normal_impulse[c] = j
+            tangent_impulse[c] = t
+
+            change = abs(j - old_impulse)
+            if change > max_impulse_change:
+                max_impulse_change = change
+
+        if max_impulse_change < tolerance:
+            break
+
+
+class ContactArrays:
+    """
+    A structure-of-arrays copy of a list of contacts and their bodies.
 
-        # Minimum impulse for resting contacts
-        if abs(j) < 0.5:
-            j = 0.5 * (1.0 if j > 0 else -1.0)
+    Contact data and body velocities are packed into flat float64 arrays so
+    that all contacts can be resolved together by one kernel instead of a
+    Python call per contact. Results are written back with store().
+    """
 
-        # Early-out once
-        if velocity_along_normal > 0.01:
-            self.normal_impulse = 0.0
-            return 0.0
+    # Arrays passed to the resolve kernel, in its argument order
+    _KERNEL_ARRAYS = (
+        "index_a",
+        "index_b",
+        "nx",
+        "ny",
+        "bias",
+        "restitution",
+        "normal_impulse",
+        "tangent_impulse",
+        "inv_mass",
+        "px",
+        "py",
+        "vx",
+        "vy",
+    )
+
+    def __init__(self, contacts):
+        """
+        Pack the given contacts.
 
-        # Apply normal impulse
-        normal_impulse = j * self.normal
-        logger.info(f"Normal impulse vector: {normal_impulse}")
+        Args:
+            contacts (list): The contacts to pack.
+        """
+        self.contacts = contacts
+        self.bodies = []
+        index = {}
+        index_a = []
+        index_b = []
+        for contact in contacts:
+            for body, indices in (
+                (contact.body_a, index_a),
+                (contact.body_b, index_b),
+            ):
+                i = index.get(id(body))
+                if i is None:
+                    i = index[id(body)] = len(self.bodies)
+                    self.bodies.append(body)
+                indices.append(i)
+
+        self.index_a = np.array(index_a, dtype=np.int64)
+        self.index_b = np.array(index_b, dtype=np.int64)
+        self.nx = np.array([contact.normal.x for contact in contacts], dtype=np.float64)
+        self.ny = np.array([contact.normal.y for contact in contacts], dtype=np.float64)
+        self.penetration = np.array(
+            [contact.penetration for contact in contacts], dtype=np.float64
+        )
+        self.restitution = np.array(
+            [contact.restitution for contact in contacts], dtype=np.float64
+        )
+        self.normal_impulse = np.array(
+            [contact.normal_impulse for contact in contacts], dtype=np.float64
+        )
+        self.tangent_impulse = np.array(
+            [contact.tangent_impulse for contact in contacts], dtype=np.float64
+        )
+        self.inv_mass = np.array(
+            [body.inverse_mass for body in self.bodies], dtype=np.float64
+        )
+        self.px = np.array([body.position.x for body in self.bodies], dtype=np.float64)
+        self.py = np.array([body.position.y for body in self.bodies], dtype=np.float64)
+        self.vx = np.empty(len(self.bodies), dtype=np.float64)
+        self.vy = np.empty(len(self.bodies), dtype=np.float64)
+        self.bias = np.zeros(len(contacts), dtype=np.float64)
+        self.load_velocities()
+
+    @classmethod
+    def from_contacts(cls, contacts):
+        """
+        Pack a list of contacts into arrays.
 
-        # Apply normal impulse to bodies
-        self.body_a.velocity -= normal_impulse * self.body_a.inverse_mass
-        self.body_b.velocity += normal_impulse * self.body_b.inverse_mass
+        Args:
+            contacts (list): The contacts to pack.
 
-        # Store the normal impulse for warm starting in the next frame
-        self.normal_impulse = j
+        Returns:
+            ContactArrays: The packed contacts.
+        """
+        return cls(contacts)
 
-        # Calculate tangent vector (perpendicular to normal)
-        tangent = Vec2(-self.normal.y, self.normal.x)
+    def load_velocities(self):
+        """
+        Read the current body velocities into the velocity arrays.
+        """
+        for i, body in enumerate(self.bodies):
+            self.vx[i] = body.velocity.x
+            self.vy[i] = body.velocity.y
 
-        # Calculate relative velocity along tangent
-        velocity_along_tangent = relative_velocity.dot(tangent)
-        logger.info(f"Velocity along tangent: {velocity_along_tangent:.4f}")
+    def store_velocities(self):
+        """
+        Write the velocity arrays back to the bodies.
 
-        # Calculate friction impulse
-        friction_impulse = 0.0
-        if abs(velocity_along_tangent) > 1e-6:
-            # Dynamic friction
-            friction_coefficient = min(STATIC_FRICTION, DYNAMIC_FRICTION)
-            max_friction = j * friction_coefficient
+        Static bodies are skipped, since contacts never change their velocity.
+        """
+        for body, vx, vy in zip(self.bodies, self.vx.tolist(), self.vy.tolist()):
+            if not body.is_static:
+                body.velocity = Vec2(vx, vy)
 
-            # Calculate desired friction impulse
-            friction_impulse = -velocity_along_tangent / inv_mass_sum
-            friction_impulse = max(-max_friction, min(max_friction, friction_impulse))
+    def prepare(self, dt):
+        """
+        Precompute the velocity bias of every contact for this time step.
 
-            logger.info(f"Friction impulse: {friction_impulse:.4f}")
+        Args:
+            dt (float): The time step.
+        """
+        self.bias = BAUMGARTE / dt * np.maximum(0.0, self.penetration - POSITION_SLOP)
 
-            # Apply friction impulse
-            friction_vector = friction_impulse * tangent
-            self.body_a.velocity -= friction_vector * self.body_a.inverse_mass
-            self.body_b.velocity += friction_vector * self.body_b.inverse_mass
+    def resolve(self, iterations=1, tolerance=0.0):
+        """
+        Resolve all contacts for a number of iterations.
 
-            # Store the tangent impulse for warm starting
-            self.tangent_impulse = friction_impulse
+        Call prepare() once per time step first.
 
-        logger.info(
-            f"Updated velocities - body_a at {self.body_a.position}: {self.body_a.velocity}, body_b at {self.body_b.position}: {self.body_b.velocity}"
+        Args:
+            iterations (int): The number of iterations to run.
+            tolerance (float): Stop early once no normal impulse changes by more
+                than this in an iteration.
+        """
+        arrays = [getattr(self, name) for name in self._KERNEL_ARRAYS]
+        if not HAS_NUMBA:
+            # Plain Python indexes lists much faster than NumPy arrays
+            arrays = [array.tolist() for array in arrays]
+
+        _resolve_contacts(
+            *arrays,
+            iterations,
+            tolerance,
+            FRICTION_COEFFICIENT,
         )
-        logger.info("=== END CONTACT RESOLUTION ===")
 
-        return abs(j)
+        if not HAS_NUMBA:
+            for name, values in zip(self._KERNEL_ARRAYS, arrays):
+                getattr(self, name)[:] = values
 
-    def apply_positional_correction(self, dt):
+    def store(self):
         """
-        Apply positional correction using Baumgarte stabilization to prevent bodies from overlapping.
+        Write the resolved normals, impulses and velocities back.
         """
-        correction = max(self.penetration + POSITION_SLOP, 0.0)
-        position_impulse = (BAUMGARTE / dt) * correction * self.normal
-
-        # Apply to both bodies (proportional to inverse mass)
-        self.body_a.position += position_impulse * self.body_a.inverse_mass
-        self.body_b.position -= position_impulse * self.body_b.inverse_mass
+        for contact, nx, ny, normal_impulse, tangent_impulse in zip(
+            self.contacts,
+            self.nx.tolist(),
+            self.ny.tolist(),
+            self.normal_impulse.tolist(),
+            self.tangent_impulse.tolist(),
+        ):
+            if nx != contact.normal.x or ny != contact.normal.y:
+                contact.normal = Vec2(nx, ny)
+            contact.normal_impulse = normal_impulse
+            contact.tangent_impulse = tangent_impulse
+        self.store_velocities()
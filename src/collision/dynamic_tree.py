@@ -0,0 +1,510 @@
+"""
+Dynamic AABB tree for broad-phase collision detection.
+
+This module provides a bounding volume hierarchy whose leaves store "fat"
+AABBs (tight AABBs expanded by a small margin). A proxy only needs to be
+reinserted when its tight AABB leaves its fat AABB, so bodies that barely
+move cost nothing to update, and overlap queries descend the tree in
+O(log n) instead of testing every other proxy.
+"""
+
+from src.common.constants import AABB_EXTENSION
+from src.core.aabb import AABB
+from src.math.vec2 import Vec2
+
+NULL_NODE = -1
+
+
+class TreeNode:
+    """
+    A node in the dynamic AABB tree.
+
+    Attributes:
+        lower_x (float): The x-coordinate of the lower bound of the node's AABB.
+        lower_y (float): The y-coordinate of the lower bound of the node's AABB.
+        upper_x (float): The x-coordinate of the upper bound of the node's AABB.
+        upper_y (float): The y-coordinate of the upper bound of the node's AABB.
+        parent (int): The index of the parent node, or NULL_NODE for the root.
+        child1 (int): The index of the first child, or NULL_NODE for a leaf.
+        child2 (int): The index of the second child, or NULL_NODE for a leaf.
+        height (int): The height of the node (0 for leaves, -1 for free nodes).
+        user_data: The object associated with a leaf node.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty tree node.
+        """
+        self.lower_x = 0.0
+        self.lower_y = 0.0
+        self.upper_x = 0.0
+        self.upper_y = 0.0
+        self.parent = NULL_NODE
+        self.child1 = NULL_NODE
+        self.child2 = NULL_NODE
+        self.height = -1
+        self.user_data = None
+
+    def is_leaf(self):
+        """
+        Check if the node is a leaf.
+
+        Returns:
+            bool: True if the node is a leaf, False otherwise.
+        """
+        return self.child1 == NULL_NODE
+
+    def perimeter(self):
+        """
+        Calculate the perimeter of the node's AABB.
+
+        Returns:
+            float: The perimeter of the node's AABB.
+        """
+        return 2.0 * ((self.upper_x - self.lower_x) + (self.upper_y - self.lower_y))
+
+
+class DynamicTree:
+    """
+    A dynamic AABB tree that supports fast insertion, removal, and overlap queries.
+
+    Leaves are inserted using the surface area heuristic and the tree is
+    rebalanced with rotations so that its height stays logarithmic.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty dynamic tree.
+        """
+        self.nodes = []
+        self.root = NULL_NODE
+        self._free_list = []
+
+    def create_proxy(self, aabb, user_data=None):
+        """
+        Create a proxy for an AABB and insert it into the tree.
+
+        Args:
+            aabb (AABB): The tight AABB of the proxy.
+            user_data: The object to associate with the proxy.
+
+        Returns:
+            int: The proxy id.
+        """
+        proxy_id = self._allocate_node()
+        node = self.nodes[proxy_id]
+        self._set_fat_bounds(node, aabb)
+        node.user_data = user_data
+        node.height = 0
+        self._insert_leaf(proxy_id)
+        return proxy_id
+
+    def destroy_proxy(self, proxy_id):
+        """
+        Remove a proxy from the tree.
+
+        Args:
+            proxy_id (int): The proxy id.
+        """
+        self._remove_leaf(proxy_id)
+        self._free_node(proxy_id)
+
+    def move_proxy(self, proxy_id, aabb):
+        """
+        Update a proxy with a new tight AABB.
+
+        The proxy is only reinserted if the tight AABB is no longer contained
+        in the proxy's fat AABB.
+
+        Args:
+            proxy_id (int): The proxy id.
+            aabb (AABB): The new tight AABB of the proxy.
+
+        Returns:
+            bool: True if the proxy was reinserted, False otherwise.
+        """
+        node = self.nodes[proxy_id]
+        lower = aabb.lower_bound
+        upper = aabb.upper_bound
+        if (
+            node.lower_x <= lower.x
+            and node.lower_y <= lower.y
+            and upper.x <= node.upper_x
+            and upper.y <= node.upper_y
+        ):
+            return False
+
+        self._remove_leaf(proxy_id)
+        self._set_fat_bounds(node, aabb)
+        self._insert_leaf(proxy_id)
+        return True
+
+    def get_user_data(self, proxy_id):
+        """
+        Get the object associated with a proxy.
+
+        Args:
+            proxy_id (int): The proxy id.
+
+        Returns:
+            The object associated with the proxy.
+        """
+        return self.nodes[proxy_id].user_data
+
+    def get_fat_aabb(self, proxy_id):
+        """
+        Get the fat AABB of a proxy.
+
+        Args:
+            proxy_id (int): The proxy id.
+
+        Returns:
+            AABB: The fat AABB of the proxy.
+        """
+        node = self.nodes[proxy_id]
+        return AABB(
+            Vec2(node.lower_x, node.lower_y),
+            Vec2(node.upper_x, node.upper_y),
+            node.user_data,
+        )
+
+    def query(self, aabb, callback):
+        """
+        Find all proxies whose fat AABB overlaps the given AABB.
+
+        Args:
+            aabb (AABB): The AABB to query.
+            callback (callable): Called with each overlapping proxy id. Returning
+                False stops the query.
+        """
+        if self.root == NULL_NODE:
+            return
+
+        lower_x = aabb.lower_bound.x
+        lower_y = aabb.lower_bound.y
+        upper_x = aabb.upper_bound.x
+        upper_y = aabb.upper_bound.y
+
+        nodes = self.nodes
+        stack = [self.root]
+        while stack:
+            node_id = stack.pop()
+            node = nodes[node_id]
+            if (
+                node.lower_x > upper_x
+                or node.upper_x < lower_x
+                or node.lower_y > upper_y
+                or node.upper_y < lower_y
+            ):
+                continue
+
+            if node.child1 == NULL_NODE:
+                if callback(node_id) is False:
+                    return
+            else:
+                stack.append(node.child1)
+                stack.append(node.child2)
+
+    def get_height(self):
+        """
+        Get the height of the tree.
+
+        Returns:
+            int: The height of the tree, or 0 if the tree is empty.
+        """
+        if self.root == NULL_NODE:
+            return 0
+        return self.nodes[self.root].height
+
+    def clear(self):
+        """
+        Remove all proxies from the tree.
+        """
+        self.nodes.clear()
+        self._free_list.clear()
+        self.root = NULL_NODE
+
+    def _allocate_node(self):
+        """
+        Allocate a node, reusing a free node if one is available.
+
+        Returns:
+            int: The index of the allocated node.
+        """
+        if self._free_list:
+            node_id = self._free_list.pop()
+            self.nodes[node_id] = TreeNode()
+            return node_id
+        self.nodes.append(TreeNode())
+        return len(self.nodes) - 1
+
+    def _free_node(self, node_id):
+        """
+        Return a node to the free list.
+
+        Args:
+            node_id (int): The index of the node to free.
+        """
+        node = self.nodes[node_id]
+        node.height = -1
+        node.user_data = None
+        self._free_list.append(node_id)
+
+    @staticmethod
+    def _set_fat_bounds(node, aabb):
+        """
+        Set a node's bounds to the given AABB expanded by AABB_EXTENSION.
+
+        Args:
+            node (TreeNode): The node to update.
+            aabb (AABB): The tight AABB.
+        """
+        node.lower_x = aabb.lower_bound.x - AABB_EXTENSION
+        node.lower_y = aabb.lower_bound.y - AABB_EXTENSION
+        node.upper_x = aabb.upper_bound.x + AABB_EXTENSION
+        node.upper_y = aabb.upper_bound.y + AABB_EXTENSION
+
+    def _fit_to_children(self, node):
+        """
+        Recompute an internal node's bounds and height from its children.
+
+        Args:
+            node (TreeNode): The internal node to update.
+        """
+        child1 = self.nodes[node.child1]
+        child2 = self.nodes[node.child2]
+        node.lower_x = min(child1.lower_x, child2.lower_x)
+        node.lower_y = min(child1.lower_y, child2.lower_y)
+        node.upper_x = max(child1.upper_x, child2.upper_x)
+        node.upper_y = max(child1.upper_y, child2.upper_y)
+        node.height = 1 + max(child1.height, child2.height)
+
+    def _insert_leaf(self, leaf):
+        """
+        Insert a leaf into the tree using the surface area heuristic.
+
+        Args:
+            leaf (int): The index of the leaf to insert.
+        """
+        nodes = self.nodes
+        if self.root == NULL_NODE:
+            self.root = leaf
+            nodes[leaf].parent = NULL_NODE
+            return
+
+        leaf_node = nodes[leaf]
+        leaf_lx = leaf_node.lower_x
+        leaf_ly = leaf_node.lower_y
+        leaf_ux = leaf_node.upper_x
+        leaf_uy = leaf_node.upper_y
+
+        # Find the best sibling for the new leaf
+        index = self.root
+        while nodes[index].child1 != NULL_NODE:
+            node = nodes[index]
+            area = node.perimeter()
+            combined_area = 2.0 * (
+                (max(node.upper_x, leaf_ux) - min(node.lower_x, leaf_lx))
+                + (max(node.upper_y, leaf_uy) - min(node.lower_y, leaf_ly))
+            )
+
+            # Cost of creating a new parent for this node and the new leaf
+            cost = 2.0 * combined_area
+
+            # Minimum cost of pushing the leaf further down the tree
+            inheritance_cost = 2.0 * (combined_area - area)
+
+            cost1 = self._descend_cost(
+                nodes[node.child1], leaf_lx, leaf_ly, leaf_ux, leaf_uy
+            )
+            cost1 += inheritance_cost
+            cost2 = self._descend_cost(
+                nodes[node.child2], leaf_lx, leaf_ly, leaf_ux, leaf_uy
+            )
+            cost2 += inheritance_cost
+
+            if cost < cost1 and cost < cost2:
+                break
+
+            index = node.child1 if cost1 < cost2 else node.child2
+
+        sibling = index
+        sibling_node = nodes[sibling]
+
+        # Create a new parent for the sibling and the leaf
+        old_parent = sibling_node.parent
+        new_parent = self._allocate_node()
+        nodes = self.nodes
+        parent_node = nodes[new_parent]
+        parent_node.parent = old_parent
+        parent_node.child1 = sibling
+        parent_node.child2 = leaf
+        self._fit_to_children(parent_node)
+        sibling_node.parent = new_parent
+        nodes[leaf].parent = new_parent
+
+        if old_parent != NULL_NODE:
+            old_parent_node = nodes[old_parent]
+            if old_parent_node.child1 == sibling:
+                old_parent_node.child1 = new_parent
+            else:
+                old_parent_node.child2 = new_parent
+        else:
+            self.root = new_parent
+
+        # Walk back up the tree fixing heights and AABBs
+        self._refit_ancestors(nodes[leaf].parent)
+
+    @staticmethod
+    def _descend_cost(child, leaf_lx, leaf_ly, leaf_ux, leaf_uy):
+        """
+        Calculate the cost of descending into a child when inserting a leaf.
+
+        Args:
+            child (TreeNode): The child node.
+            leaf_lx (float): The lower x-bound of the leaf.
+            leaf_ly (float): The lower y-bound of the leaf.
+            leaf_ux (float): The upper x-bound of the leaf.
+            leaf_uy (float): The upper y-bound of the leaf.
+
+        Returns:
+            float: The cost of descending into the child.
+        """
+        union_perimeter = 2.0 * (
+            (max(child.upper_x, leaf_ux) - min(child.lower_x, leaf_lx))
+            + (max(child.upper_y, leaf_uy) - min(child.lower_y, leaf_ly))
+        )
+        if child.child1 == NULL_NODE:
+            return union_perimeter
+        return union_perimeter - child.perimeter()
+
+    def _remove_leaf(self, leaf):
+        """
+        Remove a leaf from the tree.
+
+        Args:
+            leaf (int): The index of the leaf to remove.
+        """
+        nodes = self.nodes
+        if leaf == self.root:
+            self.root = NULL_NODE
+            return
+
+        parent = nodes[leaf].parent
+        parent_node = nodes[parent]
+        grand_parent = parent_node.parent
+        sibling = (
+            parent_node.child2 if parent_node.child1 == leaf else parent_node.child1
+        )
+
+        if grand_parent != NULL_NODE:
+            # Destroy the parent and connect the sibling to the grand parent
+            grand_parent_node = nodes[grand_parent]
+            if grand_parent_node.child1 == parent:
+                grand_parent_node.child1 = sibling
+            else:
+                grand_parent_node.child2 = sibling
+            nodes[sibling].parent = grand_parent
+            self._free_node(parent)
+            self._refit_ancestors(grand_parent)
+        else:
+            self.root = sibling
+            nodes[sibling].parent = NULL_NODE
+            self._free_node(parent)
+
+    def _refit_ancestors(self, index):
+        """
+        Rebalance and refit every node from the given index up to the root.
+
+        Args:
+            index (int): The index of the first node to refit.
+        """
+        nodes = self.nodes
+        while index != NULL_NODE:
+            index = self._balance(index)
+            node = nodes[index]
+            self._fit_to_children(node)
+            index = node.parent
+
+    def _balance(self, i_a):
+        """
+        Perform a left or right rotation if node A is imbalanced.
+
+        Args:
+            i_a (int): The index of the node to balance.
+
+        Returns:
+            int: The index of the new root of the subtree.
+        """
+        nodes = self.nodes
+        a = nodes[i_a]
+        if a.child1 == NULL_NODE or a.height < 2:
+            return i_a
+
+        i_b = a.child1
+        i_c = a.child2
+        b = nodes[i_b]
+        c = nodes[i_c]
+        balance = c.height - b.height
+
+        # Rotate C up
+        if balance > 1:
+            return self._rotate_up(i_a, i_c, i_b)
+
+        # Rotate B up
+        if balance < -1:
+            return self._rotate_up(i_a, i_b, i_c)
+
+        return i_a
+
+    def _rotate_up(self, i_a, i_up, i_other):
+        """
+        Rotate a child of node A above A.
+
+        Args:
+            i_a (int): The index of the imbalanced node.
+            i_up (int): The index of the taller child, which becomes the subtree root.
+            i_other (int): The index of A's other child.
+
+        Returns:
+            int: The index of the new root of the subtree.
+        """
+        nodes = self.nodes
+        a = nodes[i_a]
+        up = nodes[i_up]
+        i_f = up.child1
+        i_g = up.child2
+        f = nodes[i_f]
+        g = nodes[i_g]
+
+        # Swap A and the rotated child
+        up.child1 = i_a
+        up.parent = a.parent
+        a.parent = i_up
+
+        # A's old parent should point to the rotated child
+        if up.parent != NULL_NODE:
+            up_parent = nodes[up.parent]
+            if up_parent.child1 == i_a:
+                up_parent.child1 = i_up
+            else:
+                up_parent.child2 = i_up
+        else:
+            self.root = i_up
+
+        # Keep the taller grandchild under the rotated child
+        if f.height > g.height:
+            i_kept, i_moved = i_f, i_g
+        else:
+            i_kept, i_moved = i_g, i_f
+
+        up.child2 = i_kept
+        if a.child1 == i_up:
+            a.child1 = i_moved
+        else:
+            a.child2 = i_moved
+        nodes[i_moved].parent = i_a
+
+        self._fit_to_children(a)
+        self._fit_to_children(up)
+        return i_up
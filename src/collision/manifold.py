@@ -10,18 +10,44 @@ class Manifold:
     Represents a collision manifold between two shapes.
     """
 
-    def __init__(self, normal, depth, points):
+    __slots__ = ("normal", "depth", "points", "features")
+
+    def __init__(self, normal, depth, points, features=None):
         """
         Initialize the collision manifold.
 
         Args:
             normal (Vec2): The normal vector of the collision.
             depth (float): The depth of the collision.
-            points (list of Vec2): The collision points.
+            points (np.ndarray): The (K, 2) collision points.
+            features (list of tuple, optional): A stable id for each collision
+                point, used to match contacts across frames.
         """
         self.normal = normal
         self.depth = depth
         self.points = points
+        self.features = features if features is not None else []
+
+    def get_feature_id(self):
+        """
+        Get the feature id of the primary collision point.
+
+        Returns:
+            tuple: The feature id, or None if the manifold has no tagged points.
+        """
+        return self.features[0] if self.features else None
+
+    def get_contact_point(self):
+        """
+        Get the primary collision point.
+
+        Returns:
+            Vec2: The first collision point, or None if the manifold has no points.
+        """
+        if not len(self.points):
+            return None
+        x, y = self.points[0].tolist()
+        return Vec2(x, y)
 
     def __repr__(self):
         """
@@ -3,62 +3,17 @@ Narrowphase collision detection module.
 """
 
 import logging
-from typing import List
 
 from src.collision.contact import Contact
+from src.collision.narrowphase_batch import CircleBatch, SATBatch
 from src.collision.sat import SAT
+from src.common.constants import CONTACT_CACHE_MAX_AGE
 from src.contacts.contact_solver import ContactSolver
-from src.core.shape import Shape
-from src.math.vec2 import Vec2
+from src.core.circle import Circle
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG, format="%(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
-class BodyShapeWrapper(Shape):
-    """
-    A wrapper class that adjusts shape vertices for body position.
-    """
-
-    def __init__(self, body, original_shape):
-        super().__init__()
-        self.body = body
-        self.original_shape = original_shape
-
-    def get_vertices(self) -> List[Vec2]:
-        """Get vertices adjusted for body position."""
-        vertices = self.original_shape.get_vertices()
-        logger.info(
-            f"Original vertices for {type(self.original_shape).__name__}: {vertices}"
-        )
-        logger.info(f"Body position: {self.body.position}")
-
-        if hasattr(self.original_shape, "center"):  # Circle
-            # For circles, vertices are calculated relative to circle center
-            # Adjust each vertex by body position
-            adjusted_vertices = []
-            for vertex in vertices:
-                adjusted_vertex = vertex + self.body.position
-                adjusted_vertices.append(adjusted_vertex)
-            logger.info(f"Adjusted circle vertices: {adjusted_vertices}")
-            return adjusted_vertices
-        else:  # Polygon or other shapes
-            # For polygons, adjust each vertex by body position
-            adjusted_vertices = []
-            for vertex in vertices:
-                adjusted_vertex = vertex + self.body.position
-                adjusted_vertices.append(adjusted_vertex)
-            logger.info(f"Adjusted polygon vertices: {adjusted_vertices}")
-            return adjusted_vertices
-
-    # Delegate other methods to the original shape
-    def __getattr__(self, name):
-        return getattr(self.original_shape, name)
-
-
 class Narrowphase:
     """
     Performs narrow-phase collision detection between shapes.
@@ -70,6 +25,12 @@ class Narrowphase:
         """
         self.sat = SAT()
         self.contact_solver = ContactSolver()
+        self.circle_batch = CircleBatch()
+        self.sat_batch = SATBatch()
+        self.contacts = {}  # Map of body id pair to its persistent contact
+        self.contact_rounds = {}  # Round each persistent contact was last touched
+        self.round = 0  # Rounds of resolve_collision calls over the caller's pairs
+        self._round_keys = set()  # Pairs resolved in the current round
 
     def detect_collision(self, body1, body2):
         """
@@ -82,12 +43,15 @@ class Narrowphase:
         Returns:
             bool: True if the bodies collide, False otherwise.
         """
-        # Create wrapper shapes that account for body positions
-        shape1_wrapper = self._create_body_shape_wrapper(body1)
-        shape2_wrapper = self._create_body_shape_wrapper(body2)
-
-        collision_detected = self.sat.detect_collision(shape1_wrapper, shape2_wrapper)
-        logger.info(f"Collision detected between body1 and body2: {collision_detected}")
+        collision_detected = self.sat.detect_collision(
+            body1.shape,
+            body2.shape,
+            body1.shape.get_world_vertices(body1),
+            body2.shape.get_world_vertices(body2),
+        )
+        logger.debug(
+            "Collision detected between body1 and body2: %s", collision_detected
+        )
         return collision_detected
 
     def get_collision_manifold(self, body1, body2):
@@ -101,58 +65,131 @@ class Narrowphase:
         Returns:
             Manifold: The collision manifold.
         """
-        # Create wrapper shapes that account for body positions
-        shape1_wrapper = self._create_body_shape_wrapper(body1)
-        shape2_wrapper = self._create_body_shape_wrapper(body2)
+        manifold = self.sat.get_collision_manifold(
+            body1.shape,
+            body2.shape,
+            body1.shape.get_world_vertices(body1),
+            body2.shape.get_world_vertices(body2),
+        )
+        logger.debug("Collision manifold: %s", manifold)
+        return manifold
 
-        manifold = self.sat.get_collision_manifold(shape1_wrapper, shape2_wrapper)
-        logger.info(f"Collision manifold: {manifold}")
+    def collide(self, body1, body2):
+        """
+        Test two bodies for collision and build their manifold with one SAT pass.
+
+        Args:
+            body1: The first body.
+            body2: The second body.
+
+        Returns:
+            Manifold: The collision manifold, or None if the bodies do not collide.
+        """
+        manifold = self.sat.collide(
+            body1.shape,
+            body2.shape,
+            body1.shape.get_world_vertices(body1),
+            body2.shape.get_world_vertices(body2),
+        )
+        logger.debug("Collision manifold: %s", manifold)
         return manifold
 
-    def _create_body_shape_wrapper(self, body):
+    def get_collision_manifolds(self, pairs):
         """
-        Create a wrapper shape that accounts for body position.
+        Get the collision manifolds of all colliding pairs.
+
+        Circle-circle pairs are tested together in one batch and all other
+        pairs in a second, SAT batch. Pairs of two static bodies are skipped,
+        since they can never be pushed apart.
 
         Args:
-            body: The body to wrap.
+            pairs (list): The (body1, body2) pairs to test.
 
         Returns:
-            A shape wrapper that includes body position.
+            list: A (body1, body2, Manifold) tuple for each colliding pair.
         """
-        return BodyShapeWrapper(body, body.shape)
+        circle_pairs = []
+        sat_pairs = []
+        for body1, body2 in pairs:
+            if body1.is_static and body2.is_static:
+                continue
+            if isinstance(body1.shape, Circle) and isinstance(body2.shape, Circle):
+                circle_pairs.append((body1, body2))
+            else:
+                sat_pairs.append((body1, body2))
+        collisions = self.sat_batch.collide(sat_pairs)
+        collisions.extend(self.circle_batch.collide(circle_pairs))
+        return collisions
 
     def resolve_collision(self, body1, body2, dt):
         """
         Resolve collision between two bodies using the contact solver.
 
+        The contact for a pair is kept while the bodies stay in contact, so its
+        accumulated impulses warm-start the next call. A round ends when a
+        pair is resolved again, and contacts not touched for a few rounds are
+        dropped, as for pairs that are no longer tested.
+
         Args:
             body1: The first body.
             body2: The second body.
             dt: The time step for the simulation.
         """
         self.contact_solver.clear_contacts()
-        if self.detect_collision(body1, body2):
-            manifold = self.get_collision_manifold(body1, body2)
-            # Apply collision response
-            if manifold is not None:
-                logger.info("=== COLLISION RESOLUTION ===")
-                logger.info(
-                    "Body at {} vs Body at {}".format(body1.position, body2.position)
-                )
-                logger.info(f"Normal: {manifold.normal}, Depth: {manifold.depth:.4f}")
-
-                # Create a contact and add it to the solver
-                contact = Contact(
-                    body_a=body1,
-                    body_b=body2,
-                    normal=manifold.normal,
-                    penetration=manifold.depth,
-                    contact_point=manifold.points[0]
-                    if manifold.points
-                    else body1.position,
-                )
-                self.contact_solver.add_contact(contact)
-
-                # Solve the contact
-                self.contact_solver.solve(dt)
-                logger.info("=== END COLLISION RESOLUTION ===\n")
+        if body1.is_static and body2.is_static:
+            return
+        a, b = id(body1), id(body2)
+        key = (a, b) if a < b else (b, a)
+        if key in self._round_keys:
+            self._prune_contacts()
+        self._round_keys.add(key)
+
+        manifold = self.collide(body1, body2)
+        if manifold is None:
+            self.contacts.pop(key, None)
+            self.contact_rounds.pop(key, None)
+            return
+
+        # Apply collision response
+        logger.debug("=== COLLISION RESOLUTION ===")
+        logger.debug("Body at %s vs Body at %s", body1.position, body2.position)
+        logger.debug("Normal: %s, Depth: %.4f", manifold.normal, manifold.depth)
+
+        # Reuse the pair's contact, or create one, and add it to the solver
+        contact_point = manifold.get_contact_point() or body1.position
+        contact = self.contacts.get(key)
+        if contact is None or contact.body_a is not body1:
+            # The manifold normal points from body1, so a pair resolved in the
+            # other order gets a fresh contact
+            contact = Contact(
+                body_a=body1,
+                body_b=body2,
+                normal=manifold.normal,
+                penetration=manifold.depth,
+                contact_point=contact_point,
+            )
+            self.contacts[key] = contact
+        else:
+            contact.normal = manifold.normal
+            contact.penetration = manifold.depth
+            contact.contact_point = contact_point
+        self.contact_rounds[key] = self.round
+        self.contact_solver.add_contact(contact)
+
+        # Solve the contact
+        self.contact_solver.solve(dt)
+        logger.debug("=== END COLLISION RESOLUTION ===\n")
+
+    def _prune_contacts(self):
+        """
+        Start a new round and drop contacts not touched for a few rounds.
+        """
+        self.round += 1
+        self._round_keys.clear()
+        oldest = self.round - CONTACT_CACHE_MAX_AGE
+        stale = [
+            key for key, touched in self.contact_rounds.items() if touched < oldest
+        ]
+        for key in stale:
+            del self.contact_rounds[key]
+            del self.contacts[key]
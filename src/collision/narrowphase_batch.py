@@ -0,0 +1,326 @@
+"""
+Batched narrow-phase collision detection.
+
+Circle-circle pairs are independent of each other, so all of them are tested
+in a single kernel call per step instead of one SAT test per pair. Other pairs
+go through SAT, with the separating-axis search of every pair run in a single
+kernel call over packed vertex and axis arrays.
+"""
+
+import numpy as np
+
+from src.collision.manifold import Manifold
+from src.collision.sat import SAT, _min_overlap
+from src.common.constants import SAT_BATCH_PARALLEL_MIN
+from src.common.jit import HAS_NUMBA, njit, prange
+from src.math.vec2 import Vec2
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def circle_circle_batch(cx, cy, r, idx_a, idx_b, out_normals, out_depths):
+    """
+    Test a batch of circle pairs for overlap.
+
+    Compiled with Numba when it is available, running the pairs in parallel.
+
+    Args:
+        cx (np.ndarray): The x-coordinates of the circle centers.
+        cy (np.ndarray): The y-coordinates of the circle centers.
+        r (np.ndarray): The radii of the circles.
+        idx_a (np.ndarray): The index of the first circle of each pair.
+        idx_b (np.ndarray): The index of the second circle of each pair.
+        out_normals (np.ndarray): Receives the unit normal from a to b of each pair.
+        out_depths (np.ndarray): Receives the penetration depth of each pair,
+            negative when the circles are separated.
+    """
+    for k in prange(len(idx_a)):
+        a = idx_a[k]
+        b = idx_b[k]
+        dx = cx[b] - cx[a]
+        dy = cy[b] - cy[a]
+        d = np.sqrt(dx * dx + dy * dy)
+        # Concentric circles get an arbitrary upward normal
+        inv_d = 1.0 / d if d > 0.0 else 0.0
+        out_normals[k, 0] = dx * inv_d
+        out_normals[k, 1] = dy * inv_d if d > 0.0 else 1.0
+        out_depths[k] = r[a] + r[b] - d
+
+
+def _circle_circle_numpy(cx, cy, r, idx_a, idx_b, out_normals, out_depths):
+    """
+    Test a batch of circle pairs for overlap with vectorized NumPy operations.
+
+    Used instead of circle_circle_batch when Numba is not installed. Takes the
+    same arguments.
+    """
+    dx = cx[idx_b] - cx[idx_a]
+    dy = cy[idx_b] - cy[idx_a]
+    d = np.hypot(dx, dy)
+    safe_d = np.where(d > 0.0, d, 1.0)
+    out_normals[:, 0] = np.where(d > 0.0, dx / safe_d, 0.0)
+    out_normals[:, 1] = np.where(d > 0.0, dy / safe_d, 1.0)
+    out_depths[:] = r[idx_a] + r[idx_b] - d
+
+
+@njit(cache=True)
+def _sat_pair(verts_flat, vert_offsets, axes_flat, axis_offsets, a, b):
+    """
+    Find the axis of least overlap of one shape pair in the packed arrays.
+
+    Takes the packed arrays of sat_batch and the indices of the two shapes.
+
+    Returns:
+        tuple: The row in axes_flat of the first axis with the smallest
+            overlap, and that overlap.
+    """
+    vertices1 = verts_flat[vert_offsets[a] : vert_offsets[a + 1]]
+    vertices2 = verts_flat[vert_offsets[b] : vert_offsets[b + 1]]
+    i, overlap = _min_overlap(
+        vertices1,
+        vertices2,
+        axes_flat[axis_offsets[a] : axis_offsets[a + 1]],
+        0.0,
+    )
+    axis = axis_offsets[a] + i
+    if overlap >= 0.0:
+        j, overlap2 = _min_overlap(
+            vertices1,
+            vertices2,
+            axes_flat[axis_offsets[b] : axis_offsets[b + 1]],
+            0.0,
+        )
+        # Ties keep the first shape's axis
+        if overlap2 < overlap:
+            axis = axis_offsets[b] + j
+            overlap = overlap2
+    return axis, overlap
+
+
+@njit(parallel=True, cache=True)
+def sat_batch(
+    verts_flat,
+    vert_offsets,
+    axes_flat,
+    axis_offsets,
+    pair_a,
+    pair_b,
+    out_axes,
+    out_overlaps,
+):
+    """
+    Find the axis of least overlap of a batch of shape pairs.
+
+    Shape i has the vertices verts_flat[vert_offsets[i]:vert_offsets[i + 1]]
+    and the axes axes_flat[axis_offsets[i]:axis_offsets[i + 1]]. The axes of
+    the first shape are tested before those of the second, as in SAT.collide.
+
+    Compiled with Numba when it is available, running the pairs in parallel.
+
+    Args:
+        verts_flat (np.ndarray): The (M, 2) packed vertices of all shapes.
+        vert_offsets (np.ndarray): The (N + 1,) start of each shape's vertices.
+        axes_flat (np.ndarray): The (K, 2) packed axes of all shapes.
+        axis_offsets (np.ndarray): The (N + 1,) start of each shape's axes.
+        pair_a (np.ndarray): The index of the first shape of each pair.
+        pair_b (np.ndarray): The index of the second shape of each pair.
+        out_axes (np.ndarray): Receives the row in axes_flat of the first axis
+            with the smallest overlap of each pair.
+        out_overlaps (np.ndarray): Receives that overlap, negative when the
+            axis separates the pair.
+    """
+    for p in prange(len(pair_a)):
+        out_axes[p], out_overlaps[p] = _sat_pair(
+            verts_flat, vert_offsets, axes_flat, axis_offsets, pair_a[p], pair_b[p]
+        )
+
+
+@njit(cache=True)
+def sat_batch_serial(
+    verts_flat,
+    vert_offsets,
+    axes_flat,
+    axis_offsets,
+    pair_a,
+    pair_b,
+    out_axes,
+    out_overlaps,
+):
+    """
+    Find the axis of least overlap of a batch of shape pairs on one thread.
+
+    Used instead of sat_batch for batches too small to pay for starting the
+    parallel threads. Takes the same arguments.
+    """
+    for p in range(len(pair_a)):
+        out_axes[p], out_overlaps[p] = _sat_pair(
+            verts_flat, vert_offsets, axes_flat, axis_offsets, pair_a[p], pair_b[p]
+        )
+
+
+class SATBatch:
+    """
+    Collides many body pairs with SAT at once.
+
+    Gives the same manifolds as calling SAT.collide on each pair, but the
+    vertices of each body are fetched once per batch and the axis search of
+    all pairs runs in one kernel call, in parallel for large batches.
+    """
+
+    def collide(self, pairs):
+        """
+        Find the manifolds of the colliding pairs in a batch.
+
+        Args:
+            pairs (list): The (body1, body2) pairs.
+
+        Returns:
+            list: A (body1, body2, Manifold) tuple for each colliding pair.
+        """
+        if not pairs:
+            return []
+        if not HAS_NUMBA:
+            collisions = []
+            for body1, body2 in pairs:
+                manifold = SAT.collide(
+                    body1.shape,
+                    body2.shape,
+                    body1.shape.get_world_vertices(body1),
+                    body2.shape.get_world_vertices(body2),
+                )
+                if manifold is not None:
+                    collisions.append((body1, body2, manifold))
+            return collisions
+
+        # Give each body a slice of the packed vertex and axis arrays
+        index = {}
+        vertices = []
+        axes = []
+        for body1, body2 in pairs:
+            for body in (body1, body2):
+                if id(body) not in index:
+                    index[id(body)] = len(vertices)
+                    shape = body.shape
+                    world_vertices = shape.get_world_vertices(body)
+                    vertices.append(world_vertices)
+                    axes.append(SAT._get_axes(shape, world_vertices))
+        vert_offsets = np.zeros(len(vertices) + 1, dtype=np.int64)
+        np.cumsum([len(v) for v in vertices], out=vert_offsets[1:])
+        axis_offsets = np.zeros(len(axes) + 1, dtype=np.int64)
+        np.cumsum([len(a) for a in axes], out=axis_offsets[1:])
+        axes_flat = np.concatenate(axes)
+        idx = np.array(
+            [(index[id(body1)], index[id(body2)]) for body1, body2 in pairs],
+            dtype=np.int64,
+        )
+
+        n = len(pairs)
+        out_axes = np.empty(n, dtype=np.int64)
+        out_overlaps = np.empty(n, dtype=np.float64)
+        kernel = sat_batch if n >= SAT_BATCH_PARALLEL_MIN else sat_batch_serial
+        kernel(
+            np.concatenate(vertices),
+            vert_offsets,
+            axes_flat,
+            axis_offsets,
+            idx[:, 0].copy(),
+            idx[:, 1].copy(),
+            out_axes,
+            out_overlaps,
+        )
+
+        collisions = []
+        for k in np.flatnonzero(out_overlaps >= 0.0).tolist():
+            body1, body2 = pairs[k]
+            overlap = float(out_overlaps[k])
+            axis_x, axis_y = axes_flat[out_axes[k]].tolist()
+            mtv = Vec2(axis_x * overlap, axis_y * overlap)
+            manifold = SAT._manifold_from_mtv(
+                vertices[idx[k, 0]], vertices[idx[k, 1]], mtv
+            )
+            # A zero MTV without touching edges is no collision, as in SAT.collide
+            if manifold is not None:
+                collisions.append((body1, body2, manifold))
+        return collisions
+
+
+class CircleBatch:
+    """
+    Collides many circle-circle body pairs at once.
+
+    The output arrays are kept between calls and only grow, so a steady
+    number of pairs causes no per-step allocation of result buffers.
+    """
+
+    def __init__(self, capacity=64):
+        """
+        Initialize the batch with room for the given number of pairs.
+
+        Args:
+            capacity (int): The initial number of pairs the buffers can hold.
+        """
+        self.normals = np.empty((capacity, 2), dtype=np.float64)
+        self.depths = np.empty(capacity, dtype=np.float64)
+
+    def collide(self, pairs):
+        """
+        Find the manifolds of the colliding pairs in a batch.
+
+        Args:
+            pairs (list): The (body1, body2) pairs, both with Circle shapes.
+
+        Returns:
+            list: A (body1, body2, Manifold) tuple for each colliding pair.
+        """
+        n = len(pairs)
+        if n == 0:
+            return []
+        if n > len(self.depths):
+            capacity = max(n, 2 * len(self.depths))
+            self.normals = np.empty((capacity, 2), dtype=np.float64)
+            self.depths = np.empty(capacity, dtype=np.float64)
+
+        # Give each body a row, centered as in Circle.get_world_vertices
+        index = {}
+        centers = []
+        for body1, body2 in pairs:
+            for body in (body1, body2):
+                if id(body) not in index:
+                    index[id(body)] = len(centers)
+                    shape = body.shape
+                    centers.append(
+                        (
+                            shape.center.x + body.position.x,
+                            shape.center.y + body.position.y,
+                            shape.radius,
+                        )
+                    )
+        circles = np.array(centers)
+        idx = np.array(
+            [(index[id(body1)], index[id(body2)]) for body1, body2 in pairs],
+            dtype=np.int64,
+        )
+
+        normals = self.normals[:n]
+        depths = self.depths[:n]
+        kernel = circle_circle_batch if HAS_NUMBA else _circle_circle_numpy
+        kernel(
+            np.ascontiguousarray(circles[:, 0]),
+            np.ascontiguousarray(circles[:, 1]),
+            np.ascontiguousarray(circles[:, 2]),
+            idx[:, 0].copy(),
+            idx[:, 1].copy(),
+            normals,
+            depths,
+        )
+
+        collisions = []
+        for k in np.flatnonzero(depths >= 0.0).tolist():
+            body1, body2 = pairs[k]
+            nx, ny = normals[k].tolist()
+            ax, ay, ra = centers[index[id(body1)]]
+            # Small penetrations are treated as contact, as in SAT
+            depth = max(float(depths[k]), SAT.PENETRATION_TOLERANCE)
+            point = np.array([[ax + nx * ra, ay + ny * ra]])
+            manifold = Manifold(Vec2(nx, ny), depth, point, [None])
+            collisions.append((body1, body2, manifold))
+        return collisions
@@ -1,15 +1,125 @@
 import logging
 
-from ..core.shape import Shape
+import numpy as np
+
+from ..common.jit import HAS_NUMBA, njit
+from ..core.shape import Shape, edge_normals
 from ..math.vec2 import Vec2
+from .manifold import Manifold
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG, format="%(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True)
+def _project_polygon(vertices, axes):
+    """
+    Project the vertices onto each of the given axes.
+
+    Compiled with Numba when it is available.
+
+    Args:
+        vertices (np.ndarray): The (N, 2) vertices to project.
+        axes (np.ndarray): The (K, 2) axes to project onto.
+
+    Returns:
+        tuple: The minimum and maximum projections onto each axis.
+    """
+    mins = np.empty(axes.shape[0])
+    maxs = np.empty(axes.shape[0])
+    for k in range(axes.shape[0]):
+        axis_x = axes[k, 0]
+        axis_y = axes[k, 1]
+        min_proj = vertices[0, 0] * axis_x + vertices[0, 1] * axis_y
+        max_proj = min_proj
+        for i in range(1, vertices.shape[0]):
+            proj = vertices[i, 0] * axis_x + vertices[i, 1] * axis_y
+            if proj < min_proj:
+                min_proj = proj
+            if proj > max_proj:
+                max_proj = proj
+        mins[k] = min_proj
+        maxs[k] = max_proj
+    return mins, maxs
+
+
+@njit(cache=True)
+def _min_overlap(vertices1, vertices2, axes, stop_below):
+    """
+    Find the axis on which the projections of two shapes overlap least.
+
+    Compiled with Numba when it is available.
+
+    Args:
+        vertices1 (np.ndarray): The (N, 2) vertices of the first shape.
+        vertices2 (np.ndarray): The (M, 2) vertices of the second shape.
+        axes (np.ndarray): The (K, 2) axes to project onto.
+        stop_below (float): Return at the first axis whose overlap is below
+            this instead of scanning every axis.
+
+    Returns:
+        tuple: The index of the first axis with the smallest overlap and that
+            overlap, which is negative if the axis separates the shapes.
+    """
+    best = 0
+    best_overlap = np.inf
+    for k in range(axes.shape[0]):
+        axis_x = axes[k, 0]
+        axis_y = axes[k, 1]
+        min1 = vertices1[0, 0] * axis_x + vertices1[0, 1] * axis_y
+        max1 = min1
+        for i in range(1, vertices1.shape[0]):
+            proj = vertices1[i, 0] * axis_x + vertices1[i, 1] * axis_y
+            if proj < min1:
+                min1 = proj
+            if proj > max1:
+                max1 = proj
+        min2 = vertices2[0, 0] * axis_x + vertices2[0, 1] * axis_y
+        max2 = min2
+        for i in range(1, vertices2.shape[0]):
+            proj = vertices2[i, 0] * axis_x + vertices2[i, 1] * axis_y
+            if proj < min2:
+                min2 = proj
+            if proj > max2:
+                max2 = proj
+        overlap = min(max1, max2) - max(min1, min2)
+        if overlap < best_overlap:
+            best = k
+            best_overlap = overlap
+            if overlap < stop_below:
+                break
+    return best, best_overlap
+
+
+@njit(cache=True)
+def _points_in_polygon(points, vertices):
+    """
+    Check which points are inside a polygon with the even-odd rule.
+
+    Compiled with Numba when it is available.
+
+    Args:
+        points (np.ndarray): The (M, 2) points to check.
+        vertices (np.ndarray): The (N, 2) vertices of the polygon.
+
+    Returns:
+        np.ndarray: A boolean array that is True for each point inside.
+    """
+    n = vertices.shape[0]
+    inside = np.zeros(points.shape[0], dtype=np.bool_)
+    for p in range(points.shape[0]):
+        x = points[p, 0]
+        y = points[p, 1]
+        for i in range(n):
+            x1 = vertices[i, 0]
+            y1 = vertices[i, 1]
+            x2 = vertices[(i + 1) % n, 0]
+            y2 = vertices[(i + 1) % n, 1]
+            # Count the edges crossed by a ray from the point
+            if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+                inside[p] = not inside[p]
+    return inside
+
+
 class SAT:
     """
     Separating Axis Theorem (SAT) for collision detection between convex polygons.
@@ -20,187 +130,213 @@ class SAT:
     SEPARATION_TOLERANCE = 0.005  # Allow tiny gaps to be treated as contact
 
     @staticmethod
-    def detect_collision(shape1, shape2):
+    def detect_collision(shape1, shape2, vertices1=None, vertices2=None):
         """
         Detect collision between two shapes using the Separating Axis Theorem.
 
         Args:
             shape1 (Shape): The first shape.
             shape2 (Shape): The second shape.
+            vertices1 (np.ndarray, optional): The (N, 2) vertices of the first
+                shape, such as its world-space vertices. Defaults to its own
+                vertices.
+            vertices2 (np.ndarray, optional): The (N, 2) vertices of the second
+                shape. Defaults to its own vertices.
 
         Returns:
             bool: True if the shapes are colliding, False otherwise.
         """
-        if not isinstance(shape1, Shape) or not isinstance(shape2, Shape):
-            raise ValueError("Both shapes must be instances of Shape.")
+        vertices1, vertices2, axes = SAT._prepare(shape1, shape2, vertices1, vertices2)
 
-        # Get the vertices of both shapes
-        vertices1 = shape1.get_vertices()
-        vertices2 = shape2.get_vertices()
+        # The shapes are separated exactly when some axis has a negative overlap
+        i, overlap = SAT._min_overlap(vertices1, vertices2, axes, 0.0)
+        if overlap < 0.0:
+            logger.debug("Separating axis found: %s", axes[i])
+            return False
 
-        # Combine the vertices to find all potential axes
-        all_vertices = vertices1 + vertices2
+        logger.debug("No separating axis found, collision detected")
+        return True
 
-        # Find the axes to test
-        axes = SAT._find_axes(all_vertices)
+    @staticmethod
+    def _prepare(shape1, shape2, vertices1, vertices2):
+        """
+        Get the vertex arrays of two shapes and the axes to test between them.
 
-        # Test each axis for separation
-        for axis in axes:
-            if SAT._is_separating_axis(vertices1, vertices2, axis):
-                logger.info(f"Separating axis found: {axis}")
-                return False
+        Args:
+            shape1 (Shape): The first shape.
+            shape2 (Shape): The second shape.
+            vertices1 (np.ndarray or None): The vertices of the first shape, or
+                None for its own vertices.
+            vertices2 (np.ndarray or None): The vertices of the second shape, or
+                None for its own vertices.
 
-        logger.info("No separating axis found, collision detected")
-        return True
+        Returns:
+            tuple: The (N, 2) and (M, 2) vertex arrays and the (K, 2) axes.
+        """
+        if not isinstance(shape1, Shape) or not isinstance(shape2, Shape):
+            raise ValueError("Both shapes must be instances of Shape.")
+
+        vertices1 = (
+            shape1.get_vertices_array()
+            if vertices1 is None
+            else SAT._as_array(vertices1)
+        )
+        vertices2 = (
+            shape2.get_vertices_array()
+            if vertices2 is None
+            else SAT._as_array(vertices2)
+        )
+        axes = np.concatenate(
+            [SAT._get_axes(shape1, vertices1), SAT._get_axes(shape2, vertices2)]
+        )
+        return vertices1, vertices2, axes
 
     @staticmethod
-    def _find_axes(vertices):
+    def _min_overlap(vertices1, vertices2, axes, stop_below=-np.inf):
         """
-        Find the axes to test for separation.
+        Find the axis on which the projections of two shapes overlap least.
 
         Args:
-            vertices (list of Vec2): The vertices of the shapes.
+            vertices1 (np.ndarray): The (N, 2) vertices of the first shape.
+            vertices2 (np.ndarray): The (M, 2) vertices of the second shape.
+            axes (np.ndarray): The (K, 2) axes to project onto.
+            stop_below (float): Allow returning any axis whose overlap is below
+                this instead of the one with the smallest overlap.
 
         Returns:
-            list of Vec2: The axes to test.
+            tuple: The index of the first axis with the smallest overlap and
+                that overlap, which is negative if the axis separates the shapes.
         """
-        axes = []
-        for i in range(len(vertices)):
-            # Get the current vertex and the next vertex
-            current = vertices[i]
-            next_vertex = vertices[(i + 1) % len(vertices)]
-
-            # Calculate the edge vector
-            edge = next_vertex - current
+        if HAS_NUMBA:
+            return _min_overlap(vertices1, vertices2, axes, stop_below)
+        min1, max1 = SAT._project_vertices(vertices1, axes)
+        min2, max2 = SAT._project_vertices(vertices2, axes)
+        overlaps = np.minimum(max1, max2) - np.maximum(min1, min2)
+        i = int(overlaps.argmin())
+        return i, float(overlaps[i])
 
-            # Calculate the normal vector (perpendicular to the edge)
-            normal = Vec2(-edge.y, edge.x)
-            normal = normal.normalize()
+    @staticmethod
+    def _as_array(vertices):
+        """
+        Convert vertices to an (N, 2) float64 array.
 
-            # Add the normal to the list of axes
-            axes.append(normal)
+        Args:
+            vertices (list of Vec2 or np.ndarray): The vertices.
 
-        return axes
+        Returns:
+            np.ndarray: The vertices as an (N, 2) array.
+        """
+        if isinstance(vertices, np.ndarray):
+            return vertices
+        return np.array(
+            [(vertex.x, vertex.y) for vertex in vertices], dtype=np.float64
+        ).reshape(-1, 2)
 
     @staticmethod
-    def _is_separating_axis(vertices1, vertices2, axis):
+    def _get_axes(shape, vertices):
         """
-        Check if the given axis is a separating axis.
+        Get the edge normals of a shape to test for separation.
+
+        Polygons cache their edge normals at construction and circles cache
+        them per vertex array; other shapes have them computed from their
+        vertices.
 
         Args:
-            vertices1 (list of Vec2): The vertices of the first shape.
-            vertices2 (list of Vec2): The vertices of the second shape.
-            axis (Vec2): The axis to test.
+            shape (Shape): The shape.
+            vertices (np.ndarray): The (N, 2) vertices of the shape.
 
         Returns:
-            bool: True if the axis is a separating axis, False otherwise.
+            np.ndarray: An (N, 2) array of the axes to test.
         """
-        # Project the vertices of both shapes onto the axis
-        min1, max1 = SAT._project_vertices(vertices1, axis)
-        min2, max2 = SAT._project_vertices(vertices2, axis)
-
-        # Check for overlap
-        if max1 < min2 or max2 < min1:
-            logger.info(
-                f"Separating axis found: {axis} (max1={max1}, min2={min2}, max2={max2}, min1={min1})"
-            )
-            return True
-
-        logger.info(
-            f"No separating axis found: {axis} (max1={max1}, min2={min2}, max2={max2}, min1={min1})"
-        )
-        return False
+        axes = shape.get_edge_normal_array(vertices)
+        if axes is None:
+            axes = SAT._find_axes(vertices)
+        return axes
 
     @staticmethod
-    def _project_vertices(vertices, axis):
+    def _find_axes(vertices):
         """
-        Project the vertices onto the given axis.
+        Find the axes to test for separation.
 
         Args:
-            vertices (list of Vec2): The vertices to project.
-            axis (Vec2): The axis to project onto.
+            vertices (list of Vec2 or np.ndarray): The vertices of the shapes.
 
         Returns:
-            tuple: The minimum and maximum projections.
+            np.ndarray: An (N, 2) array with the unit normal of each edge.
         """
-        min_proj = float("inf")
-        max_proj = -float("inf")
+        return edge_normals(SAT._as_array(vertices))
 
-        for vertex in vertices:
-            # Calculate the projection of the vertex onto the axis
-            proj = vertex.dot(axis)
+    @staticmethod
+    def _project_vertices(vertices, axes):
+        """
+        Project the vertices onto each of the given axes.
 
-            # Update the minimum and maximum projections
-            if proj < min_proj:
-                min_proj = proj
-            if proj > max_proj:
-                max_proj = proj
+        Args:
+            vertices (np.ndarray): The (N, 2) vertices to project.
+            axes (np.ndarray): The (K, 2) axes to project onto.
 
-        return min_proj, max_proj
+        Returns:
+            tuple: The minimum and maximum projections onto each axis, as two
+                arrays of length K.
+        """
+        if HAS_NUMBA:
+            return _project_polygon(vertices, axes)
+        projections = (
+            vertices[:, 0, None] * axes[:, 0] + vertices[:, 1, None] * axes[:, 1]
+        )
+        return projections.min(axis=0), projections.max(axis=0)
 
     @staticmethod
-    def find_minimum_translation_vector(shape1, shape2):
+    def find_minimum_translation_vector(shape1, shape2, vertices1=None, vertices2=None):
         """
         Find the Minimum Translation Vector (MTV) to resolve a collision.
 
         Args:
             shape1 (Shape): The first shape.
             shape2 (Shape): The second shape.
+            vertices1 (np.ndarray, optional): The (N, 2) vertices of the first
+                shape, such as its world-space vertices. Defaults to its own
+                vertices.
+            vertices2 (np.ndarray, optional): The (N, 2) vertices of the second
+                shape. Defaults to its own vertices.
 
         Returns:
             Vec2: The Minimum Translation Vector.
         """
-        if not isinstance(shape1, Shape) or not isinstance(shape2, Shape):
-            raise ValueError("Both shapes must be instances of Shape.")
-
-        # Get the vertices of both shapes
-        vertices1 = shape1.get_vertices()
-        vertices2 = shape2.get_vertices()
-
-        # Combine the vertices to find all potential axes
-        all_vertices = vertices1 + vertices2
-
-        # Find the axes to test
-        axes = SAT._find_axes(all_vertices)
-
-        # Initialize the minimum overlap and the MTV
-        min_overlap = float("inf")
-        mtv = Vec2.zero()
+        vertices1, vertices2, axes = SAT._prepare(shape1, shape2, vertices1, vertices2)
 
-        # Test each axis for the minimum overlap
-        for axis in axes:
-            # Project the vertices of both shapes onto the axis
-            min1, max1 = SAT._project_vertices(vertices1, axis)
-            min2, max2 = SAT._project_vertices(vertices2, axis)
-
-            # Calculate the overlap
-            overlap = min(max1, max2) - max(min1, min2)
-
-            # Log the overlap for debugging
-            logger.info(f"Overlap on axis {axis}: {overlap}")
+        # The MTV lies along the first axis with the smallest overlap. Stop at
+        # the first axis that separates the shapes by more than the tolerance,
+        # since then there is no MTV
+        i, overlap = SAT._min_overlap(
+            vertices1, vertices2, axes, -SAT.SEPARATION_TOLERANCE
+        )
 
-            # If there is no overlap, the shapes are not colliding
-            # Use position tolerance to handle tiny gaps or penetrations
-            if overlap < -SAT.SEPARATION_TOLERANCE:
-                logger.info("Separating axis found, no collision")
-                return Vec2.zero()
+        # If there is no overlap on some axis, the shapes are not colliding
+        # Use position tolerance to handle tiny gaps or penetrations
+        if overlap < -SAT.SEPARATION_TOLERANCE:
+            logger.debug("Separating axis found, no collision")
+            return Vec2.zero()
 
-            # If the overlap is smaller than the current minimum, update the MTV
-            if overlap < min_overlap:
-                min_overlap = overlap
-                mtv = axis * overlap
+        axis_x, axis_y = axes[i].tolist()
+        mtv = Vec2(axis_x * overlap, axis_y * overlap)
 
-        logger.info(f"Final MTV: {mtv}")
+        logger.debug("Final MTV: %s", mtv)
         return mtv
 
     @staticmethod
-    def get_collision_manifold(shape1, shape2):
+    def get_collision_manifold(shape1, shape2, vertices1=None, vertices2=None):
         """
         Get the collision manifold between two shapes.
 
         Args:
             shape1 (Shape): The first shape.
             shape2 (Shape): The second shape.
+            vertices1 (np.ndarray, optional): The (N, 2) vertices of the first
+                shape, such as its world-space vertices. Defaults to its own
+                vertices.
+            vertices2 (np.ndarray, optional): The (N, 2) vertices of the second
+                shape. Defaults to its own vertices.
 
         Returns:
             Manifold: The collision manifold.
@@ -209,78 +345,141 @@ class SAT:
             raise ValueError("Both shapes must be instances of Shape.")
 
         # Get the vertices of both shapes
-        vertices1 = shape1.get_vertices()
-        vertices2 = shape2.get_vertices()
+        vertices1 = (
+            shape1.get_vertices_array()
+            if vertices1 is None
+            else SAT._as_array(vertices1)
+        )
+        vertices2 = (
+            shape2.get_vertices_array()
+            if vertices2 is None
+            else SAT._as_array(vertices2)
+        )
 
         # Find the Minimum Translation Vector (MTV)
-        mtv = SAT.find_minimum_translation_vector(shape1, shape2)
+        mtv = SAT.find_minimum_translation_vector(shape1, shape2, vertices1, vertices2)
+        return SAT._manifold_from_mtv(vertices1, vertices2, mtv)
 
+    @staticmethod
+    def collide(shape1, shape2, vertices1=None, vertices2=None):
+        """
+        Test two shapes for collision and build their manifold in one pass.
+
+        Gives the same result as calling detect_collision and then
+        get_collision_manifold, but projects the shapes onto their axes once.
+
+        Args:
+            shape1 (Shape): The first shape.
+            shape2 (Shape): The second shape.
+            vertices1 (np.ndarray, optional): The (N, 2) vertices of the first
+                shape, such as its world-space vertices. Defaults to its own
+                vertices.
+            vertices2 (np.ndarray, optional): The (N, 2) vertices of the second
+                shape. Defaults to its own vertices.
+
+        Returns:
+            Manifold: The collision manifold, or None if the shapes do not collide.
+        """
+        vertices1, vertices2, axes = SAT._prepare(shape1, shape2, vertices1, vertices2)
+
+        # The shapes are separated exactly when some axis has a negative overlap
+        i, overlap = SAT._min_overlap(vertices1, vertices2, axes, 0.0)
+        if overlap < 0.0:
+            logger.debug("Separating axis found: %s", axes[i])
+            return None
+
+        # The MTV lies along the first axis with the smallest overlap
+        axis_x, axis_y = axes[i].tolist()
+        mtv = Vec2(axis_x * overlap, axis_y * overlap)
+
+        logger.debug("Final MTV: %s", mtv)
+        return SAT._manifold_from_mtv(vertices1, vertices2, mtv)
+
+    @staticmethod
+    def _manifold_from_mtv(vertices1, vertices2, mtv):
+        """
+        Build the collision manifold of two shapes from their MTV.
+
+        Args:
+            vertices1 (np.ndarray): The (N, 2) vertices of the first shape.
+            vertices2 (np.ndarray): The (N, 2) vertices of the second shape.
+            mtv (Vec2): The Minimum Translation Vector, zero if the shapes are
+                separated or just touching.
+
+        Returns:
+            Manifold: The collision manifold, or None if there is no collision.
+        """
         # If there is no collision, return None
         # But treat zero MTV (just touching) as a collision for physics stability
         if mtv == Vec2.zero():
             # Check if shapes are just touching by testing a few axes
             # Find an axis where shapes are closest
             test_axes = SAT._find_axes(
-                vertices1[:4] + vertices2[:4]
+                np.concatenate([vertices1[:4], vertices2[:4]])
             )  # Use first few vertices
-            for axis in test_axes:
-                min1, max1 = SAT._project_vertices(vertices1, axis)
-                min2, max2 = SAT._project_vertices(vertices2, axis)
-                overlap = min(max1, max2) - max(min1, min2)
-                if abs(overlap) < SAT.PENETRATION_TOLERANCE:
-                    # Shapes are just touching, create a small penetration
-                    mtv = axis * SAT.PENETRATION_TOLERANCE
-                    break
+            min1, max1 = SAT._project_vertices(vertices1, test_axes)
+            min2, max2 = SAT._project_vertices(vertices2, test_axes)
+            overlaps = np.minimum(max1, max2) - np.maximum(min1, min2)
+            touching = np.abs(overlaps) < SAT.PENETRATION_TOLERANCE
+            if touching.any():
+                # Shapes are just touching, create a small penetration
+                axis_x, axis_y = test_axes[touching.argmax()].tolist()
+                mtv = Vec2(
+                    axis_x * SAT.PENETRATION_TOLERANCE,
+                    axis_y * SAT.PENETRATION_TOLERANCE,
+                )
             if mtv == Vec2.zero():
                 return None
 
         # Apply position tolerance to treat tiny gaps or penetrations as contacts
-        if mtv.magnitude() < SAT.PENETRATION_TOLERANCE:
-            mtv = mtv.normalize() * SAT.PENETRATION_TOLERANCE
-
-        # Find the collision normal
-        normal = mtv.normalize()
-
-        # Find the collision depth
         depth = mtv.magnitude()
+        if depth < SAT.PENETRATION_TOLERANCE:
+            mtv = mtv.normalize() * SAT.PENETRATION_TOLERANCE
+            depth = mtv.magnitude()
 
-        # Find the collision points
-        collision_points = []
-        for vertex in vertices1:
-            if SAT._is_point_in_shape(vertex, vertices2):
-                collision_points.append(vertex)
-        for vertex in vertices2:
-            if SAT._is_point_in_shape(vertex, vertices1):
-                collision_points.append(vertex)
+        # The MTV is never zero here, so its length is the collision depth
+        normal = Vec2(mtv.x / depth, mtv.y / depth)
 
-        # Create and return the collision manifold
-        from src.collision.manifold import Manifold
+        # Find the collision points, tagged with (shape, vertex index) features
+        inside1 = SAT._points_in_shape(vertices1, vertices2)
+        inside2 = SAT._points_in_shape(vertices2, vertices1)
+        collision_points = np.concatenate([vertices1[inside1], vertices2[inside2]])
+        features = [(0, i) for i in np.flatnonzero(inside1).tolist()]
+        features += [(1, i) for i in np.flatnonzero(inside2).tolist()]
 
-        return Manifold(normal, depth, collision_points)
+        return Manifold(normal, depth, collision_points, features)
 
     @staticmethod
-    def _is_point_in_shape(point, vertices):
+    def _points_in_shape(points, vertices):
         """
-        Check if a point is inside a shape.
+        Check which points are inside a shape.
 
         Args:
-            point (Vec2): The point to check.
-            vertices (list of Vec2): The vertices of the shape.
+            points (np.ndarray): The (M, 2) points to check.
+            vertices (np.ndarray): The (N, 2) vertices of the shape.
 
         Returns:
-            bool: True if the point is inside the shape, False otherwise.
+            np.ndarray: A boolean array that is True for each point inside the shape.
         """
-        # Implement point-in-polygon algorithm
-        inside = False
-        n = len(vertices)
-        for i in range(n):
-            j = (i + 1) % n
-            if ((vertices[i].y > point.y) != (vertices[j].y > point.y)) and (
-                point.x
-                < (vertices[j].x - vertices[i].x)
-                * (point.y - vertices[i].y)
-                / (vertices[j].y - vertices[i].y)
-                + vertices[i].x
-            ):
-                inside = not inside
-        return inside
+        if HAS_NUMBA:
+            return _points_in_polygon(points, vertices)
+
+        # Count the edges crossed by a ray from each point (point-in-polygon)
+        x = points[:, 0, None]
+        y = points[:, 1, None]
+        x1 = vertices[:, 0]
+        y1 = vertices[:, 1]
+        next_vertices = np.concatenate((vertices[1:], vertices[:1]))
+        x2 = next_vertices[:, 0]
+        y2 = next_vertices[:, 1]
+        straddles = (y1 > y) != (y2 > y)
+
+        # Only edges that straddle the point's y have a nonzero height
+        dx_dy = np.divide(
+            (x2 - x1) * (y - y1),
+            y2 - y1,
+            out=np.zeros(straddles.shape),
+            where=straddles,
+        )
+        crossings = straddles & (x < dx_dy + x1)
+        return crossings.sum(axis=1) % 2 == 1
@@ -16,6 +16,8 @@ class Color:
         a (float): The alpha (transparency) component of the color (0.0 to 1.0).
     """
 
+    __slots__ = ("r", "g", "b", "a", "_int_rgba")
+
     def __init__(self, r=0.0, g=0.0, b=0.0, a=1.0):
         """
         Initialize a new Color.
@@ -31,6 +33,14 @@ class Color:
         self.b = b
         self.a = a
 
+    def __setattr__(self, name, value):
+        """
+        Set an attribute, dropping the cached packed color when a component changes.
+        """
+        object.__setattr__(self, name, value)
+        if name != "_int_rgba":
+            object.__setattr__(self, "_int_rgba", None)
+
     def to_tuple(self):
         """
         Convert the color to a tuple of (r, g, b, a).
@@ -40,6 +50,24 @@ class Color:
         """
         return (self.r, self.g, self.b, self.a)
 
+    def to_int(self):
+        """
+        Convert the color to a packed 0xRRGGBBAA integer.
+
+        The result is cached until a component is assigned.
+
+        Returns:
+            int: The color with 8 bits per component.
+        """
+        if self._int_rgba is None:
+            self._int_rgba = (
+                (int(self.r * 255) & 0xFF) << 24
+                | (int(self.g * 255) & 0xFF) << 16
+                | (int(self.b * 255) & 0xFF) << 8
+                | (int(self.a * 255) & 0xFF)
+            )
+        return self._int_rgba
+
     def to_hex(self):
         """
         Convert the color to a hexadecimal string.
@@ -47,9 +75,7 @@ class Color:
         Returns:
             str: A hexadecimal string representing the color.
         """
-        return "#{:02x}{:02x}{:02x}".format(
-            int(self.r * 255), int(self.g * 255), int(self.b * 255)
-        )
+        return f"#{self.to_int() >> 8:06x}"
 
     @classmethod
     def from_hex(cls, hex_color):
@@ -15,12 +15,37 @@ GRAVITY_VEC = (0.0, -GRAVITY)
 
 # Simulation constants
 DEFAULT_TIME_STEP = 1.0 / 60.0
+MAX_FRAME_TIME = 0.25  # Cap on real time consumed per frame to avoid a step backlog
 DEFAULT_VELOCITY_ITERATIONS = 50  # Increased from 8 to 50
 DEFAULT_POSITION_ITERATIONS = 20  # Increased from 3 to 20
 
 # Collision constants
 DEFAULT_RESTITUTION = 0.5
 DEFAULT_FRICTION = 0.5
+AABB_EXTENSION = 0.1  # Margin added to broad-phase AABBs to avoid reinsertion
+CONTACT_CACHE_MAX_AGE = 3  # Steps a cached contact survives without being touched
+
+# Automatic broad-phase selection: use the spatial hash grid for many
+# similarly sized bodies packed densely, and sweep and prune otherwise. Sweep
+# and prune was still about three times faster at 12000 moving bodies, so the
+# grid is only chosen for larger scenes
+GRID_MIN_BODIES = 20000
+GRID_MAX_SIZE_RATIO = 4.0  # Largest over smallest dynamic body extent
+GRID_MIN_DENSITY = 0.05  # Fraction of the bounding area covered by bodies
+
+# Use the dynamic AABB tree when static bodies outnumber dynamic ones by this
+# factor. The tree only re-queries bodies that leave their fat AABB, while
+# sweep and prune re-sorts every body each step; at 1000 static and 20
+# dynamic bodies the tree is already faster, at 500 and 20 it is not
+TREE_MIN_STATIC_RATIO = 50
+
+# Islands with at least this many revolute joints prepare them with array
+# operations instead of a pre_solve call per joint
+REVOLUTE_BATCH_PREPARE_MIN = 32
+
+# SAT batches with at least this many pairs run the parallel kernel; smaller
+# ones run serially, since starting the threads costs more than it saves
+SAT_BATCH_PARALLEL_MIN = 32
 
 # Baumgarte stabilization constants (aggressive tuning)
 BAUMGARTE = 0.4  # Increased from 0.1 to 0.4
@@ -0,0 +1,33 @@
+"""
+Optional Numba support for the physics engine.
+
+This module provides a ``njit`` decorator that compiles functions with Numba
+when it is installed and leaves them as plain Python functions otherwise, so
+callers can check ``HAS_NUMBA`` and fall back to a NumPy implementation.
+"""
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+HAS_NUMBA = numba is not None
+
+# Parallel range inside compiled kernels; a plain range without Numba
+prange = numba.prange if HAS_NUMBA else range
+
+
+def njit(*args, **kwargs):
+    """
+    Compile a function with ``numba.njit`` if Numba is available.
+
+    Can be used both as ``@njit`` and as ``@njit(cache=True, ...)``.
+
+    Returns:
+        The compiled function, or the original function if Numba is missing.
+    """
+    if HAS_NUMBA:
+        return numba.njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
@@ -6,27 +6,40 @@ This module provides functionality for profiling the performance of the physics
 
 import time
 from collections import defaultdict
+from contextlib import contextmanager
 
 
 class Profiler:
     """
     A class to profile the performance of the physics engine.
 
+    Timings are accumulated as integer nanoseconds from time.perf_counter_ns.
+
     Attributes:
-        timers (dict): A dictionary to store timing information.
+        timers (dict): The accumulated time of each key, in seconds.
         enabled (bool): Whether the profiler is enabled.
     """
 
-    def __init__(self, enabled=True):
+    def __init__(self, enabled=True, keys=()):
         """
         Initialize a new Profiler.
 
         Args:
             enabled (bool): Whether the profiler is enabled.
+            keys (iterable of str): Keys to register up front, so that timing
+                them never inserts into the timer dictionary.
         """
-        self.timers = defaultdict(float)
+        self._keys = tuple(keys)
+        self._ns = defaultdict(int, dict.fromkeys(self._keys, 0))
         self.enabled = enabled
 
+    @property
+    def timers(self):
+        """
+        The accumulated time of each key, in seconds.
+        """
+        return {key: ns * 1e-9 for key, ns in self._ns.items()}
+
     def start(self, key):
         """
         Start timing for a specific key.
@@ -37,7 +50,8 @@ class Profiler:
         if not self.enabled:
             return
 
-        self.timers[key] -= time.time()
+        # Subtracting the start time lets stop() finish with a single add
+        self._ns[key] -= time.perf_counter_ns()
 
     def stop(self, key):
         """
@@ -49,13 +63,34 @@ class Profiler:
         if not self.enabled:
             return
 
-        self.timers[key] += time.time()
+        self._ns[key] += time.perf_counter_ns()
+
+    @contextmanager
+    def measure(self, key):
+        """
+        Time the body of a with statement.
+
+        Args:
+            key (str): The key to associate with the timing.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._ns[key] += time.perf_counter_ns() - start
 
     def reset(self):
         """
         Reset all timing information.
+
+        Keys registered up front stay registered with a timing of zero.
         """
-        self.timers.clear()
+        self._ns.clear()
+        self._ns.update(dict.fromkeys(self._keys, 0))
 
     def get_timing(self, key):
         """
@@ -65,9 +100,9 @@ class Profiler:
             key (str): The key to get the timing for.
 
         Returns:
-            float: The timing information for the key.
+            float: The timing information for the key, in seconds.
         """
-        return self.timers.get(key, 0.0)
+        return self._ns.get(key, 0) * 1e-9
 
     def print_timings(self):
         """
@@ -9,6 +9,21 @@ class DistanceJoint:
     A distance joint constraint that maintains a fixed distance between two points on two bodies.
     """
 
+    __slots__ = (
+        "body1",
+        "body2",
+        "anchor1",
+        "anchor2",
+        "length",
+        "stiffness",
+        "damping",
+        "current_length",
+        "direction",
+        "world_anchor1",
+        "world_anchor2",
+        "bias",
+    )
+
     def __init__(
         self,
         body1: Body,
@@ -167,9 +182,8 @@ class DistanceJoint:
 
         # Direction and current length
         self.direction = self.world_anchor2 - self.world_anchor1
-        self.current_length = (
-            self.direction.magnitude() if self.direction.magnitude() > 1e-6 else 1.0
-        )
+        length = self.direction.magnitude()
+        self.current_length = length if length > 1e-6 else 1.0
         self.direction = self.direction / self.current_length
 
         # Bias for position error (Baumgarte)
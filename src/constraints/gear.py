@@ -23,6 +23,16 @@ class GearJoint(Joint):
         phase (float): The phase angle of the gear joint.
     """
 
+    __slots__ = (
+        "anchor_a",
+        "anchor_b",
+        "ratio",
+        "phase",
+    )
+
+    # The solver hooks are not implemented yet
+    is_inert = True
+
     def __init__(self, body_a, body_b, anchor_a, anchor_b, ratio=1.0, phase=0.0):
         """
         Initialize a new GearJoint.
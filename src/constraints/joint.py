@@ -11,6 +11,16 @@ class Joint:
     Represents a joint constraint between two bodies.
     """
 
+    __slots__ = (
+        "body1",
+        "body2",
+        "anchor1",
+        "anchor2",
+    )
+
+    # Joints whose solver hooks do nothing are kept out of the solver
+    is_inert = False
+
     def __init__(self, body1, body2, anchor1, anchor2):
         """
         Initialize the joint.
@@ -23,6 +23,16 @@ class MouseJoint(Joint):
         damping_ratio (float): The damping ratio of the joint.
     """
 
+    __slots__ = (
+        "target",
+        "max_force",
+        "frequency",
+        "damping_ratio",
+    )
+
+    # The solver hooks are not implemented yet
+    is_inert = True
+
     def __init__(
         self, body_a, body_b, target, max_force=1000.0, frequency=5.0, damping_ratio=0.7
     ):
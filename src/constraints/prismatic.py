@@ -25,6 +25,18 @@ class PrismaticJoint(Joint):
         enable_limit (bool): Whether to enable the translation limits.
     """
 
+    __slots__ = (
+        "anchor_a",
+        "anchor_b",
+        "axis",
+        "lower_translation",
+        "upper_translation",
+        "enable_limit",
+    )
+
+    # The solver hooks are not implemented yet
+    is_inert = True
+
     def __init__(
         self,
         body_a,
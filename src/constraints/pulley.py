@@ -26,6 +26,19 @@ class PulleyJoint(Joint):
         length_b (float): The length of the pulley for the second body.
     """
 
+    __slots__ = (
+        "ground_anchor_a",
+        "ground_anchor_b",
+        "anchor_a",
+        "anchor_b",
+        "length_a",
+        "length_b",
+        "ratio",
+    )
+
+    # The solver hooks are not implemented yet
+    is_inert = True
+
     def __init__(
         self,
         body_a,
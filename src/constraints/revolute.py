@@ -1,13 +1,10 @@
 import logging
+import math
 
 from ..core.body import Body
 from ..math.mat22 import Mat22
 from ..math.vec2 import Vec2
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG, format="%(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +13,26 @@ class RevoluteJoint:
     A revolute joint constraint that allows two bodies to rotate around a common anchor point.
     """
 
+    __slots__ = (
+        "body1",
+        "body2",
+        "anchor",
+        "local_anchor1",
+        "local_anchor2",
+        "bias_factor",
+        "softness",
+        "impulse",
+        "anchor1",
+        "anchor2",
+        "r1",
+        "r2",
+        "bias",
+        "_k",
+        "_inv_k",
+        "_solve_scale",
+        "_pre_solve_key",
+    )
+
     def __init__(self, body1: Body, body2: Body, anchor: Vec2):
         """
         Initialize a revolute joint between two bodies.
@@ -38,7 +55,16 @@ class RevoluteJoint:
         self.softness = 0.0
         self.impulse = Vec2(0.0, 0.0)
 
-        print(f"Initialized RevoluteJoint with anchor: {anchor}")
+        # Set by pre_solve, which must run before the velocity solver
+        self.r1 = None
+        self.r2 = None
+        self._k = None
+        self.bias = None
+        self._inv_k = None
+        self._solve_scale = None
+        self._pre_solve_key = None  # Body state the cached pre_solve values are for
+
+        logger.debug("Initialized RevoluteJoint with anchor: %s", anchor)
 
     def pre_solve(self, time_step: float):
         """
@@ -47,123 +73,166 @@ class RevoluteJoint:
         Args:
             time_step (float): The time step for the simulation.
         """
-        logger.info("Pre-solving RevoluteJoint between body1 and body2")
+        body1 = self.body1
+        body2 = self.body2
+        transform1 = body1.transform
+        transform2 = body2.transform
+
+        # Everything below only depends on this state, so skip recomputing it
+        # while neither body has moved, as for joints at rest
+        key = (
+            transform1.position.x,
+            transform1.position.y,
+            transform1.rotation,
+            transform2.position.x,
+            transform2.position.y,
+            transform2.rotation,
+            body1.position.x,
+            body1.position.y,
+            body2.position.x,
+            body2.position.y,
+            body1.inverse_mass,
+            body1.inverse_inertia,
+            body2.inverse_mass,
+            body2.inverse_inertia,
+            time_step,
+            self.bias_factor,
+        )
+        if key == self._pre_solve_key:
+            return
+        self._pre_solve_key = key
+
         # Calculate the world anchor points using local anchors
-        self.anchor1 = self.body1.transform.transform_point(self.local_anchor1)
-        self.anchor2 = self.body2.transform.transform_point(self.local_anchor2)
+        self.anchor1 = transform1.transform_point(self.local_anchor1)
+        self.anchor2 = transform2.transform_point(self.local_anchor2)
 
         # Calculate the world-space r vectors
-        self.r1 = self.anchor1 - self.body1.position
-        self.r2 = self.anchor2 - self.body2.position
-
-        print(f"Anchor1: {self.anchor1}, Anchor2: {self.anchor2}")
+        self.r1 = self.anchor1 - body1.position
+        self.r2 = self.anchor2 - body2.position
 
         # Calculate the mass matrix
         self._calculate_mass_matrix()
 
         # Calculate the bias to enforce the constraint using Baumgarte stabilization
         position_error = self.anchor2 - self.anchor1
-        self.bias = Vec2(
-            -(self.bias_factor / time_step) * position_error.x,
-            -(self.bias_factor / time_step) * position_error.y,
+        bias_scale = -(self.bias_factor / time_step)
+        self.bias = Vec2(bias_scale * position_error.x, bias_scale * position_error.y)
+        logger.debug(
+            "Anchor1: %s, Anchor2: %s, position error: %s, bias: %s",
+            self.anchor1,
+            self.anchor2,
+            position_error,
+            self.bias,
         )
-        print(f"Position error: {position_error}, Bias: {self.bias}")
 
     def solve_velocity_constraints(self, time_step: float):
         """
         Solve the velocity constraints for the joint.
         """
-        logger.info("Solving velocity constraints for RevoluteJoint")
-        # Ensure mass_matrix and bias are available
-        if not hasattr(self, "mass_matrix"):
+        # pre_solve sets the bias after the mass matrix, so one check covers both
+        if self.bias is None:
             logger.error(
                 "mass_matrix not initialized. Call pre_solve before solve_velocity_constraints."
             )
             raise AttributeError(
                 "mass_matrix not initialized. Call pre_solve before solve_velocity_constraints."
             )
-        if not hasattr(self, "bias"):
-            logger.error(
-                "bias not initialized. Call pre_solve before solve_velocity_constraints."
-            )
-            raise AttributeError(
-                "bias not initialized. Call pre_solve before solve_velocity_constraints."
-            )
-
-        # Calculate the relative velocity using world-space r vectors
-        velocity1 = self.body1.velocity + Vec2.cross_scalar(
-            self.body1.angular_velocity, self.r1
-        )
-        velocity2 = self.body2.velocity + Vec2.cross_scalar(
-            self.body2.angular_velocity, self.r2
-        )
-        relative_velocity = velocity2 - velocity1
-
-        print(f"Relative velocity: {relative_velocity}")
 
-        # Calculate the impulse delta and accumulate for warm-starting
-        impulse_delta = self.inv_mass_matrix.solve(-(relative_velocity + self.bias))
+        body1 = self.body1
+        body2 = self.body2
+        r1 = self.r1
+        r2 = self.r2
+        w1 = body1.angular_velocity
+        w2 = body2.angular_velocity
 
-        # Hard clamp delta to prevent explosion
-        impulse_delta = impulse_delta.clamped(
-            -50.0, 50.0
-        )  # assume Vec2 has clamped method or implement
-
-        self.impulse += impulse_delta
+        # Calculate the relative velocity using world-space r vectors
+        velocity1 = body1.velocity
+        velocity2 = body2.velocity
+        rvx = (velocity2.x - w2 * r2.y) - (velocity1.x - w1 * r1.y)
+        rvy = (velocity2.y + w2 * r2.x) - (velocity1.y + w1 * r1.x)
+
+        # Calculate the impulse delta with the diagonal mass matrix, clamped
+        # hard to prevent explosion, and accumulate it for warm-starting
+        inv_k = self._inv_k
+        scale = self._solve_scale
+        dx = max(-50.0, min(50.0, inv_k * -(rvx + self.bias.x) * scale))
+        dy = max(-50.0, min(50.0, inv_k * -(rvy + self.bias.y) * scale))
 
         # Hard clamp accumulated impulse
-        self.impulse = self.impulse.clamped(-200.0, 200.0)
+        ix = max(-200.0, min(200.0, self.impulse.x + dx))
+        iy = max(-200.0, min(200.0, self.impulse.y + dy))
+        self.impulse = Vec2(ix, iy)
 
         # Apply with damping
-        self.body1.velocity -= self.impulse * self.body1.inverse_mass
-        self.body1.angular_velocity -= (
-            self.r1.cross(self.impulse) * self.body1.inverse_inertia
-        )
+        im1 = body1.inverse_mass
+        vx1 = velocity1.x - ix * im1
+        vy1 = velocity1.y - iy * im1
+        w1 -= (r1.x * iy - r1.y * ix) * body1.inverse_inertia
 
-        self.body2.velocity += self.impulse * self.body2.inverse_mass
-        self.body2.angular_velocity += (
-            self.r2.cross(self.impulse) * self.body2.inverse_inertia
-        )
+        im2 = body2.inverse_mass
+        vx2 = velocity2.x + ix * im2
+        vy2 = velocity2.y + iy * im2
+        w2 += (r2.x * iy - r2.y * ix) * body2.inverse_inertia
 
         # Conditional damping (only if velocity is high)
-        if self.body1.velocity.magnitude() > 30.0:
-            self.body1.velocity *= 0.995
-            self.body1.angular_velocity *= 0.995
-        self.body2.velocity *= 0.98
-        self.body2.angular_velocity *= 0.98
+        if math.sqrt(vx1**2 + vy1**2) > 30.0:
+            vx1 *= 0.995
+            vy1 *= 0.995
+            w1 *= 0.995
+        body1.velocity = Vec2(vx1, vy1)
+        body1.angular_velocity = w1
+        body2.velocity = Vec2(vx2 * 0.98, vy2 * 0.98)
+        body2.angular_velocity = w2 * 0.98
 
     def solve_position_constraints(self):
         """
         Solve the position constraints for the joint.
-        """
-        logger.info("Solving position constraints for RevoluteJoint")
-        # Calculate the position error
-        position_error = self.anchor2 - self.anchor1
 
-        print(f"Position error: {position_error}")
-
-        # Lightweight position correction to prevent drift
-        if position_error.magnitude() > 0.005:  # Slop threshold
+        Returns:
+            bool: Whether a correction was applied. The anchors are only
+                updated by pre_solve, so the result is the same for every
+                position iteration of a step.
+        """
+        # Calculate the position error on scalars, without Vec2 temporaries
+        anchor1 = self.anchor1
+        anchor2 = self.anchor2
+        ex = anchor2.x - anchor1.x
+        ey = anchor2.y - anchor1.y
+
+        # Lightweight position correction to prevent drift, comparing squared
+        # lengths so the square root is only taken when clamping
+        error_squared = ex**2 + ey**2
+        if error_squared > 0.005 * 0.005:  # Slop threshold
             # Clamp position error to prevent numerical explosion
-            error_magnitude = position_error.magnitude()
-            if error_magnitude > 10.0:  # Limit maximum correction
-                position_error = position_error * (10.0 / error_magnitude)
-
-            correction = Vec2(-0.5 * position_error.x, -0.5 * position_error.y)
-            self.body1.position -= correction * self.body1.inverse_mass
-            self.body2.position += correction * self.body2.inverse_mass
+            if error_squared > 10.0 * 10.0:  # Limit maximum correction
+                scale = 10.0 / math.sqrt(error_squared)
+                ex *= scale
+                ey *= scale
+
+            cx = -0.5 * ex
+            cy = -0.5 * ey
+            body1 = self.body1
+            body2 = self.body2
+            im1 = body1.inverse_mass
+            im2 = body2.inverse_mass
+            position1 = body1.position
+            position2 = body2.position
+            body1.position = Vec2(position1.x - cx * im1, position1.y - cy * im1)
+            body2.position = Vec2(position2.x + cx * im2, position2.y + cy * im2)
             # Update transforms
-            self.body1.transform.position = self.body1.position
-            self.body2.transform.position = self.body2.position
+            body1.transform.position = body1.position
+            body2.transform.position = body2.position
+            return True
+        return False
 
     def _calculate_mass_matrix(self):
         """
         Calculate the mass matrix for the joint.
         """
         invM1 = self.body1.inverse_mass
-        invI1 = self.body1.inverse_inertia or 0.0
+        invI1 = self.body1.inverse_inertia
         invM2 = self.body2.inverse_mass
-        invI2 = self.body2.inverse_inertia or 0.0
+        invI2 = self.body2.inverse_inertia
 
         # Prevent zero r vectors from making singular matrix
         r1sq = max(self.r1.magnitude_squared(), 1e-8)
@@ -171,13 +240,40 @@ class RevoluteJoint:
 
         # Simplified diagonal K (safe for most cases)
         k = invM1 + invM2 + invI1 * r1sq + invI2 * r2sq
-        self.mass_matrix = Mat22([[k, 0.0], [0.0, k]])
+        self._k = k
+
+        # Scalars of inv_mass_matrix.solve() for the velocity solver. Joints
+        # between two static bodies have no mass and apply no impulse
+        if k == 0.0:
+            self._inv_k = 0.0
+            self._solve_scale = 0.0
+        else:
+            self._inv_k = 1.0 / k
+            self._solve_scale = 1.0 / (self._inv_k * self._inv_k)
+
+    @property
+    def mass_matrix(self):
+        """
+        The diagonal mass matrix of the joint, or None before pre_solve.
+
+        Returns:
+            Mat22: The mass matrix.
+        """
+        if self._k is None:
+            return None
+        return Mat22([[self._k, 0.0], [0.0, self._k]])
 
-        # Safe inverse
-        det = k * k  # since off-diagonals 0
-        if abs(det) < 1e-10:
-            det = 1e-10
-        self.inv_mass_matrix = Mat22([[1.0 / k, 0.0], [0.0, 1.0 / k]])
+    @property
+    def inv_mass_matrix(self):
+        """
+        The inverse of the diagonal mass matrix, or None before pre_solve.
+
+        Returns:
+            Mat22: The inverse mass matrix.
+        """
+        if self._k is None:
+            return None
+        return Mat22([[self._inv_k, 0.0], [0.0, self._inv_k]])
 
     def get_anchor1(self) -> Vec2:
         """
@@ -207,6 +303,7 @@ class RevoluteJoint:
         self.anchor = anchor
         self.local_anchor1 = self.body1.transform.inverse_transform_point(anchor)
         self.local_anchor2 = self.body2.transform.inverse_transform_point(anchor)
+        self._pre_solve_key = None
 
     def get_reaction_force(self, time_step: float) -> Vec2:
         """
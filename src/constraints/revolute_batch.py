@@ -0,0 +1,360 @@
+"""
+Batched velocity solving for revolute joints.
+
+The revolute joints of an island are packed into flat arrays, prepared for
+the step with array operations and solved by one kernel call per iteration,
+instead of a Python call per joint for each.
+"""
+
+import math
+
+import numpy as np
+
+from ..common.constants import REVOLUTE_BATCH_PREPARE_MIN
+from ..common.jit import HAS_NUMBA, njit
+from ..math.vec2 import Vec2
+
+
+@njit(cache=True)
+def _solve_revolute_joints(
+    index_a,
+    index_b,
+    r1x,
+    r1y,
+    r2x,
+    r2y,
+    inv_k,
+    solve_scale,
+    bias_x,
+    bias_y,
+    impulse_x,
+    impulse_y,
+    inv_mass,
+    inv_inertia,
+    vx,
+    vy,
+    w,
+    iterations,
+):
+    """
+    Solve packed revolute joints one after another, as RevoluteJoint does.
+
+    Joints are solved in order within each iteration (Gauss-Seidel), so the
+    result matches calling RevoluteJoint.solve_velocity_constraints on each
+    joint in turn. Compiled with Numba when it is available.
+
+    Args:
+        index_a, index_b: The body index of each joint's two bodies.
+        r1x, r1y, r2x, r2y: The world-space anchor offsets from each body.
+        inv_k, solve_scale: The scalars of each joint's mass matrix solve.
+        bias_x, bias_y: The velocity bias of each joint.
+        impulse_x, impulse_y: The accumulated impulses, updated in place.
+        inv_mass, inv_inertia: The inverse mass and inertia of each body.
+        vx, vy, w: The body velocities, updated in place.
+        iterations (int): The number of iterations to run.
+    """
+    for _ in range(iterations):
+        for k in range(len(index_a)):
+            a = index_a[k]
+            b = index_b[k]
+            vx1 = vx[a]
+            vy1 = vy[a]
+            w1 = w[a]
+            vx2 = vx[b]
+            vy2 = vy[b]
+            w2 = w[b]
+
+            rvx = (vx2 - w2 * r2y[k]) - (vx1 - w1 * r1y[k])
+            rvy = (vy2 + w2 * r2x[k]) - (vy1 + w1 * r1x[k])
+
+            dx = max(-50.0, min(50.0, inv_k[k] * -(rvx + bias_x[k]) * solve_scale[k]))
+            dy = max(-50.0, min(50.0, inv_k[k] * -(rvy + bias_y[k]) * solve_scale[k]))
+            ix = max(-200.0, min(200.0, impulse_x[k] + dx))
+            iy = max(-200.0, min(200.0, impulse_y[k] + dy))
+            impulse_x[k] = ix
+            impulse_y[k] = iy
+
+            vx1 -= ix * inv_mass[a]
+            vy1 -= iy * inv_mass[a]
+            w1 -= (r1x[k] * iy - r1y[k] * ix) * inv_inertia[a]
+            vx2 += ix * inv_mass[b]
+            vy2 += iy * inv_mass[b]
+            w2 += (r2x[k] * iy - r2y[k] * ix) * inv_inertia[b]
+
+            # Conditional damping (only if velocity is high)
+            if math.sqrt(vx1**2 + vy1**2) > 30.0:
+                vx1 *= 0.995
+                vy1 *= 0.995
+                w1 *= 0.995
+            vx[a] = vx1
+            vy[a] = vy1
+            w[a] = w1
+            vx[b] = vx2 * 0.98
+            vy[b] = vy2 * 0.98
+            w[b] = w2 * 0.98
+
+
+def _squared_lengths(x, y):
+    """
+    Compute x**2 + y**2 element-wise with Python float arithmetic.
+
+    Args:
+        x (np.ndarray): The x-components.
+        y (np.ndarray): The y-components.
+
+    Returns:
+        np.ndarray: The squared lengths.
+    """
+    return np.array(
+        [xi**2 + yi**2 for xi, yi in zip(x.tolist(), y.tolist())], dtype=np.float64
+    )
+
+
+class RevoluteArrays:
+    """
+    A structure-of-arrays copy of a list of revolute joints and their bodies.
+
+    prepare() takes the place of each joint's pre_solve. Results are written
+    back with store().
+    """
+
+    # Arrays passed to the solve kernel, in its argument order
+    _KERNEL_ARRAYS = (
+        "index_a",
+        "index_b",
+        "r1x",
+        "r1y",
+        "r2x",
+        "r2y",
+        "inv_k",
+        "solve_scale",
+        "bias_x",
+        "bias_y",
+        "impulse_x",
+        "impulse_y",
+        "inv_mass",
+        "inv_inertia",
+        "vx",
+        "vy",
+        "w",
+    )
+
+    def __init__(self, joints):
+        """
+        Pack the given joints.
+
+        Args:
+            joints (list): The RevoluteJoints to pack.
+        """
+        self.joints = joints
+        self.bodies = []
+        index = {}
+        index_a = []
+        index_b = []
+        for joint in joints:
+            for body, indices in ((joint.body1, index_a), (joint.body2, index_b)):
+                i = index.get(id(body))
+                if i is None:
+                    i = index[id(body)] = len(self.bodies)
+                    self.bodies.append(body)
+                indices.append(i)
+
+        self.index_a = np.array(index_a, dtype=np.int64)
+        self.index_b = np.array(index_b, dtype=np.int64)
+        self.r1x = np.zeros(len(joints), dtype=np.float64)
+        self.r1y = np.zeros(len(joints), dtype=np.float64)
+        self.r2x = np.zeros(len(joints), dtype=np.float64)
+        self.r2y = np.zeros(len(joints), dtype=np.float64)
+        self.inv_k = np.zeros(len(joints), dtype=np.float64)
+        self.solve_scale = np.zeros(len(joints), dtype=np.float64)
+        self.bias_x = np.zeros(len(joints), dtype=np.float64)
+        self.bias_y = np.zeros(len(joints), dtype=np.float64)
+        self.impulse_x = np.array(
+            [joint.impulse.x for joint in joints], dtype=np.float64
+        )
+        self.impulse_y = np.array(
+            [joint.impulse.y for joint in joints], dtype=np.float64
+        )
+        self.inv_mass = np.array(
+            [body.inverse_mass for body in self.bodies], dtype=np.float64
+        )
+        self.inv_inertia = np.array(
+            [body.inverse_inertia for body in self.bodies], dtype=np.float64
+        )
+        self.vx = np.empty(len(self.bodies), dtype=np.float64)
+        self.vy = np.empty(len(self.bodies), dtype=np.float64)
+        self.w = np.empty(len(self.bodies), dtype=np.float64)
+        self.load_velocities()
+
+    def prepare(self, time_step):
+        """
+        Compute the anchors, mass matrices and biases of all joints.
+
+        Large batches do the work of RevoluteJoint.pre_solve for every joint
+        at once, with the same arithmetic, and write the results back to the
+        joints. Small batches call each joint's pre_solve, which is cheaper
+        there and skips joints at rest.
+
+        Args:
+            time_step (float): The time step for the simulation.
+        """
+        joints = self.joints
+        if len(joints) < REVOLUTE_BATCH_PREPARE_MIN:
+            for joint in joints:
+                joint.pre_solve(time_step)
+            self.r1x = np.array([joint.r1.x for joint in joints], dtype=np.float64)
+            self.r1y = np.array([joint.r1.y for joint in joints], dtype=np.float64)
+            self.r2x = np.array([joint.r2.x for joint in joints], dtype=np.float64)
+            self.r2y = np.array([joint.r2.y for joint in joints], dtype=np.float64)
+            self.inv_k = np.array([joint._inv_k for joint in joints], dtype=np.float64)
+            self.solve_scale = np.array(
+                [joint._solve_scale for joint in joints], dtype=np.float64
+            )
+            self.bias_x = np.array([joint.bias.x for joint in joints], dtype=np.float64)
+            self.bias_y = np.array([joint.bias.y for joint in joints], dtype=np.float64)
+            return
+
+        bodies = self.bodies
+        a = self.index_a
+        b = self.index_b
+        local_x1 = np.array(
+            [joint.local_anchor1.x for joint in joints], dtype=np.float64
+        )
+        local_y1 = np.array(
+            [joint.local_anchor1.y for joint in joints], dtype=np.float64
+        )
+        local_x2 = np.array(
+            [joint.local_anchor2.x for joint in joints], dtype=np.float64
+        )
+        local_y2 = np.array(
+            [joint.local_anchor2.y for joint in joints], dtype=np.float64
+        )
+        bias_factor = np.array(
+            [joint.bias_factor for joint in joints], dtype=np.float64
+        )
+
+        # Trigonometry goes through math like Mat22.from_angle, once per body
+        rotations = [body.transform.rotation for body in bodies]
+        cos = np.array([math.cos(rotation) for rotation in rotations])
+        sin = np.array([math.sin(rotation) for rotation in rotations])
+        tx = np.array([body.transform.position.x for body in bodies], dtype=np.float64)
+        ty = np.array([body.transform.position.y for body in bodies], dtype=np.float64)
+        px = np.array([body.position.x for body in bodies], dtype=np.float64)
+        py = np.array([body.position.y for body in bodies], dtype=np.float64)
+        inv_inertia = np.array(
+            [body.inverse_inertia for body in bodies], dtype=np.float64
+        )
+
+        # World anchors, as Transform.transform_point
+        ax1 = (cos[a] * local_x1 + -sin[a] * local_y1) + tx[a]
+        ay1 = (sin[a] * local_x1 + cos[a] * local_y1) + ty[a]
+        ax2 = (cos[b] * local_x2 + -sin[b] * local_y2) + tx[b]
+        ay2 = (sin[b] * local_x2 + cos[b] * local_y2) + ty[b]
+        self.r1x = ax1 - px[a]
+        self.r1y = ay1 - py[a]
+        self.r2x = ax2 - px[b]
+        self.r2y = ay2 - py[b]
+
+        # Simplified diagonal K, as RevoluteJoint._calculate_mass_matrix. The
+        # squares go through Python's ** like Vec2.magnitude_squared, since
+        # NumPy's square can round differently in the last bit
+        r1sq = np.maximum(_squared_lengths(self.r1x, self.r1y), 1e-8)
+        r2sq = np.maximum(_squared_lengths(self.r2x, self.r2y), 1e-8)
+        k = (
+            self.inv_mass[a]
+            + self.inv_mass[b]
+            + inv_inertia[a] * r1sq
+            + inv_inertia[b] * r2sq
+        )
+        self.inv_k = np.zeros_like(k)
+        np.divide(1.0, k, out=self.inv_k, where=k != 0.0)
+        self.solve_scale = np.zeros_like(k)
+        np.divide(
+            1.0,
+            self.inv_k * self.inv_k,
+            out=self.solve_scale,
+            where=self.inv_k != 0.0,
+        )
+
+        bias_scale = -(bias_factor / time_step)
+        self.bias_x = bias_scale * (ax2 - ax1)
+        self.bias_y = bias_scale * (ay2 - ay1)
+
+        # The position solver and accessors still read these from each joint
+        for joint, values in zip(
+            joints,
+            zip(
+                ax1.tolist(),
+                ay1.tolist(),
+                ax2.tolist(),
+                ay2.tolist(),
+                self.r1x.tolist(),
+                self.r1y.tolist(),
+                self.r2x.tolist(),
+                self.r2y.tolist(),
+                k.tolist(),
+                self.inv_k.tolist(),
+                self.solve_scale.tolist(),
+                self.bias_x.tolist(),
+                self.bias_y.tolist(),
+            ),
+        ):
+            x1, y1, x2, y2, r1x, r1y, r2x, r2y, k_j, inv_k, scale, bx, by = values
+            joint.anchor1 = Vec2(x1, y1)
+            joint.anchor2 = Vec2(x2, y2)
+            joint.r1 = Vec2(r1x, r1y)
+            joint.r2 = Vec2(r2x, r2y)
+            joint.bias = Vec2(bx, by)
+            joint._k = k_j
+            joint._inv_k = inv_k
+            joint._solve_scale = scale
+            joint._pre_solve_key = None
+
+    def load_velocities(self):
+        """
+        Read the current body velocities into the velocity arrays.
+        """
+        for i, body in enumerate(self.bodies):
+            self.vx[i] = body.velocity.x
+            self.vy[i] = body.velocity.y
+            self.w[i] = body.angular_velocity
+
+    def store_velocities(self):
+        """
+        Write the velocity arrays back to the bodies.
+        """
+        for body, vx, vy, w in zip(
+            self.bodies, self.vx.tolist(), self.vy.tolist(), self.w.tolist()
+        ):
+            body.velocity = Vec2(vx, vy)
+            body.angular_velocity = w
+
+    def solve(self, iterations=1):
+        """
+        Solve the velocity constraints of all joints for a number of iterations.
+
+        Call prepare() once per time step first.
+
+        Args:
+            iterations (int): The number of iterations to run.
+        """
+        arrays = [getattr(self, name) for name in self._KERNEL_ARRAYS]
+        if not HAS_NUMBA:
+            # Plain Python indexes lists much faster than NumPy arrays
+            arrays = [array.tolist() for array in arrays]
+
+        _solve_revolute_joints(*arrays, iterations)
+
+        if not HAS_NUMBA:
+            for name, values in zip(self._KERNEL_ARRAYS, arrays):
+                getattr(self, name)[:] = values
+
+    def store(self):
+        """
+        Write the accumulated impulses and velocities back.
+        """
+        for joint, impulse_x, impulse_y in zip(
+            self.joints, self.impulse_x.tolist(), self.impulse_y.tolist()
+        ):
+            joint.impulse = Vec2(impulse_x, impulse_y)
+        self.store_velocities()
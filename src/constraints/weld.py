@@ -22,6 +22,15 @@ class WeldJoint(Joint):
         reference_angle (float): The reference angle for the joint.
     """
 
+    __slots__ = (
+        "anchor_a",
+        "anchor_b",
+        "reference_angle",
+    )
+
+    # The solver hooks are not implemented yet
+    is_inert = True
+
     def __init__(self, body_a, body_b, anchor_a, anchor_b, reference_angle=0.0):
         """
         Initialize a new WeldJoint.
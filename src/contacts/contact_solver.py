@@ -4,12 +4,7 @@ Contact solver for the physics engine.
 This module provides functionality for solving contacts between bodies in the physics engine.
 """
 
-from src.common.constants import (
-    BAUMGARTE,
-    DYNAMIC_FRICTION,
-    POSITION_SLOP,
-    STATIC_FRICTION,
-)
+import numpy as np
 
 
 class ContactSolver:
@@ -55,17 +50,19 @@ class ContactSolver:
 
         Args:
             dt (float): The time step.
+
+        Returns:
+            np.ndarray: The accumulated normal impulse of each contact.
         """
-        for _ in range(self.velocity_iterations):
-            max_impulse_change = 0.0
-            for contact in self.contacts:
-                old_impulse = contact.normal_impulse
-                contact.resolve(dt)
-                max_impulse_change = max(
-                    max_impulse_change, abs(contact.normal_impulse - old_impulse)
-                )
-            if max_impulse_change < 0.01:  # Early-out if converged
-                break
+        # Imported here since src.collision imports this module through narrowphase
+        from src.collision.contact import ContactArrays
+
+        contacts = ContactArrays.from_contacts(self.contacts)
+        contacts.prepare(dt)
+        # Early-out once no normal impulse changes by 0.01 in an iteration
+        contacts.resolve(self.velocity_iterations, tolerance=0.01)
+        contacts.store()
+        return contacts.normal_impulse
 
     def solve_position_constraints(self, dt):
         """
@@ -88,17 +85,11 @@ class ContactSolver:
         Returns:
             list: List of impulse magnitudes applied
         """
-        print(f"ContactSolver.solve called with {len(self.contacts)} contacts")
-        impulse_magnitudes = []
-
         # Solve velocity constraints
-        self.solve_velocity_constraints(dt)
+        normal_impulse = self.solve_velocity_constraints(dt)
 
         # Solve position constraints
         self.solve_position_constraints(dt)
 
-        # Collect impulse magnitudes
-        for contact in self.contacts:
-            impulse_magnitudes.append(abs(contact.normal_impulse))
-
-        return impulse_magnitudes
+        # Collect impulse magnitudes from the packed impulses in one pass
+        return np.abs(normal_impulse).tolist()
@@ -10,6 +10,8 @@ class AABB:
     Represents an axis-aligned bounding box.
     """
 
+    __slots__ = ("lower_bound", "upper_bound", "body")
+
     def __init__(self, lower_bound, upper_bound, body=None):
         """
         Initialize the AABB with lower and upper bounds.
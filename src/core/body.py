@@ -11,6 +11,26 @@ class Body:
     A class to represent a physics body in a physics engine.
     """
 
+    __slots__ = (
+        "shape",
+        "mass",
+        "position",
+        "velocity",
+        "angular_velocity",
+        "orientation",
+        "is_static",
+        "restitution",
+        "inverse_mass",
+        "inertia",
+        "inverse_inertia",
+        "force",
+        "torque",
+        "transform",
+        "sleep_timer",
+        "is_sleeping",
+        "joints",  # Set by World.add_joint for bodies that have joints
+    )
+
     def __init__(
         self,
         shape: Shape,
@@ -44,7 +64,7 @@ class Body:
         self.is_static = bool(is_static)
         self.restitution = float(restitution) if restitution is not None else 0.2
 
-        # Calculate derived properties
+        # Calculate derived properties; the inverses are always floats, 0.0 when static
         self.inverse_mass = 1.0 / self.mass if not self.is_static else 0.0
         self.inertia = (
             self.shape.get_inertia(self.mass) if not self.is_static else float("inf")
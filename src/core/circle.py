@@ -1,17 +1,36 @@
 import math
 from typing import List, Optional
 
+import numpy as np
+
 from ..core.aabb import AABB
 from ..core.body import Body
-from ..core.shape import Shape
+from ..core.shape import Shape, edge_normals
 from ..math.vec2 import Vec2
 
+# Vertices of the unit circle for the polygon that approximates a circle
+CIRCLE_VERTICES = 16
+_UNIT_CIRCLE = np.array(
+    [
+        (
+            math.cos(2 * math.pi * i / CIRCLE_VERTICES),
+            math.sin(2 * math.pi * i / CIRCLE_VERTICES),
+        )
+        for i in range(CIRCLE_VERTICES)
+    ],
+    dtype=np.float64,
+)
+# The same table as float pairs, for building Vec2 vertices without NumPy
+_UNIT_CIRCLE_PAIRS = tuple(tuple(pair) for pair in _UNIT_CIRCLE.tolist())
+
 
 class Circle(Shape):
     """
     A class to represent a circular shape in a physics engine.
     """
 
+    __slots__ = ("center", "radius", "_aabb_cache", "_vertices_cache", "_normals_cache")
+
     def __init__(self, center: Vec2 = Vec2.zero(), radius: float = 1.0) -> None:
         """
         Initialize a circle with a center and radius.
@@ -22,6 +41,9 @@ class Circle(Shape):
         """
         self.center = center
         self.radius = float(radius)
+        self._aabb_cache = None  # (body, key, aabb) of the last computed AABB
+        self._vertices_cache = None  # (body, key, vertices) of the last world vertices
+        self._normals_cache = None  # (vertices, normals) of the last tested vertices
 
     def __str__(self) -> str:
         """
@@ -104,14 +126,68 @@ class Circle(Shape):
         Returns:
             List[Vec2]: The vertices of the circle.
         """
+        center_x = self.center.x
+        center_y = self.center.y
+        radius = self.radius
+        return [
+            Vec2(center_x + radius * x, center_y + radius * y)
+            for x, y in _UNIT_CIRCLE_PAIRS
+        ]
+
+    def get_vertices_array(self) -> np.ndarray:
+        """
+        Get the vertices of the circle as an array.
+
+        Returns:
+            np.ndarray: An (N, 2) array of the vertices of the circle.
+        """
         # Approximate the circle with a polygon
-        num_vertices = 16
-        vertices = []
-        for i in range(num_vertices):
-            angle = 2 * math.pi * i / num_vertices
-            x = self.center.x + self.radius * math.cos(angle)
-            y = self.center.y + self.radius * math.sin(angle)
-            vertices.append(Vec2(x, y))
+        return self.radius * _UNIT_CIRCLE + (self.center.x, self.center.y)
+
+    def get_edge_normal_array(
+        self, vertices: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Get the edge normals of the polygon that approximates the circle.
+
+        The normals are cached for the last vertex array, so a circle tested
+        against several shapes in one step only computes them once.
+
+        Args:
+            vertices (np.ndarray, optional): The vertex array being tested.
+
+        Returns:
+            Optional[np.ndarray]: An (N, 2) array of the edge normals of the
+                given vertices, or None if no vertices are given.
+        """
+        if vertices is None:
+            return None
+        cache = self._normals_cache
+        if cache is None or cache[0] is not vertices:
+            cache = self._normals_cache = (vertices, edge_normals(vertices))
+        return cache[1]
+
+    def get_world_vertices(self, body: "Body") -> np.ndarray:
+        """
+        Get the vertices of the circle translated by a body's position.
+
+        The result is cached until the body or the circle moves.
+
+        Args:
+            body (Body): The body associated with the circle.
+
+        Returns:
+            np.ndarray: An (N, 2) array of the vertices in world space.
+        """
+        position = body.position
+        key = (self.center.x, self.center.y, self.radius, position.x, position.y)
+        cache = self._vertices_cache
+        if cache is not None and cache[0] is body and cache[1] == key:
+            return cache[2]
+
+        vertices = self.get_vertices_array()
+        vertices += key[3:]
+        self._vertices_cache = (body, key, vertices)
         return vertices
 
     def rotate(self, angle: float, pivot: Vec2 = Vec2.zero()) -> None:
@@ -141,18 +217,29 @@ class Circle(Shape):
         """
         from src.core.aabb import AABB
 
-        # For a circle, the center should be the body's position
-        # The circle's center attribute is relative to the body's position
+        # The circle's center is relative to the body's position, as in the
+        # narrowphase
         if body:
-            center = body.position
+            center_x = self.center.x + body.position.x
+            center_y = self.center.y + body.position.y
         else:
-            center = self.center
-
-        return AABB(
-            Vec2(center.x - self.radius, center.y - self.radius),
-            Vec2(center.x + self.radius, center.y + self.radius),
+            center_x = self.center.x
+            center_y = self.center.y
+
+        key = (center_x, center_y, self.radius)
+        cache = self._aabb_cache
+        if cache is not None and cache[0] is body:
+            # Static bodies never move, so their AABB is cached permanently
+            if (body is not None and body.is_static) or cache[1] == key:
+                return cache[2]
+
+        aabb = AABB(
+            Vec2(center_x - self.radius, center_y - self.radius),
+            Vec2(center_x + self.radius, center_y + self.radius),
             body,
         )
+        self._aabb_cache = (body, key, aabb)
+        return aabb
 
     def get_inertia(self, mass: float) -> float:
         """
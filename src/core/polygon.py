@@ -1,6 +1,8 @@
 import math
 
-from ..core.shape import Shape
+import numpy as np
+
+from ..core.shape import Shape, edge_normals
 from ..math.mat22 import Mat22
 from ..math.transform import Transform
 from ..math.vec2 import Vec2
@@ -11,34 +13,59 @@ class Polygon(Shape):
     A class to represent a polygonal shape in a physics engine.
     """
 
+    __slots__ = (
+        "vertices",
+        "transform",
+        "_vertex_list",
+        "_normals",
+        "_centroid",
+        "_aabb_cache",
+        "_vertices_cache",
+        "_local_normals",
+        "_local_normal_list",
+        "_local_axes",
+        "_local_aabb",
+    )
+
     def __init__(self, vertices, transform=None):
         """
         Initialize a polygon with a list of vertices.
 
         Args:
-            vertices (list of Vec2): The vertices of the polygon.
+            vertices (list of Vec2 or np.ndarray): The vertices of the polygon,
+                either as Vec2 objects or as an (N, 2) array.
             transform (Transform): The transformation to apply to the polygon.
         """
         if len(vertices) < 3:
             raise ValueError("A polygon must have at least 3 vertices.")
-        self.vertices = vertices
+        if not isinstance(vertices, np.ndarray):
+            vertices = [[v.x, v.y] for v in vertices]
+        self.vertices = np.ascontiguousarray(vertices, dtype=np.float64).reshape(-1, 2)
+        self._vertex_list = None
         self.transform = transform if transform is not None else Transform.identity()
         self._normals = None
         self._centroid = None
+        self._aabb_cache = None  # (body, key, aabb) of the last computed AABB
+        self._vertices_cache = None  # (body, key, vertices) of the last world vertices
+
+        # Vertices never change after construction, so edge normals and
+        # bounds are computed once in local space
+        self._local_normals = edge_normals(self.vertices)
+        self._local_normal_list = [Vec2(x, y) for x, y in self._local_normals.tolist()]
+        self._local_axes = self._unique_axes(self._local_normals)
+        self._local_aabb = (self.vertices.min(axis=0), self.vertices.max(axis=0))
 
     def __str__(self):
         """
         Return a string representation of the polygon.
         """
-        return f"Polygon(vertices={self.vertices}, transform={self.transform})"
+        return f"Polygon(vertices={self.get_vertices()}, transform={self.transform})"
 
     def __repr__(self):
         """
         Return a detailed string representation of the polygon.
         """
-        return (
-            f"Polygon(vertices={repr(self.vertices)}, transform={repr(self.transform)})"
-        )
+        return f"Polygon(vertices={repr(self.get_vertices())}, transform={repr(self.transform)})"
 
     def get_vertices(self):
         """
@@ -47,8 +74,44 @@ class Polygon(Shape):
         Returns:
             list of Vec2: The vertices of the polygon.
         """
+        if self._vertex_list is None:
+            self._vertex_list = [Vec2(x, y) for x, y in self.vertices.tolist()]
+        return self._vertex_list
+
+    def get_vertices_array(self):
+        """
+        Get the vertices of the polygon as an array.
+
+        Returns:
+            np.ndarray: The (N, 2) array of the vertices of the polygon.
+        """
         return self.vertices
 
+    def get_world_vertices(self, body):
+        """
+        Get the vertices of the polygon translated by a body's position.
+
+        The result is cached until the body moves, so a body tested against
+        several others in one step only translates its vertices once.
+
+        Args:
+            body (Body): The body associated with the polygon.
+
+        Returns:
+            np.ndarray: An (N, 2) array of the vertices in world space.
+        """
+        position = body.position
+        key = (position.x, position.y)
+        cache = self._vertices_cache
+        if cache is not None and cache[0] is body:
+            # Static bodies never move, so their vertices are cached permanently
+            if body.is_static or cache[1] == key:
+                return cache[2]
+
+        vertices = self.vertices + key
+        self._vertices_cache = (body, key, vertices)
+        return vertices
+
     def get_transformed_vertices(self):
         """
         Get the vertices of the polygon after applying the transformation.
@@ -56,7 +119,24 @@ class Polygon(Shape):
         Returns:
             list of Vec2: The transformed vertices of the polygon.
         """
-        return [self.transform.transform_point(v) for v in self.vertices]
+        return [Vec2(x, y) for x, y in self._transformed_array().tolist()]
+
+    def _transformed_array(self):
+        """
+        Get the transformed vertices of the polygon as an array.
+
+        Returns:
+            np.ndarray: An (N, 2) array of the transformed vertices.
+        """
+        rotation = self.transform.rotation
+        position = self.transform.position
+        if rotation == 0.0:
+            if position.x == 0.0 and position.y == 0.0:
+                return self.vertices
+            return self.vertices + (position.x, position.y)
+        c = math.cos(rotation)
+        s = math.sin(rotation)
+        return self.vertices @ np.array([[c, s], [-s, c]]) + (position.x, position.y)
 
     def get_normals(self):
         """
@@ -69,6 +149,35 @@ class Polygon(Shape):
             self._compute_normals()
         return self._normals
 
+    def get_edge_normals(self):
+        """
+        Get the untransformed normals of the polygon edges.
+
+        The normals are computed once at construction and match the vertices
+        returned by get_vertices().
+
+        Returns:
+            list of Vec2: The local-space normals of the polygon edges.
+        """
+        return self._local_normal_list
+
+    def get_edge_normal_array(self, vertices=None):
+        """
+        Get the untransformed normals of the polygon edges as an array.
+
+        A normal that is the exact opposite of an earlier one is left out, as
+        it gives the same overlap in SAT; a box has two axes instead of four.
+        Translating the polygon does not change its normals, so the vertex
+        array being tested is ignored.
+
+        Args:
+            vertices (np.ndarray, optional): The vertex array being tested.
+
+        Returns:
+            np.ndarray: A (K, 2) array of the distinct local-space edge normals.
+        """
+        return self._local_axes
+
     def get_centroid(self):
         """
         Get the centroid of the polygon.
@@ -84,28 +193,40 @@ class Polygon(Shape):
         """
         Compute the normals of the polygon edges.
         """
-        vertices = self.get_transformed_vertices()
-        normals = []
-        n = len(vertices)
-        for i in range(n):
-            v1 = vertices[i]
-            v2 = vertices[(i + 1) % n]
-            edge = v2 - v1
-            normal = Vec2(-edge.y, edge.x).normalize()
-            normals.append(normal)
-        self._normals = normals
+        normals = self._local_normals
+        rotation = self.transform.rotation
+        if rotation != 0.0:
+            c = math.cos(rotation)
+            s = math.sin(rotation)
+            normals = normals @ np.array([[c, s], [-s, c]])
+        self._normals = [Vec2(x, y) for x, y in normals.tolist()]
+
+    @staticmethod
+    def _unique_axes(normals):
+        """
+        Drop normals that repeat or exactly oppose an earlier normal.
+
+        Args:
+            normals (np.ndarray): An (N, 2) array of edge normals.
+
+        Returns:
+            np.ndarray: The normals that remain, in their original order.
+        """
+        seen = set()
+        keep = []
+        for i, (x, y) in enumerate(normals.tolist()):
+            if (x, y) in seen or (-x, -y) in seen:
+                continue
+            seen.add((x, y))
+            keep.append(i)
+        return np.ascontiguousarray(normals[keep])
 
     def _compute_centroid(self):
         """
         Compute the centroid of the polygon.
         """
-        vertices = self.get_transformed_vertices()
-        n = len(vertices)
-        centroid = Vec2.zero()
-        for v in vertices:
-            centroid += v
-        centroid /= n
-        self._centroid = centroid
+        cx, cy = self._transformed_array().mean(axis=0).tolist()
+        self._centroid = Vec2(cx, cy)
 
     def get_area(self):
         """
@@ -114,14 +235,10 @@ class Polygon(Shape):
         Returns:
             float: The area of the polygon.
         """
-        vertices = self.get_transformed_vertices()
-        n = len(vertices)
-        area = 0.0
-        for i in range(n):
-            v1 = vertices[i]
-            v2 = vertices[(i + 1) % n]
-            area += v1.x * v2.y - v2.x * v1.y
-        return abs(area) / 2.0
+        v1 = self._transformed_array()
+        v2 = np.roll(v1, -1, axis=0)
+        area = np.sum(v1[:, 0] * v2[:, 1] - v2[:, 0] * v1[:, 1])
+        return abs(float(area)) / 2.0
 
     def get_inertia(self, mass):
         """
@@ -133,15 +250,11 @@ class Polygon(Shape):
         Returns:
             float: The moment of inertia of the polygon.
         """
-        vertices = self.get_transformed_vertices()
-        n = len(vertices)
-        inertia = 0.0
-        for i in range(n):
-            v1 = vertices[i]
-            v2 = vertices[(i + 1) % n]
-            cross = v1.x * v2.y - v2.x * v1.y
-            dot = v1.dot(v1) + v1.dot(v2) + v2.dot(v2)
-            inertia += cross * dot
+        v1 = self._transformed_array()
+        v2 = np.roll(v1, -1, axis=0)
+        cross = v1[:, 0] * v2[:, 1] - v2[:, 0] * v1[:, 1]
+        dot = np.sum(v1 * v1 + v1 * v2 + v2 * v2, axis=1)
+        inertia = float(np.sum(cross * dot))
         return mass * abs(inertia) / 12.0
 
     def contains_point(self, point):
@@ -178,12 +291,34 @@ class Polygon(Shape):
         """
         from src.core.aabb import AABB
 
-        vertices = self.get_transformed_vertices()
-        min_x = min(v.x for v in vertices)
-        min_y = min(v.y for v in vertices)
-        max_x = max(v.x for v in vertices)
-        max_y = max(v.y for v in vertices)
-        return AABB(Vec2(min_x, min_y), Vec2(max_x, max_y), body)
+        if body is not None:
+            # Bound the same world vertices the narrowphase collides
+            position = body.position
+            key = (id(self.vertices), position.x, position.y)
+        else:
+            position = self.transform.position
+            key = (id(self.vertices), position.x, position.y, self.transform.rotation)
+        cache = self._aabb_cache
+        if cache is not None and cache[0] is body:
+            # Static bodies never move, so their AABB is cached permanently
+            if (body is not None and body.is_static) or cache[1] == key:
+                return cache[2]
+
+        if body is not None:
+            vertices = self.get_world_vertices(body)
+            min_x, min_y = vertices.min(axis=0).tolist()
+            max_x, max_y = vertices.max(axis=0).tolist()
+        elif self.transform.rotation == 0.0:
+            lower, upper = self._local_aabb
+            min_x, min_y = (lower + (position.x, position.y)).tolist()
+            max_x, max_y = (upper + (position.x, position.y)).tolist()
+        else:
+            vertices = self._transformed_array()
+            min_x, min_y = vertices.min(axis=0).tolist()
+            max_x, max_y = vertices.max(axis=0).tolist()
+        aabb = AABB(Vec2(min_x, min_y), Vec2(max_x, max_y), body)
+        self._aabb_cache = (body, key, aabb)
+        return aabb
 
     def translate(self, translation):
         """
@@ -193,6 +328,7 @@ class Polygon(Shape):
             translation (Vec2): The translation vector.
         """
         self.transform.position += translation
+        self._aabb_cache = None
 
     def rotate(self, angle):
         """
@@ -202,6 +338,7 @@ class Polygon(Shape):
             angle (float): The angle to rotate by (in radians).
         """
         self.transform.rotation += angle
+        self._aabb_cache = None
 
     def set_transform(self, transform):
         """
@@ -213,3 +350,4 @@ class Polygon(Shape):
         self.transform = transform
         self._normals = None
         self._centroid = None
+        self._aabb_cache = None
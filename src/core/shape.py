@@ -1,13 +1,37 @@
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 from ..math.vec2 import Vec2
 
 
+def edge_normals(vertices: np.ndarray) -> np.ndarray:
+    """
+    Compute the unit normal of each edge of a polygon.
+
+    Args:
+        vertices (np.ndarray): The (N, 2) vertices of the polygon.
+
+    Returns:
+        np.ndarray: An (N, 2) array with the normal of the edge starting at
+            each vertex, or zero for a degenerate edge.
+    """
+    # Calculate the edge vectors and their perpendicular normals
+    edges = np.concatenate((vertices[1:], vertices[:1])) - vertices
+    normals = np.stack([-edges[:, 1], edges[:, 0]], axis=1)
+
+    # Normalize, leaving degenerate edges with a zero normal
+    lengths = np.sqrt(normals[:, 0] ** 2 + normals[:, 1] ** 2)[:, None]
+    return np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths != 0)
+
+
 class Shape:
     """
     A base class for all shapes in the physics engine.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """
         Initialize the shape.
@@ -23,6 +47,45 @@ class Shape:
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def get_vertices_array(self) -> np.ndarray:
+        """
+        Get the vertices of the shape as an array.
+
+        Returns:
+            np.ndarray: An (N, 2) array of the vertices of the shape.
+        """
+        return np.array(
+            [(vertex.x, vertex.y) for vertex in self.get_vertices()], dtype=np.float64
+        ).reshape(-1, 2)
+
+    def get_world_vertices(self, body: "Body") -> np.ndarray:
+        """
+        Get the vertices of the shape translated by a body's position.
+
+        Args:
+            body (Body): The body associated with the shape.
+
+        Returns:
+            np.ndarray: An (N, 2) array of the vertices in world space.
+        """
+        return self.get_vertices_array() + (body.position.x, body.position.y)
+
+    def get_edge_normal_array(
+        self, vertices: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Get the cached edge normals of the shape.
+
+        Args:
+            vertices (np.ndarray, optional): The vertex array being tested, for
+                shapes whose normals depend on where their vertices are.
+
+        Returns:
+            Optional[np.ndarray]: An (N, 2) array of edge normals, or None if
+                the shape does not cache them.
+        """
+        return None
+
     def get_inertia(self, mass: float) -> float:
         """
         Calculate the moment of inertia for the shape.
@@ -1,11 +1,7 @@
-import sys
 from typing import Dict, List, Optional, Tuple
 
-sys.path.append("/media/cipherjon/HDD/Repo/physics-engine/src")
-
-from math.vec2 import Vec2
-
-from common.color import Color
+from ..common.color import Color
+from ..math.vec2 import Vec2
 
 
 class DebugDraw:
@@ -1,3 +1,6 @@
+import functools
+import math
+
 import pygame
 
 from ..core.body import Body
@@ -7,6 +10,59 @@ from ..math.transform import Transform
 from ..math.vec2 import Vec2
 
 
+@functools.lru_cache(maxsize=256)
+def _circle_surface(radius, color):
+    """
+    Get a transparent surface with a circle outline drawn on it.
+
+    Surfaces are cached per radius and color, so each circle size is rasterized
+    once and blitted every frame after that.
+
+    Args:
+        radius (int): The radius of the circle in pixels.
+        color (tuple): The color of the circle (R, G, B).
+
+    Returns:
+        pygame.Surface: The surface holding the circle outline.
+    """
+    size = 2 * radius + 1
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (radius, radius), radius, 2)
+    return surface
+
+
+@functools.lru_cache(maxsize=256)
+def _polygon_surface(vertices, scale, color):
+    """
+    Get a transparent surface with an unrotated polygon outline drawn on it.
+
+    Surfaces are cached per vertex list, scale and color, so a polygon that
+    does not rotate, such as the ground, is rasterized once and blitted every
+    frame after that.
+
+    Args:
+        vertices (tuple): The (x, y) vertices of the polygon in local space.
+        scale (float): The scale factor from physics units to screen pixels.
+        color (tuple): The color of the polygon (R, G, B).
+
+    Returns:
+        tuple: The surface, and the screen offset of its top-left corner from
+            the polygon's origin.
+    """
+    # Screen y points down, so the y-coordinates are flipped
+    points = [(x * scale, -y * scale) for x, y in vertices]
+    min_x = math.floor(min(x for x, _ in points)) - 1
+    min_y = math.floor(min(y for _, y in points)) - 1
+    width = math.ceil(max(x for x, _ in points)) - min_x + 2
+    height = math.ceil(max(y for _, y in points)) - min_y + 2
+
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.polygon(
+        surface, color, [(int(x - min_x), int(y - min_y)) for x, y in points], 2
+    )
+    return surface, (min_x, min_y)
+
+
 class PygameDraw:
     """
     A class to handle Pygame-based visualization for the physics engine.
@@ -69,10 +125,9 @@ class PygameDraw:
             color (tuple): The color of the circle (R, G, B).
         """
         center = self._to_screen_coordinates(transform.transform_point(circle.center))
-        radius = circle.radius * self.scale
-        pygame.draw.circle(
-            self.screen, color, (int(center.x), int(center.y)), int(radius), 2
-        )
+        radius = int(circle.radius * self.scale)
+        surface = _circle_surface(radius, tuple(color))
+        self.screen.blit(surface, (int(center.x) - radius, int(center.y) - radius))
 
     def draw_polygon(
         self, polygon: Polygon, transform: Transform, color=(255, 255, 255)
@@ -85,14 +140,27 @@ class PygameDraw:
             transform (Transform): The transformation of the polygon.
             color (tuple): The color of the polygon (R, G, B).
         """
-        vertices = [
-            self._to_screen_coordinates(transform.transform_point(v))
-            for v in polygon.vertices
-        ]
-        if len(vertices) > 0:
+        vertices = polygon.get_vertices()
+        if not vertices:
+            return
+
+        if transform.rotation != 0.0:
+            # A rotating polygon would miss the surface cache nearly every
+            # frame, so it is drawn directly
+            points = [
+                self._to_screen_coordinates(transform.transform_point(v))
+                for v in vertices
+            ]
             pygame.draw.polygon(
-                self.screen, color, [(int(v.x), int(v.y)) for v in vertices], 2
+                self.screen, color, [(int(p.x), int(p.y)) for p in points], 2
             )
+            return
+
+        surface, (offset_x, offset_y) = _polygon_surface(
+            tuple((v.x, v.y) for v in vertices), self.scale, tuple(color)
+        )
+        origin = self._to_screen_coordinates(transform.position)
+        self.screen.blit(surface, (int(origin.x) + offset_x, int(origin.y) + offset_y))
 
     def draw_joint(self, joint, color=(255, 0, 0)):
         """
@@ -4,6 +4,10 @@ Island class for the physics engine.
 This module provides functionality for managing islands of bodies in the physics engine.
 """
 
+from ..collision.contact import ContactArrays
+from ..constraints.revolute import RevoluteJoint
+from ..constraints.revolute_batch import RevoluteArrays
+
 
 class Island:
     """
@@ -67,22 +71,57 @@ class Island:
             velocity_iterations (int): The number of velocity iterations.
             position_iterations (int): The number of position iterations.
         """
-        for joint in self.joints:
-            if hasattr(joint, "pre_solve"):
-                joint.pre_solve(time_step)
-
-        for _ in range(velocity_iterations):
-            for contact in self.contacts:
-                contact.resolve(time_step)
-
+        # Revolute joints are prepared and solved together in one batch
+        revolute = bool(self.joints) and all(
+            type(joint) is RevoluteJoint for joint in self.joints
+        )
+        if revolute:
+            joints = RevoluteArrays(self.joints)
+            joints.prepare(time_step)
+        else:
             for joint in self.joints:
-                if hasattr(joint, "solve_velocity_constraints"):
-                    joint.solve_velocity_constraints(time_step)
-
+                if hasattr(joint, "pre_solve"):
+                    joint.pre_solve(time_step)
+
+        contacts = ContactArrays.from_contacts(self.contacts)
+        contacts.prepare(time_step)
+        if not self.joints:
+            contacts.resolve(velocity_iterations)
+        elif revolute:
+            # Joints are solved in the same order as below
+            if not self.contacts:
+                joints.solve(velocity_iterations)
+            else:
+                for _ in range(velocity_iterations):
+                    contacts.resolve()
+                    contacts.store_velocities()
+                    joints.load_velocities()
+                    joints.solve()
+                    joints.store_velocities()
+                    contacts.load_velocities()
+            joints.store()
+        else:
+            for _ in range(velocity_iterations):
+                contacts.resolve()
+
+                # Joints work on the bodies, so sync velocities around them
+                contacts.store_velocities()
+                for joint in self.joints:
+                    if hasattr(joint, "solve_velocity_constraints"):
+                        joint.solve_velocity_constraints(time_step)
+                contacts.load_velocities()
+        contacts.store()
+
+        # Stop once a whole iteration leaves every joint alone. Joints that
+        # report nothing are assumed to still be correcting
         for _ in range(position_iterations):
+            corrected = False
             for joint in self.joints:
                 if hasattr(joint, "solve_position_constraints"):
-                    joint.solve_position_constraints()
+                    if joint.solve_position_constraints() is not False:
+                        corrected = True
+            if not corrected:
+                break
 
         for joint in self.joints:
             if hasattr(joint, "post_solve"):
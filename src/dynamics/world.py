@@ -3,39 +3,66 @@ A class to represent the simulation world in a physics engine.
 """
 
 import logging
-from collections import deque
 from typing import List, Optional
 
-from ..collision.broadphase import Broadphase
+import numpy as np
+
+from ..collision.broadphase import Broadphase, SweepAndPrune
 from ..collision.contact import Contact
 from ..collision.narrowphase import Narrowphase
+from ..collision.spatial_hash import SpatialHashBroadphase
+from ..common.constants import (
+    CONTACT_CACHE_MAX_AGE,
+    GRID_MAX_SIZE_RATIO,
+    GRID_MIN_BODIES,
+    GRID_MIN_DENSITY,
+    MAX_FRAME_TIME,
+    TREE_MIN_STATIC_RATIO,
+)
 from ..constraints.joint import Joint
 from ..contacts.contact_solver import ContactSolver
 from ..core.body import Body
 from ..dynamics.island import Island
 from ..math.vec2 import Vec2
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Broad-phase detectors that can be selected by name
+BROADPHASES = {
+    "tree": Broadphase,
+    "sap": SweepAndPrune,
+    "grid": SpatialHashBroadphase,
+}
+
 
 class World:
     """
     A class to represent the simulation world in a physics engine.
     """
 
-    def __init__(self, gravity: Vec2 = Vec2(0.0, -9.81)) -> None:
+    def __init__(
+        self, gravity: Vec2 = Vec2(0.0, -9.81), broadphase: str = "auto"
+    ) -> None:
         """
         Initialize the simulation world.
 
         Args:
             gravity (Vec2): The gravitational acceleration vector. Defaults to Vec2(0.0, -9.81).
+            broadphase (str): The broad-phase detector: "tree", "sap", "grid", or
+                "auto" to choose between sweep and prune, the tree and the grid
+                on the first step. Defaults to "auto".
+
+        Raises:
+            ValueError: If the broad-phase name is unknown.
         """
+        if broadphase != "auto" and broadphase not in BROADPHASES:
+            raise ValueError(f"Unknown broadphase: {broadphase}")
         self.gravity = gravity
         self.bodies: List[Body] = []
         self.joints: List[Joint] = []
-        self.broadphase = Broadphase()
+        self._active_joints: List[Joint] = []  # Joints that take part in solving
+        self.broadphase = BROADPHASES.get(broadphase, SweepAndPrune)()
+        self.auto_broadphase = broadphase == "auto"
         self.narrowphase = Narrowphase()
         self.contact_solver = ContactSolver(
             velocity_iterations=40, position_iterations=15
@@ -44,7 +71,9 @@ class World:
         self.velocity_iterations: int = 40
         self.position_iterations: int = 15
         self.step_count: int = 0
-        self.active_contacts = {}  # Track persistent contacts across frames
+        self.accumulator: float = 0.0  # Real time not yet consumed by fixed steps
+        self.active_contacts = {}  # Persistent contacts keyed by body ids and feature
+        self.contact_steps = {}  # Step each persistent contact was last touched
         self.contact_persistence_threshold = (
             0.05  # Distance threshold for contact persistence
         )
@@ -65,7 +94,7 @@ class World:
             raise ValueError("Body cannot be None.")
         self.bodies.append(body)
         self.broadphase.add_aabb(body.get_aabb())
-        logger.info(f"Added body to the world: {body}")
+        logger.info("Added body to the world: %s", body)
 
     def remove_body(self, body: Body) -> None:
         """
@@ -83,9 +112,11 @@ class World:
         if body in self.bodies:
             self.bodies.remove(body)
             self.broadphase.remove_aabb(body.get_aabb())
-            logger.info(f"Removed body from the world: {body}")
+            logger.info("Removed body from the world: %s", body)
         else:
-            logger.warning(f"Attempted to remove a body not found in the world: {body}")
+            logger.warning(
+                "Attempted to remove a body not found in the world: %s", body
+            )
 
     def add_joint(self, joint: Joint) -> None:
         """
@@ -101,7 +132,9 @@ class World:
             logger.error("Attempted to add a None joint to the world.")
             raise ValueError("Joint cannot be None.")
         self.joints.append(joint)
-        logger.info(f"Added joint to the world: {joint}")
+        if not getattr(joint, "is_inert", False):
+            self._active_joints.append(joint)
+        logger.info("Added joint to the world: %s", joint)
 
         # Cache joint references on bodies for faster island building
         if not hasattr(joint.body1, "joints"):
@@ -126,10 +159,12 @@ class World:
             raise ValueError("Joint cannot be None.")
         if joint in self.joints:
             self.joints.remove(joint)
-            logger.info(f"Removed joint from the world: {joint}")
+            if joint in self._active_joints:
+                self._active_joints.remove(joint)
+            logger.info("Removed joint from the world: %s", joint)
         else:
             logger.warning(
-                f"Attempted to remove a joint not found in the world: {joint}"
+                "Attempted to remove a joint not found in the world: %s", joint
             )
 
     def step(
@@ -154,73 +189,73 @@ class World:
             self.position_iterations = position_iterations
 
         self.step_count += 1
-        logger.info(
-            f"\n=== Step {self.step_count} (t={self.time_step * self.step_count:.2f}s) ==="
-        )
-        logger.info(f"Stepping simulation with time_step={self.time_step}")
-
-        # Diagnostic prints - initial state
-        dynamic_bodies = [body for body in self.bodies if not body.is_static]
-        if dynamic_bodies:
-            body = dynamic_bodies[0]
+        # Diagnostics are skipped entirely unless INFO logging is enabled
+        diagnostics = logger.isEnabledFor(logging.INFO)
+        dynamic_bodies = None
+        if diagnostics:
             logger.info(
-                f"Step start | pos.y = {body.position.y:.3f} | vel.y = {body.velocity.y:.3f}"
+                "\n=== Step %d (t=%.2fs) ===",
+                self.step_count,
+                self.time_step * self.step_count,
             )
+            logger.info("Stepping simulation with time_step=%s", self.time_step)
+
+            # Diagnostic prints - initial state
+            dynamic_bodies = [body for body in self.bodies if not body.is_static]
+            if dynamic_bodies:
+                body = dynamic_bodies[0]
+                logger.info(
+                    "Step start | pos.y = %.3f | vel.y = %.3f",
+                    body.position.y,
+                    body.velocity.y,
+                )
 
         # Update the broad-phase collision detector
+        if self.auto_broadphase:
+            self._select_broadphase()
         self.broadphase.update()
 
         # Get potential colliding pairs
         potential_pairs = self.broadphase.get_potential_pairs()
 
         # Narrow-phase collision detection
-        collision_pairs = []
-        for pair in potential_pairs:
-            body1_id, body2_id = pair
-            body1 = next(body for body in self.bodies if id(body) == body1_id)
-            body2 = next(body for body in self.bodies if id(body) == body2_id)
-            if self.narrowphase.detect_collision(body1, body2):
-                collision_pairs.append((body1, body2))
-
-        # Diagnostic: Contact detection results
-        logger.info(f"Broadphase found {len(potential_pairs)} potential pairs")
-        logger.info(
-            f"Narrowphase confirmed {len(collision_pairs)} actual collision pairs"
+        bodies_by_id = {id(body): body for body in self.bodies}
+        collisions = self.narrowphase.get_collision_manifolds(
+            [(bodies_by_id[id1], bodies_by_id[id2]) for id1, id2 in potential_pairs]
         )
 
-        # Additional contact diagnostics
-        if collision_pairs:
-            for i, (body1, body2) in enumerate(collision_pairs):
-                logger.info(
-                    f"  Collision pair {i}: Body at {body1.position} vs Body at {body2.position}"
-                )
-        else:
+        if diagnostics:
+            # Diagnostic: Contact detection results
+            logger.info("Broadphase found %d potential pairs", len(potential_pairs))
             logger.info(
-                "  WARNING: No contacts detected despite potential for collisions!"
+                "Narrowphase confirmed %d actual collision pairs", len(collisions)
             )
 
-        # Apply forces (e.g., gravity)
-        for body in self.bodies:
-            if not body.is_static and not body.is_sleeping:
-                body.apply_force(self.gravity * body.mass)
-                logger.debug(
-                    f"Applied gravity to body at {body.position}: force={self.gravity * body.mass}"
+            # Additional contact diagnostics
+            if collisions:
+                for i, (body1, body2, _) in enumerate(collisions):
+                    logger.info(
+                        "  Collision pair %d: Body at %s vs Body at %s",
+                        i,
+                        body1.position,
+                        body2.position,
+                    )
+            else:
+                logger.info(
+                    "  WARNING: No contacts detected despite potential for collisions!"
                 )
-                # Conditional damping for high velocities
-                if body.velocity.magnitude() > 30.0:
-                    body.velocity *= 0.995
-                    body.angular_velocity *= 0.995
 
-        # Integrate velocities
-        for body in self.bodies:
-            if not body.is_static and not body.is_sleeping:
-                body.integrate_velocity(self.time_step)
+        # Apply gravity and integrate velocities of all awake dynamic bodies
+        awake_bodies = [
+            body for body in self.bodies if not body.is_static and not body.is_sleeping
+        ]
+        self._integrate_velocities(awake_bodies)
 
         # Track total impulse for diagnostics
         total_impulse_magnitude = 0.0
 
         # Build islands for island-based solving
-        self._build_islands(collision_pairs)
+        self._build_islands(collisions)
 
         # Solve all islands (this handles both contacts and joints)
         for island in self.islands:
@@ -229,22 +264,178 @@ class World:
             )
 
         # Integrate positions
-        for body in self.bodies:
-            if not body.is_static and not body.is_sleeping:
-                body.integrate_position(self.time_step)
+        self._integrate_positions(awake_bodies)
 
-        # Diagnostic: Solver input
-        logger.info(f"Contacts being processed by solver: {len(collision_pairs)}")
+        if diagnostics:
+            # Diagnostic: Solver input
+            logger.info("Contacts being processed by solver: %d", len(collisions))
 
-        # Diagnostic prints - final state
-        if dynamic_bodies:
-            body = dynamic_bodies[0]
-            logger.info(
-                f"Step end | pos.y = {body.position.y:.3f} | vel.y = {body.velocity.y:.3f}"
-            )
-            logger.info(
-                f"Total impulse applied this step: {total_impulse_magnitude:.4f}\n"
+            # Diagnostic prints - final state
+            if dynamic_bodies:
+                body = dynamic_bodies[0]
+                logger.info(
+                    "Step end | pos.y = %.3f | vel.y = %.3f",
+                    body.position.y,
+                    body.velocity.y,
+                )
+                logger.info(
+                    "Total impulse applied this step: %.4f\n", total_impulse_magnitude
+                )
+
+    def _select_broadphase(self) -> None:
+        """
+        Switch to the tree or the spatial hash grid if the scene suits it.
+
+        The tree is chosen when the scene is mostly static, and the grid when
+        there are many dynamic bodies of similar size that cover a good
+        fraction of their bounding area; otherwise sweep and prune is kept.
+        The choice is made once, on the first step.
+        """
+        self.auto_broadphase = False
+        aabbs = [body.get_aabb() for body in self.bodies if not body.is_static]
+        if aabbs and len(self.bodies) - len(aabbs) >= TREE_MIN_STATIC_RATIO * len(
+            aabbs
+        ):
+            self._switch_broadphase(Broadphase())
+            logger.info("Selected the dynamic tree broadphase")
+            return
+        if len(aabbs) < GRID_MIN_BODIES:
+            return
+
+        extents = [
+            max(
+                aabb.upper_bound.x - aabb.lower_bound.x,
+                aabb.upper_bound.y - aabb.lower_bound.y,
             )
+            for aabb in aabbs
+        ]
+        if min(extents) <= 0.0 or max(extents) / min(extents) > GRID_MAX_SIZE_RATIO:
+            return
+
+        width = max(aabb.upper_bound.x for aabb in aabbs) - min(
+            aabb.lower_bound.x for aabb in aabbs
+        )
+        height = max(aabb.upper_bound.y for aabb in aabbs) - min(
+            aabb.lower_bound.y for aabb in aabbs
+        )
+        covered = sum(
+            (aabb.upper_bound.x - aabb.lower_bound.x)
+            * (aabb.upper_bound.y - aabb.lower_bound.y)
+            for aabb in aabbs
+        )
+        if covered < GRID_MIN_DENSITY * width * height:
+            return
+
+        self._switch_broadphase(SpatialHashBroadphase())
+        logger.info("Selected the spatial hash grid broadphase")
+
+    def _switch_broadphase(self, broadphase) -> None:
+        """
+        Replace the broad-phase detector and add every body to it.
+
+        Args:
+            broadphase: The new broad-phase detector.
+        """
+        self.broadphase = broadphase
+        for body in self.bodies:
+            broadphase.add_aabb(body.get_aabb())
+
+    def _integrate_velocities(self, bodies: List[Body]) -> None:
+        """
+        Apply gravity and integrate the velocities of a batch of bodies.
+
+        The body state is gathered into NumPy arrays so gravity, damping and
+        the velocity update run as a few vector operations over all bodies.
+
+        Args:
+            bodies (List[Body]): The awake dynamic bodies to integrate.
+        """
+        if not bodies:
+            return
+
+        state = np.array(
+            [
+                (
+                    body.velocity.x,
+                    body.velocity.y,
+                    body.angular_velocity,
+                    body.force.x,
+                    body.force.y,
+                    body.torque,
+                    body.inverse_mass,
+                    body.inverse_inertia,
+                    body.orientation,
+                )
+                for body in bodies
+            ]
+        )
+        velocity = state[:, 0:2]
+        angular_velocity = state[:, 2]
+        dt = self.time_step
+
+        # Conditional damping for high velocities
+        fast = np.hypot(velocity[:, 0], velocity[:, 1]) > 30.0
+        velocity[fast] *= 0.995
+        angular_velocity[fast] *= 0.995
+
+        # Gravity acts at the center of mass, so it adds no torque
+        velocity += state[:, 3:5] * state[:, 6:7] * dt
+        velocity += (self.gravity.x * dt, self.gravity.y * dt)
+        angular_velocity += state[:, 5] * state[:, 7] * dt
+        orientation = state[:, 8] + angular_velocity * dt
+
+        for body, (vx, vy), w, angle in zip(
+            bodies, velocity.tolist(), angular_velocity.tolist(), orientation.tolist()
+        ):
+            body.velocity = Vec2(vx, vy)
+            body.angular_velocity = w
+            body.orientation = angle
+            body.transform.rotation = angle
+            body.force = Vec2.zero()
+            body.torque = 0.0
+
+    def _integrate_positions(self, bodies: List[Body]) -> None:
+        """
+        Integrate the positions of a batch of bodies.
+
+        Args:
+            bodies (List[Body]): The awake dynamic bodies to integrate.
+        """
+        if not bodies:
+            return
+
+        state = np.array(
+            [
+                (body.position.x, body.position.y, body.velocity.x, body.velocity.y)
+                for body in bodies
+            ]
+        )
+        position = state[:, 0:2] + state[:, 2:4] * self.time_step
+
+        for body, (x, y) in zip(bodies, position.tolist()):
+            body.position = Vec2(x, y)
+            body.transform.position = body.position
+
+    def advance(self, frame_time: float) -> float:
+        """
+        Advance the simulation by a frame of real time using fixed time steps.
+
+        The frame time is added to an accumulator that is consumed in steps of
+        ``time_step``, so the simulation keeps real-time speed whatever the
+        frame rate. The frame time is capped at MAX_FRAME_TIME so a slow frame
+        cannot build up an ever-growing backlog of steps.
+
+        Args:
+            frame_time (float): The real time elapsed since the last frame, in seconds.
+
+        Returns:
+            float: The fraction of a step left in the accumulator, for interpolating rendering.
+        """
+        self.accumulator += min(frame_time, MAX_FRAME_TIME)
+        while self.accumulator >= self.time_step:
+            self.step()
+            self.accumulator -= self.time_step
+        return self.accumulator / self.time_step
 
     def _solve_contacts(self, collision_pairs, dt):
         """
@@ -253,68 +444,37 @@ class World:
         Args:
             collision_pairs (list): List of colliding body pairs.
         """
-        print(f"_solve_contacts called with {len(collision_pairs)} collision pairs")
+        logger.debug(
+            "_solve_contacts called with %d collision pairs", len(collision_pairs)
+        )
         # Clear the contact solver
         self.contact_solver.clear_contacts()
 
         # Limit maximum contacts to prevent performance explosion
         max_contacts = 1024
         if len(collision_pairs) > max_contacts:
-            print(
-                f"WARNING: Too many contacts ({len(collision_pairs)}), limiting to {max_contacts}"
+            logger.warning(
+                "Too many contacts (%d), limiting to %d",
+                len(collision_pairs),
+                max_contacts,
             )
             collision_pairs = collision_pairs[:max_contacts]
 
         # Add contacts to the solver with persistence
         for body1, body2 in collision_pairs:
             manifold = self.narrowphase.get_collision_manifold(body1, body2)
-            print(f"Manifold for {body1.position} vs {body2.position}: {manifold}")
+            logger.debug(
+                "Manifold for %s vs %s: %s", body1.position, body2.position, manifold
+            )
 
             if manifold is not None:
-                # Check for persistent contacts using order-independent key
-                contact_key = frozenset({id(body1), id(body2)})
-                if contact_key in self.active_contacts:
-                    # Reuse existing contact with accumulated impulses
-                    contact = self.active_contacts[contact_key]
-                    contact.normal = manifold.normal
-                    contact.penetration = manifold.depth
-                    contact.contact_point = (
-                        manifold.points[0] if manifold.points else body1.position
-                    )
-                    print(f"REUSING persistent contact: {contact}")
-                else:
-                    # Create new contact
-                    contact = Contact(
-                        body_a=body1,
-                        body_b=body2,
-                        normal=manifold.normal,
-                        penetration=manifold.depth,
-                        contact_point=manifold.points[0]
-                        if manifold.points
-                        else body1.position,
-                    )
-                    print(f"NEW contact: {contact}")
-                    # Store the new contact for persistence
-                    self.active_contacts[contact_key] = contact
-
+                contact = self._get_or_create_contact(body1, body2, manifold)
                 self.contact_solver.add_contact(contact)
             else:
-                print(f"No manifold for {body1.position} vs {body2.position}")
-                # Remove from active contacts if no longer colliding
-                contact_key = frozenset({id(body1), id(body2)})
-                if contact_key in self.active_contacts:
-                    del self.active_contacts[contact_key]
+                logger.debug("No manifold for %s vs %s", body1.position, body2.position)
 
         # Clean up old contacts that are no longer colliding
-        current_contact_keys = [
-            frozenset({id(body1), id(body2)}) for body1, body2 in collision_pairs
-        ]
-        keys_to_remove = []
-        for key in self.active_contacts:
-            if key not in current_contact_keys:
-                keys_to_remove.append(key)
-        for key in keys_to_remove:
-            del self.active_contacts[key]
+        self._prune_contacts()
 
         # Solve the contacts and return impulse magnitudes
         impulse_magnitudes = self.contact_solver.solve(dt)
@@ -324,6 +484,10 @@ class World:
         """
         Get or create a contact for the given body pair and manifold.
 
+        Contacts are keyed by the body ids and the feature id of the manifold's
+        primary point, so a contact that persists across frames keeps its
+        accumulated impulses and warm-starts the solver.
+
         Args:
             body1: The first body.
             body2: The second body.
@@ -332,86 +496,120 @@ class World:
         Returns:
             Contact: The contact.
         """
-        contact_key = frozenset({id(body1), id(body2)})
+        contact_key = (id(body1), id(body2), manifold.get_feature_id())
+        self.contact_steps[contact_key] = self.step_count
         if contact_key in self.active_contacts:
             contact = self.active_contacts[contact_key]
             contact.normal = manifold.normal
             contact.penetration = manifold.depth
-            contact.contact_point = (
-                manifold.points[0] if manifold.points else body1.position
-            )
+            contact.contact_point = manifold.get_contact_point() or body1.position
         else:
             contact = Contact(
                 body_a=body1,
                 body_b=body2,
                 normal=manifold.normal,
                 penetration=manifold.depth,
-                contact_point=manifold.points[0] if manifold.points else body1.position,
+                contact_point=manifold.get_contact_point() or body1.position,
             )
             self.active_contacts[contact_key] = contact
         return contact
 
-    def _build_islands(self, collision_pairs):
+    def _prune_contacts(self):
+        """
+        Drop persistent contacts that have not been touched for a few steps.
+        """
+        oldest = self.step_count - CONTACT_CACHE_MAX_AGE
+        stale = [key for key, step in self.contact_steps.items() if step < oldest]
+        for key in stale:
+            del self.contact_steps[key]
+            del self.active_contacts[key]
+
+    def _build_islands(self, collisions):
         """
         Build islands of connected bodies, joints, and contacts.
 
+        Islands are the connected components of the contact and joint graph,
+        found with a union-find over body ids. Static bodies are never merged,
+        so a shared ground does not join every resting body into one island.
+        Inert joints, whose solver hooks do nothing, are left out.
+
         Args:
-            collision_pairs (list): List of colliding body pairs.
+            collisions (list): The (body1, body2, Manifold) tuple of each colliding pair.
         """
-        self.islands = []
-        visited = set()
+        parent = {id(body): id(body) for body in self.bodies}
+
+        def find(key):
+            parent.setdefault(key, key)  # Joints may link bodies not in the world
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]  # Path halving
+                key = parent[key]
+            return key
+
+        def union(body1, body2):
+            if body1.is_static or body2.is_static:
+                return
+            root1 = find(id(body1))
+            root2 = find(id(body2))
+            if root1 != root2:
+                parent[root2] = root1
+
+        contacts = []
+        for body1, body2, manifold in collisions:
+            contacts.append(self._get_or_create_contact(body1, body2, manifold))
+            union(body1, body2)
+
+        self._prune_contacts()
+
+        for joint in self._active_joints:
+            union(joint.body1, joint.body2)
+
+        islands = {}
+
+        def get_island(key):
+            root = find(key)
+            if root not in islands:
+                islands[root] = Island()
+            return islands[root]
 
         for body in self.bodies:
-            if id(body) in visited:
-                continue
-            island = Island()
-            self._build_island(body, island, visited, collision_pairs)
-            self.islands.append(island)
+            get_island(id(body)).add_body(body)
+        for contact in contacts:
+            get_island(self._island_key(contact.body_a, contact.body_b)).add_contact(
+                contact
+            )
+        for joint in self._active_joints:
+            get_island(self._island_key(joint.body1, joint.body2)).add_joint(joint)
 
-    def _build_island(self, start_body, island, visited, collision_pairs):
+        self.islands = list(islands.values())
+
+    @staticmethod
+    def _island_key(body1, body2):
         """
-        Build an island of connected bodies, joints, and contacts.
+        Get the body id that decides which island a constraint belongs to.
 
         Args:
-            start_body: The starting body for the island.
-            island: The island to build.
-            visited: Set of visited body IDs.
-            collision_pairs: List of colliding body pairs.
-        """
-        queue = deque([start_body])
-        visited.add(id(start_body))
-
-        while queue:
-            body = queue.popleft()
-            island.add_body(body)
-
-            # Add connected joints (using cached references for O(1) lookup)
-            if hasattr(body, "joints"):
-                for joint in body.joints:
-                    other = joint.body1 if joint.body1 != body else joint.body2
-                    if joint not in island.joints:
-                        island.add_joint(joint)
-                        if id(other) not in visited:
-                            visited.add(id(other))
-                            queue.append(other)
-
-            # Add connected contacts
-            for pair in collision_pairs:
-                if pair[0] == body or pair[1] == body:
-                    manifold = self.narrowphase.get_collision_manifold(pair[0], pair[1])
-                    if manifold:
-                        contact = self._get_or_create_contact(
-                            pair[0], pair[1], manifold
-                        )
-                        island.add_contact(contact)
+            body1: The first body of the constraint.
+            body2: The second body of the constraint.
+
+        Returns:
+            int: The id of the first non-static body, or of body1 if both are static.
+        """
+        return id(body2) if body1.is_static and not body2.is_static else id(body1)
 
     def clear(self) -> None:
         """
         Clear all bodies and joints from the simulation world.
+
+        Persistent contacts and unconsumed frame time are dropped too, so no
+        references to the removed bodies are kept.
         """
         self.bodies.clear()
         self.joints.clear()
+        self._active_joints.clear()
         self.broadphase.clear()
+        self.active_contacts.clear()
+        self.contact_steps.clear()
+        self.accumulator = 0.0
         logger.info("Cleared all bodies and joints from the world.")
 
     def get_bodies(self) -> List[Body]:
@@ -440,7 +638,7 @@ class World:
             gravity (Vec2): The gravitational acceleration vector.
         """
         self.gravity = gravity
-        logger.info(f"Set gravity to {gravity}.")
+        logger.info("Set gravity to %s.", gravity)
 
     def get_gravity(self) -> Vec2:
         """
@@ -464,7 +662,7 @@ class World:
         if time_step <= 0:
             raise ValueError("Time step must be positive.")
         self.time_step = time_step
-        logger.info(f"Set time step to {time_step}.")
+        logger.info("Set time step to %s.", time_step)
 
     def get_time_step(self) -> float:
         """
@@ -488,7 +686,7 @@ class World:
         if velocity_iterations <= 0:
             raise ValueError("Velocity iterations must be positive.")
         self.velocity_iterations = velocity_iterations
-        logger.info(f"Set velocity iterations to {velocity_iterations}.")
+        logger.info("Set velocity iterations to %s.", velocity_iterations)
 
     def get_velocity_iterations(self) -> int:
         """
@@ -512,7 +710,7 @@ class World:
         if position_iterations <= 0:
             raise ValueError("Position iterations must be positive.")
         self.position_iterations = position_iterations
-        logger.info(f"Set position iterations to {position_iterations}.")
+        logger.info("Set position iterations to %s.", position_iterations)
 
     def get_position_iterations(self) -> int:
         """
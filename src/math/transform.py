@@ -20,6 +20,11 @@ class Transform:
         self.position = position if position is not None else Vec2.zero()
         self.rotation = float(rotation)
 
+        # Cosine and sine of the rotation they were computed for
+        self._trig_rotation = None
+        self._cos = 1.0
+        self._sin = 0.0
+
     def __str__(self):
         """
         Return a string representation of the transformation.
@@ -48,6 +53,21 @@ class Transform:
             self.rotation, other.rotation
         )
 
+    def _cos_sin(self):
+        """
+        Get the cosine and sine of the rotation, recomputing them only after
+        the rotation has changed.
+
+        Returns:
+            tuple: The cosine and sine of the rotation.
+        """
+        rotation = self.rotation
+        if rotation != self._trig_rotation:
+            self._trig_rotation = rotation
+            self._cos = math.cos(rotation)
+            self._sin = math.sin(rotation)
+        return self._cos, self._sin
+
     def get_rotation_matrix(self):
         """
         Get the rotation matrix for the transformation.
@@ -55,7 +75,8 @@ class Transform:
         Returns:
             Mat22: The rotation matrix.
         """
-        return Mat22.from_angle(self.rotation)
+        cos_theta, sin_theta = self._cos_sin()
+        return Mat22([[cos_theta, -sin_theta], [sin_theta, cos_theta]])
 
     def transform_point(self, point):
         """
@@ -67,9 +88,12 @@ class Transform:
         Returns:
             Vec2: The transformed point.
         """
-        rotation_matrix = self.get_rotation_matrix()
-        rotated_point = rotation_matrix * point
-        return rotated_point + self.position
+        cos_theta, sin_theta = self._cos_sin()
+        position = self.position
+        return Vec2(
+            cos_theta * point.x + -sin_theta * point.y + position.x,
+            sin_theta * point.x + cos_theta * point.y + position.y,
+        )
 
     def inverse_transform_point(self, point):
         """
@@ -81,10 +105,10 @@ class Transform:
         Returns:
             Vec2: The inverse transformed point.
         """
-        rotation_matrix = self.get_rotation_matrix()
-        inverse_rotation_matrix = rotation_matrix.transpose()
-        translated_point = point - self.position
-        return inverse_rotation_matrix * translated_point
+        cos_theta, sin_theta = self._cos_sin()
+        x = point.x - self.position.x
+        y = point.y - self.position.y
+        return Vec2(cos_theta * x + sin_theta * y, -sin_theta * x + cos_theta * y)
 
     def transform_vector(self, vector):
         """
@@ -96,8 +120,11 @@ class Transform:
         Returns:
             Vec2: The transformed vector.
         """
-        rotation_matrix = self.get_rotation_matrix()
-        return rotation_matrix * vector
+        cos_theta, sin_theta = self._cos_sin()
+        return Vec2(
+            cos_theta * vector.x + -sin_theta * vector.y,
+            sin_theta * vector.x + cos_theta * vector.y,
+        )
 
     def inverse_transform_vector(self, vector):
         """
@@ -109,9 +136,11 @@ class Transform:
         Returns:
             Vec2: The inverse transformed vector.
         """
-        rotation_matrix = self.get_rotation_matrix()
-        inverse_rotation_matrix = rotation_matrix.transpose()
-        return inverse_rotation_matrix * vector
+        cos_theta, sin_theta = self._cos_sin()
+        return Vec2(
+            cos_theta * vector.x + sin_theta * vector.y,
+            -sin_theta * vector.x + cos_theta * vector.y,
+        )
 
     @classmethod
     def identity(cls):
@@ -6,6 +6,8 @@ class Vec2:
     A 2D vector class for handling vector operations in a physics engine.
     """
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x=0.0, y=0.0):
         """
         Initialize a 2D vector with x and y components.
@@ -0,0 +1,178 @@
+"""
+Test cases for the broad-phase collision detection in the physics engine.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.collision.broadphase import Broadphase, SweepAndPrune
+from src.collision.spatial_hash import SpatialHashBroadphase
+from src.common.constants import TREE_MIN_STATIC_RATIO
+from src.core.body import Body
+from src.core.circle import Circle
+from src.core.polygon import Polygon
+from src.dynamics import world as world_module
+from src.dynamics.world import World
+from src.math.vec2 import Vec2
+
+
+@pytest.mark.parametrize(
+    "broadphase_class", [Broadphase, SweepAndPrune, SpatialHashBroadphase]
+)
+def test_broadphase_finds_overlapping_pair(broadphase_class):
+    """Test that overlapping bodies are reported as a potential pair."""
+    broadphase = broadphase_class()
+    body1 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0))
+    body2 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(1.5, 0))
+    body3 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(10, 0))
+    for body in (body1, body2, body3):
+        broadphase.add_aabb(body.get_aabb())
+
+    broadphase.update()
+
+    assert broadphase.get_potential_pairs() == {tuple(sorted((id(body1), id(body2))))}
+
+
+@pytest.mark.parametrize(
+    "broadphase_class", [Broadphase, SweepAndPrune, SpatialHashBroadphase]
+)
+def test_broadphase_tracks_moving_bodies(broadphase_class):
+    """Test that pairs are updated when bodies move apart or together."""
+    broadphase = broadphase_class()
+    body1 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0))
+    body2 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(10, 0))
+    broadphase.add_aabb(body1.get_aabb())
+    broadphase.add_aabb(body2.get_aabb())
+
+    broadphase.update()
+    assert len(broadphase.get_potential_pairs()) == 0
+
+    body2.position = Vec2(1.5, 0)
+    broadphase.update()
+    assert len(broadphase.get_potential_pairs()) == 1
+
+    body2.position = Vec2(-10, 0)
+    broadphase.update()
+    assert len(broadphase.get_potential_pairs()) == 0
+
+
+@pytest.mark.parametrize(
+    "broadphase_class", [Broadphase, SweepAndPrune, SpatialHashBroadphase]
+)
+def test_broadphase_remove_aabb(broadphase_class):
+    """Test that removing a body drops its pairs."""
+    broadphase = broadphase_class()
+    body1 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0))
+    body2 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(1.5, 0))
+    broadphase.add_aabb(body1.get_aabb())
+    broadphase.add_aabb(body2.get_aabb())
+    broadphase.update()
+
+    broadphase.remove_aabb(body2.get_aabb())
+    broadphase.update()
+
+    assert len(broadphase.get_potential_pairs()) == 0
+
+
+@pytest.mark.parametrize(
+    "broadphase_class", [Broadphase, SweepAndPrune, SpatialHashBroadphase]
+)
+def test_broadphase_uses_circle_center(broadphase_class):
+    """Test that circle AABBs are offset by the circle's center, as in the narrowphase."""
+    broadphase = broadphase_class()
+    body1 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0))
+    body2 = Body(shape=Circle(Vec2(10, 0), 1), position=Vec2(0, 0))
+    body3 = Body(shape=Circle(Vec2(1.5, 0), 1), position=Vec2(0, 0))
+    for body in (body1, body2, body3):
+        broadphase.add_aabb(body.get_aabb())
+
+    broadphase.update()
+
+    assert body2.get_aabb().lower_bound == Vec2(9, -1)
+    assert broadphase.get_potential_pairs() == {tuple(sorted((id(body1), id(body3))))}
+
+
+@pytest.mark.parametrize("broadphase", ["tree", "sap", "grid"])
+def test_dynamic_polygon_lands_on_static_polygon(broadphase):
+    """Test that polygon AABBs follow the body, so a falling box hits the ground."""
+    world = World(Vec2(0.0, -9.81), broadphase=broadphase)
+    ground = Body(
+        shape=Polygon([Vec2(250, -10), Vec2(350, -10), Vec2(350, 0), Vec2(250, 0)]),
+        is_static=True,
+    )
+    box = Body(
+        shape=Polygon([Vec2(-1, -1), Vec2(1, -1), Vec2(1, 1), Vec2(-1, 1)]),
+        position=Vec2(300, 5),
+    )
+    world.add_body(ground)
+    world.add_body(box)
+
+    aabb = box.get_aabb()
+    assert aabb.lower_bound == Vec2(299, 4)
+    assert aabb.upper_bound == Vec2(301, 6)
+
+    lowest = box.position.y
+    for _ in range(120):
+        world.step(1.0 / 60.0)
+        lowest = min(lowest, box.position.y)
+    assert lowest > 0.0
+
+
+def test_shape_aabb_cache():
+    """Test that shape AABBs are cached until the body moves."""
+    body = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0))
+    aabb = body.get_aabb()
+    assert body.get_aabb() is aabb
+
+    body.position = Vec2(5, 0)
+    moved = body.get_aabb()
+    assert moved is not aabb
+    assert moved.lower_bound == Vec2(4, -1)
+
+    ground = Body(
+        shape=Polygon([Vec2(-5, 0), Vec2(5, 0), Vec2(5, 1), Vec2(-5, 1)]),
+        is_static=True,
+    )
+    assert ground.get_aabb() is ground.get_aabb()
+
+
+def test_world_auto_selects_grid_for_dense_scene(monkeypatch):
+    """Test that the world picks the spatial hash for many similar bodies."""
+    monkeypatch.setattr(world_module, "GRID_MIN_BODIES", 64)
+    world = World(Vec2(0.0, -9.81))
+    for i in range(10):
+        for j in range(10):
+            world.add_body(
+                Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(i * 3, j * 3))
+            )
+    world.step(1.0 / 60.0)
+    assert isinstance(world.broadphase, SpatialHashBroadphase)
+
+    sparse = World(Vec2(0.0, -9.81))
+    sparse.add_body(Body(shape=Circle(Vec2(0, 0), 1)))
+    sparse.step(1.0 / 60.0)
+    assert isinstance(sparse.broadphase, SweepAndPrune)
+
+
+def test_world_auto_selects_tree_for_static_scene():
+    """Test that the world picks the dynamic tree when most bodies are static."""
+    world = World(Vec2(0.0, -9.81))
+    for i in range(TREE_MIN_STATIC_RATIO):
+        world.add_body(
+            Body(
+                shape=Polygon([Vec2(0, 0), Vec2(2, 0), Vec2(2, 2), Vec2(0, 2)]),
+                position=Vec2(i * 4, 0),
+                is_static=True,
+            )
+        )
+    body = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(1, 2.5))
+    world.add_body(body)
+    world.step(1.0 / 60.0)
+    assert type(world.broadphase) is Broadphase
+    pair = tuple(sorted((id(world.bodies[0]), id(body))))
+    assert pair in world.broadphase.get_potential_pairs()
@@ -4,9 +4,16 @@ from pathlib import Path
 # Add the project root to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+import pytest
+
+from src.collision.narrowphase import Narrowphase
+from src.collision.narrowphase_batch import CircleBatch, SATBatch
 from src.collision.sat import SAT
+from src.common.constants import CONTACT_CACHE_MAX_AGE, SAT_BATCH_PARALLEL_MIN
+from src.core.body import Body
 from src.core.circle import Circle
 from src.core.polygon import Polygon
+from src.dynamics.world import World
 from src.math.vec2 import Vec2
 
 
@@ -44,3 +51,195 @@ def test_separating_axis_theorem():
     rect2 = Polygon([Vec2(1, 1), Vec2(3, 1), Vec2(3, 3), Vec2(1, 3)])
     axes = SAT._find_axes(rect1.get_vertices())
     assert len(axes) == 4  # A square has 4 edges, hence 4 axes
+
+
+def test_sat_api():
+    """Test the MTV and manifold of an overlapping and a separated pair."""
+    rect1 = Polygon([Vec2(0, 0), Vec2(2, 0), Vec2(2, 2), Vec2(0, 2)])
+    rect2 = Polygon([Vec2(1.5, 0.5), Vec2(3.5, 0.5), Vec2(3.5, 2.5), Vec2(1.5, 2.5)])
+    rect3 = Polygon([Vec2(5, 5), Vec2(6, 5), Vec2(6, 6), Vec2(5, 6)])
+
+    # The MTV pushes rect1 out of rect2 along the axis of least overlap
+    mtv = SAT.find_minimum_translation_vector(rect1, rect2)
+    assert mtv.x == pytest.approx(-0.5)
+    assert mtv.y == pytest.approx(0.0)
+    manifold = SAT.get_collision_manifold(rect1, rect2)
+    assert manifold.normal == Vec2(-1, 0)
+    assert manifold.depth == pytest.approx(0.5)
+
+    assert SAT.find_minimum_translation_vector(rect1, rect3) == Vec2.zero()
+    assert SAT.get_collision_manifold(rect1, rect3) is None
+
+
+def test_manifold_feature_ids():
+    """Test that manifold points are tagged with stable feature ids."""
+    rect1 = Polygon([Vec2(0, 0), Vec2(2, 0), Vec2(2, 2), Vec2(0, 2)])
+    rect2 = Polygon([Vec2(1, 1), Vec2(3, 1), Vec2(3, 3), Vec2(1, 3)])
+    manifold = SAT.get_collision_manifold(rect1, rect2)
+    assert len(manifold.features) == len(manifold.points)
+    assert manifold.get_feature_id() == (0, 2)  # Vertex (2, 2) of rect1
+    assert SAT.get_collision_manifold(rect1, rect2).features == manifold.features
+    assert manifold.points.shape == (len(manifold.features), 2)
+    assert manifold.get_contact_point() == Vec2(2, 2)
+
+
+def test_sat_collide():
+    """Test that the fused SAT pass matches detection plus manifold."""
+    rect1 = Polygon([Vec2(0, 0), Vec2(2, 0), Vec2(2, 2), Vec2(0, 2)])
+    rect2 = Polygon([Vec2(1, 1), Vec2(3, 1), Vec2(3, 3), Vec2(1, 3)])
+    rect3 = Polygon([Vec2(5, 5), Vec2(6, 5), Vec2(6, 6), Vec2(5, 6)])
+    manifold = SAT.collide(rect1, rect2)
+    expected = SAT.get_collision_manifold(rect1, rect2)
+    assert manifold.normal == expected.normal
+    assert manifold.depth == expected.depth
+    assert manifold.features == expected.features
+    assert SAT.collide(rect1, rect3) is None
+
+
+def test_circle_batch_collide():
+    """Test batched circle-circle collision against the exact overlap."""
+    body1 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0))
+    body2 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(1.5, 0))
+    body3 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(5, 0))
+    collisions = CircleBatch().collide([(body1, body2), (body1, body3)])
+
+    assert len(collisions) == 1
+    body_a, body_b, manifold = collisions[0]
+    assert (body_a, body_b) == (body1, body2)
+    assert manifold.normal == Vec2(1, 0)
+    assert manifold.depth == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("repeat", [1, SAT_BATCH_PARALLEL_MIN])
+def test_sat_batch_collide(repeat):
+    """Test that batched SAT matches SAT.collide on each pair, serial or parallel."""
+    square = [Vec2(0, 0), Vec2(2, 0), Vec2(2, 2), Vec2(0, 2)]
+    body1 = Body(shape=Polygon(square), position=Vec2(0, 0))
+    body2 = Body(shape=Polygon(square), position=Vec2(1.5, 0.5))
+    body3 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0.5, 2.5))
+    body4 = Body(shape=Polygon(square), position=Vec2(8, 8))
+    pairs = [(body1, body2), (body1, body3), (body1, body4)] * repeat
+    collisions = SATBatch().collide(pairs)
+
+    assert [(a, b) for a, b, _ in collisions] == pairs[:2] * repeat
+    for body_a, body_b, manifold in collisions:
+        expected = SAT.collide(
+            body_a.shape,
+            body_b.shape,
+            body_a.shape.get_world_vertices(body_a),
+            body_b.shape.get_world_vertices(body_b),
+        )
+        assert manifold.normal == expected.normal
+        assert manifold.depth == expected.depth
+        assert manifold.features == expected.features
+
+
+def test_world_steps_edge_touching_polygons():
+    """Test that a pair with a zero MTV and no manifold is skipped by World.step."""
+    world = World(Vec2(0, 0))
+    for position in (Vec2(0, 0), Vec2(4, -2)):
+        triangle = Polygon([Vec2(0, 0), Vec2(4, 0), Vec2(0, 4)])
+        world.add_body(Body(shape=triangle, position=position))
+    world.step(1.0 / 60.0)
+
+
+def test_static_pairs_skipped():
+    """Test that overlapping static bodies never produce a manifold."""
+    body1 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0), is_static=True)
+    body2 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(1.5, 0), is_static=True)
+    body3 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(3, 0))
+    collisions = Narrowphase().get_collision_manifolds([(body1, body2), (body2, body3)])
+
+    assert [(body_a, body_b) for body_a, body_b, _ in collisions] == [(body2, body3)]
+
+
+def _pair_key(body1, body2):
+    """Return the order-independent key the narrow phase files a pair under."""
+    return tuple(sorted((id(body1), id(body2))))
+
+
+def test_resolve_collision_reuses_contact():
+    """Test that a pair keeps its contact while the bodies stay in contact."""
+    narrowphase = Narrowphase()
+    body1 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0))
+    body2 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(1.5, 0))
+    narrowphase.resolve_collision(body1, body2, 1.0 / 60.0)
+    contact = narrowphase.contacts[_pair_key(body1, body2)]
+
+    # Put the bodies back in contact after the positional correction
+    body1.position = Vec2(0, 0)
+    body2.position = Vec2(1.5, 0)
+    narrowphase.resolve_collision(body1, body2, 1.0 / 60.0)
+    assert narrowphase.contacts[_pair_key(body1, body2)] is contact
+
+    # The same pair in the other order shares the entry
+    body1.position = Vec2(0, 0)
+    body2.position = Vec2(1.5, 0)
+    narrowphase.resolve_collision(body2, body1, 1.0 / 60.0)
+    assert len(narrowphase.contacts) == 1
+    assert narrowphase.contacts[_pair_key(body1, body2)].body_a is body2
+
+    body2.position = Vec2(5, 0)
+    narrowphase.resolve_collision(body1, body2, 1.0 / 60.0)
+    assert not narrowphase.contacts
+
+
+def test_resolve_collision_ages_out_untested_pairs():
+    """Test that contacts of pairs that are no longer tested are dropped."""
+    narrowphase = Narrowphase()
+    body1 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0))
+    body2 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(1.5, 0))
+    body3 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(10, 0))
+    body4 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(11.5, 0))
+    narrowphase.resolve_collision(body1, body2, 1.0 / 60.0)
+    assert _pair_key(body1, body2) in narrowphase.contacts
+
+    # Only the second pair is tested from now on
+    for _ in range(CONTACT_CACHE_MAX_AGE + 2):
+        body3.position = Vec2(10, 0)
+        body4.position = Vec2(11.5, 0)
+        narrowphase.resolve_collision(body3, body4, 1.0 / 60.0)
+    assert list(narrowphase.contacts) == [_pair_key(body3, body4)]
+
+
+def test_polygon_edge_normals_cached():
+    """Test that polygon edge normals are computed once at construction."""
+    rect = Polygon([Vec2(0, 0), Vec2(2, 0), Vec2(2, 2), Vec2(0, 2)])
+    normals = rect.get_edge_normals()
+    assert normals == [Vec2(0, 1), Vec2(-1, 0), Vec2(0, -1), Vec2(1, 0)]
+    assert rect.get_edge_normals() is normals
+    # Opposite edges share a separating axis, so SAT only tests two
+    assert rect.get_edge_normal_array().tolist() == [[0, 1], [-1, 0]]
+
+
+def test_vertices_array_matches_vertices():
+    """Test that the vertex arrays used by SAT match the Vec2 vertices."""
+    for shape in (
+        Circle(Vec2(1, 2), 1.5),
+        Polygon([Vec2(0, 0), Vec2(2, 0), Vec2(2, 2), Vec2(0, 2)]),
+    ):
+        vertices = shape.get_vertices_array()
+        assert vertices.tolist() == [[v.x, v.y] for v in shape.get_vertices()]
+
+
+def test_circle_edge_normals_cached_per_vertex_array():
+    """Test that circle axes are computed once per world vertex array."""
+    circle = Circle(Vec2(0, 0), 1)
+    body = Body(shape=circle, position=Vec2(1, 1))
+    vertices = circle.get_world_vertices(body)
+    normals = circle.get_edge_normal_array(vertices)
+    assert normals.tolist() == SAT._find_axes(vertices).tolist()
+    assert circle.get_edge_normal_array(vertices) is normals
+    assert circle.get_edge_normal_array() is None
+
+
+def test_world_vertices_cached_until_body_moves():
+    """Test that world-space vertices are reused until the body moves."""
+    rect = Polygon([Vec2(0, 0), Vec2(2, 0), Vec2(2, 2), Vec2(0, 2)])
+    body = Body(shape=rect, position=Vec2(1, 1))
+    vertices = rect.get_world_vertices(body)
+    assert vertices.tolist() == [[1, 1], [3, 1], [3, 3], [1, 3]]
+    assert rect.get_world_vertices(body) is vertices
+
+    body.position = Vec2(2, 1)
+    assert rect.get_world_vertices(body)[0].tolist() == [2, 1]
@@ -0,0 +1,23 @@
+"""
+Test cases for the example scenes.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+from examples.__main__ import EXAMPLES
+
+
+@pytest.mark.parametrize("name", EXAMPLES)
+def test_example_scene_steps(name):
+    """Test that every example builds its scene and steps without rendering."""
+    module = importlib.import_module(f"examples.{name}")
+    world = module.build_scene()
+    for _ in range(5):
+        world.step(1.0 / 60.0)
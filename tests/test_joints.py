@@ -11,6 +11,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 import pytest
 
 from src.constraints.distance import DistanceJoint
+from src.constraints.joint import Joint
 from src.constraints.revolute import RevoluteJoint
 from src.core.body import Body
 from src.core.circle import Circle
@@ -169,3 +170,24 @@ def test_joint_with_static_body():
 
     # Verify that the joint is initialized and added to the world
     assert joint in world.get_joints()
+
+
+def test_inert_joints_skip_solver():
+    """Test that joints with no-op solver hooks are never solved."""
+    world = World(Vec2(0.0, 10.0))
+    body1 = Body(shape=Circle(Vec2(0, 0), 1))
+    body2 = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(5, 0))
+    world.add_body(body1)
+    world.add_body(body2)
+
+    class InertJoint(Joint):
+        is_inert = True
+
+    joint = InertJoint(body1, body2, Vec2(0, 0), Vec2(5, 0))
+    world.add_joint(joint)
+    world.step(1.0 / 60.0)
+
+    assert world.get_joints() == [joint]
+    assert all(not island.joints for island in world.islands)
+    world.remove_joint(joint)
+    assert world.get_joints() == []
@@ -5,6 +5,8 @@ from pathlib import Path
 # Add the project root to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from src.math.mat22 import Mat22
+from src.math.transform import Transform
 from src.math.vec2 import Vec2
 
 
@@ -179,3 +181,18 @@ def test_vec2_unit_y():
     v = Vec2.unit_y()
     assert v.x == 0.0
     assert v.y == 1.0
+
+
+def test_transform_matches_rotation_matrix():
+    """Test that Transform follows rotation changes like Mat22.from_angle."""
+    transform = Transform(Vec2(1.0, -2.0), 0.3)
+    point = Vec2(0.5, 0.25)
+    for rotation in (0.3, 1.2, 0.3):
+        transform.rotation = rotation
+        matrix = Mat22.from_angle(rotation)
+        assert transform.transform_point(point) == matrix * point + transform.position
+        assert transform.transform_vector(point) == matrix * point
+        assert transform.inverse_transform_vector(point) == matrix.transpose() * point
+        assert transform.inverse_transform_point(
+            transform.transform_point(point)
+        ) == Vec2(0.5, 0.25)
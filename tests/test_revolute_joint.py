@@ -4,7 +4,11 @@ import sys
 # Add the parent directory to the path so we can import from src
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+import pytest
+
+from src.constraints import revolute_batch
 from src.constraints.revolute import RevoluteJoint
+from src.constraints.revolute_batch import RevoluteArrays
 from src.core.body import Body
 from src.core.circle import Circle
 from src.math.transform import Transform
@@ -39,5 +43,99 @@ def test_revolute_joint():
         print(f"Body1 position: {body1.position}, Body2 position: {body2.position}")
 
 
+@pytest.mark.parametrize("prepare_min", [0, 100])
+def test_revolute_batch_matches_joints(monkeypatch, prepare_min):
+    """Test that the batched joints match preparing and solving each in turn."""
+    monkeypatch.setattr(revolute_batch, "REVOLUTE_BATCH_PREPARE_MIN", prepare_min)
+
+    def build():
+        bodies = [
+            Body(Circle(Vec2(0.0, 0.0), 0.5), 1.0, Vec2(x, 0.0), Vec2(0.0, -x), x)
+            for x in (0.0, 1.0, 2.0)
+        ]
+        for body in bodies:
+            body.transform.rotation = 0.3 * body.position.x
+        joints = [
+            RevoluteJoint(bodies[0], bodies[1], Vec2(0.5, 0.1)),
+            RevoluteJoint(bodies[1], bodies[2], Vec2(1.5, -0.1)),
+        ]
+        bodies[2].transform.rotation += 0.2  # Open up a position error
+        return bodies, joints
+
+    bodies, joints = build()
+    for joint in joints:
+        joint.pre_solve(1.0 / 60.0)
+    for _ in range(5):
+        for joint in joints:
+            joint.solve_velocity_constraints(1.0 / 60.0)
+
+    batch_bodies, batch_joints = build()
+    arrays = RevoluteArrays(batch_joints)
+    arrays.prepare(1.0 / 60.0)
+    arrays.solve(5)
+    arrays.store()
+
+    for body, batch_body in zip(bodies, batch_bodies):
+        assert batch_body.velocity.to_tuple() == body.velocity.to_tuple()
+        assert batch_body.angular_velocity == body.angular_velocity
+    for joint, batch_joint in zip(joints, batch_joints):
+        assert batch_joint.anchor2.to_tuple() == joint.anchor2.to_tuple()
+        assert batch_joint.bias.to_tuple() == joint.bias.to_tuple()
+        assert batch_joint.impulse.to_tuple() == joint.impulse.to_tuple()
+
+
+def test_revolute_pre_solve_cached_until_body_moves():
+    """Test that pre_solve is skipped while neither body has moved."""
+    body1 = Body(Circle(Vec2(0.0, 0.0), 0.5), 1.0, Vec2(0.0, 0.0))
+    body2 = Body(Circle(Vec2(0.0, 0.0), 0.5), 1.0, Vec2(1.0, 0.0))
+    joint = RevoluteJoint(body1, body2, Vec2(0.5, 0.0))
+    joint.pre_solve(1.0 / 60.0)
+    bias = joint.bias
+
+    joint.pre_solve(1.0 / 60.0)
+    assert joint.bias is bias
+
+    body2.position = Vec2(1.5, 0.0)
+    body2.transform.position = body2.position
+    joint.pre_solve(1.0 / 60.0)
+    assert joint.bias is not bias
+    assert joint.bias.x != 0.0
+
+
+@pytest.mark.parametrize("prepare_min", [0, 100])
+def test_revolute_joint_between_static_bodies(monkeypatch, prepare_min):
+    """Test that a joint without mass solves to a zero impulse."""
+    monkeypatch.setattr(revolute_batch, "REVOLUTE_BATCH_PREPARE_MIN", prepare_min)
+    body1 = Body(Circle(Vec2(0.0, 0.0), 0.5), 1.0, Vec2(0.0, 0.0), is_static=True)
+    body2 = Body(Circle(Vec2(0.0, 0.0), 0.5), 1.0, Vec2(1.0, 0.0), is_static=True)
+    joint = RevoluteJoint(body1, body2, Vec2(0.5, 0.0))
+
+    joints = RevoluteArrays([joint])
+    joints.prepare(1.0 / 60.0)
+    joints.solve()
+    joints.store()
+    assert joint.impulse == Vec2(0.0, 0.0)
+
+    joint.pre_solve(1.0 / 60.0)
+    joint.solve_velocity_constraints(1.0 / 60.0)
+    assert joint.impulse == Vec2(0.0, 0.0)
+
+
+def test_revolute_position_correction_reports_slop():
+    """Test that the position solve reports whether it moved the bodies."""
+    body1 = Body(Circle(Vec2(0.0, 0.0), 0.5), 1.0, Vec2(0.0, 0.0))
+    body2 = Body(Circle(Vec2(0.0, 0.0), 0.5), 1.0, Vec2(1.0, 0.0))
+    joint = RevoluteJoint(body1, body2, Vec2(0.5, 0.0))
+    joint.pre_solve(1.0 / 60.0)
+    assert joint.solve_position_constraints() is False
+    assert body2.position == Vec2(1.0, 0.0)
+
+    body2.position = Vec2(1.5, 0.0)
+    body2.transform.position = body2.position
+    joint.pre_solve(1.0 / 60.0)
+    assert joint.solve_position_constraints() is True
+    assert body2.position.x < 1.5
+
+
 if __name__ == "__main__":
     test_revolute_joint()
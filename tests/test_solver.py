@@ -10,6 +10,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 import pytest
 
+from src.collision.contact import Contact, ContactArrays
+from src.contacts.contact_solver import ContactSolver
 from src.core.body import Body
 from src.core.circle import Circle
 from src.core.polygon import Polygon
@@ -108,3 +110,85 @@ def test_world_performance():
 
     # Verify that the world steps in a reasonable time
     assert (end_time - start_time) < 1.0  # Should take less than 1 second
+
+
+def test_world_advance():
+    """Test that advance consumes real time in fixed steps."""
+    world = World(Vec2(0.0, -9.81))
+    world.add_body(Body(shape=Circle(Vec2(0, 0), 1)))
+
+    alpha = world.advance(2.5 / 60.0)
+    assert world.step_count == 2
+    assert alpha == pytest.approx(0.5)
+
+    # A long stall is capped instead of queueing hundreds of steps
+    world.advance(10.0)
+    assert world.step_count == 2 + int((0.25 + 0.5 / 60.0) * 60.0)
+
+
+def test_world_clear_drops_contacts():
+    """Test that clearing the world drops its persistent contacts."""
+    world = World(Vec2(0.0, -9.81))
+    world.add_body(Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0)))
+    world.add_body(Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(1.5, 0)))
+    world.advance(1.5 / 60.0)
+    assert world.active_contacts
+
+    world.clear()
+    assert not world.bodies
+    assert not world.active_contacts
+    assert not world.contact_steps
+    assert world.accumulator == 0.0
+
+
+def test_contact_arrays_match_contact_resolve():
+    """Test that batch-resolving packed contacts matches Contact.resolve."""
+
+    def make_contacts():
+        ground = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0), is_static=True)
+        bodies = [
+            Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(i * 0.5, 1.5))
+            for i in range(3)
+        ]
+        for i, body in enumerate(bodies):
+            body.velocity = Vec2(0.3 * i, -2.0 + i)
+        contacts = [
+            Contact(ground, bodies[0], Vec2(0, 1), 0.2, Vec2(0, 1)),
+            Contact(bodies[0], bodies[1], Vec2(-1, 0), 0.1, Vec2(0.25, 1.5)),
+            Contact(bodies[1], bodies[2], Vec2(1, 0), 0.05, Vec2(0.75, 1.5)),
+        ]
+        return bodies, contacts
+
+    bodies, contacts = make_contacts()
+    for _ in range(5):
+        for contact in contacts:
+            contact.resolve(1.0 / 60.0)
+
+    batch_bodies, batch_contacts = make_contacts()
+    arrays = ContactArrays.from_contacts(batch_contacts)
+    arrays.prepare(1.0 / 60.0)
+    arrays.resolve(5)
+    arrays.store()
+
+    for body, batch_body in zip(bodies, batch_bodies):
+        assert batch_body.velocity.x == pytest.approx(body.velocity.x)
+        assert batch_body.velocity.y == pytest.approx(body.velocity.y)
+    for contact, batch_contact in zip(contacts, batch_contacts):
+        assert batch_contact.normal == contact.normal
+        assert batch_contact.normal_impulse == pytest.approx(contact.normal_impulse)
+
+
+def test_contact_solver_returns_impulse_magnitudes():
+    """Test that ContactSolver.solve reports each contact's normal impulse."""
+    ground = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 0), is_static=True)
+    body = Body(shape=Circle(Vec2(0, 0), 1), position=Vec2(0, 1.8))
+    body.velocity = Vec2(0.0, -3.0)
+    solver = ContactSolver()
+    solver.add_contact(Contact(ground, body, Vec2(0, 1), 0.2, Vec2(0, 0.9)))
+
+    impulse_magnitudes = solver.solve(1.0 / 60.0)
+    assert impulse_magnitudes == [
+        abs(contact.normal_impulse) for contact in solver.contacts
+    ]
+    assert impulse_magnitudes[0] > 0.0
+    assert ContactSolver().solve(1.0 / 60.0) == []